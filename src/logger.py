@@ -1,7 +1,75 @@
 import os
 import sys
+from typing import Any, Callable, Dict
 
-from loguru import logger
+from loguru import logger as _loguru_logger
+
+from src.settings import settings
+
+
+def _skip(*args: Any, **kwargs: Any) -> None:
+    pass
+
+
+class Logger:
+    """
+    Gate in front of loguru. Calls below the configured level are dropped before loguru sees them, so a
+    disabled call costs one method call. Pass values as arguments ("at {}", location) rather than building
+    an f-string, so they are only formatted when the message is kept.
+    Anything not defined here (add, remove, opt, ...) goes straight to loguru.
+    """
+
+    _level_numbers: Dict[str, int] = {
+        "TRACE": 5,
+        "DEBUG": 10,
+        "INFO": 20,
+        "SUCCESS": 25,
+        "WARNING": 30,
+        "ERROR": 40,
+        "CRITICAL": 50,
+    }
+
+    def __init__(self, level: str) -> None:
+        self.debug: Callable[..., None] = _skip
+        self.info: Callable[..., None] = _skip
+        self.warning: Callable[..., None] = _skip
+        self.set_level(level)
+
+    def set_level(self, level: str) -> None:
+        number = self._level_numbers[level.upper()]
+        self.debug = self._debug if number <= self._level_numbers["DEBUG"] else _skip
+        self.info = self._info if number <= self._level_numbers["INFO"] else _skip
+        self.warning = self._warning if number <= self._level_numbers["WARNING"] else _skip
+
+    def is_enabled(self, level: str) -> bool:
+        return getattr(self, level.lower()) is not _skip
+
+    @staticmethod
+    def _debug(message: str, *args: Any, **kwargs: Any) -> None:
+        _loguru_logger.opt(depth=1).debug(message, *args, **kwargs)
+
+    @staticmethod
+    def _info(message: str, *args: Any, **kwargs: Any) -> None:
+        _loguru_logger.opt(depth=1).info(message, *args, **kwargs)
+
+    @staticmethod
+    def _warning(message: str, *args: Any, **kwargs: Any) -> None:
+        _loguru_logger.opt(depth=1).warning(message, *args, **kwargs)
+
+    @staticmethod
+    def error(message: str, *args: Any, **kwargs: Any) -> None:
+        _loguru_logger.opt(depth=1).error(message, *args, **kwargs)
+
+    @staticmethod
+    def critical(message: str, *args: Any, **kwargs: Any) -> None:
+        _loguru_logger.opt(depth=1).critical(message, *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(_loguru_logger, name)
+
+
+# DEBUG and INFO are skipped unless the settings ask for them (the prod settings don't)
+logger: Logger = Logger(settings.get("log_level", "WARNING"))
 
 
 def setup_logger(mode: str = "dev") -> None:
@@ -14,6 +82,7 @@ def setup_logger(mode: str = "dev") -> None:
 
     # Remove the default logger
     logger.remove()
+    logger.set_level(settings.get("log_level", "WARNING"))
 
     # Set log level based on mode for console logging
     console_log_level: str = "INFO"  # Log everything except DEBUG to the console
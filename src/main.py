@@ -13,7 +13,7 @@ def main() -> None:
     max_simulations = settings.get("max_simulations", 1)
 
     for i in range(max_simulations):
-        logger.info(f"Running simulation {i + 1}")
+        logger.info("Running simulation {}", i + 1)
 
         # Start timing the simulation
         start_time = time.time()
@@ -26,13 +26,13 @@ def main() -> None:
 
         except Exception as e:
             # Log the exception if something goes wrong
-            logger.error(f"An error occurred during simulation {i + 1}: {e}")
+            logger.error("An error occurred during simulation {}: {}", i + 1, e)
             raise 
         finally:
             # End timing the simulation and log the duration
             end_time = time.time()
             simulation_duration = end_time - start_time
-            logger.info(f"Simulation {i + 1} completed in {simulation_duration:.2f} seconds")
+            logger.info("Simulation {} completed in {:.2f} seconds", i + 1, simulation_duration)
 
 if __name__ == "__main__":
     main()
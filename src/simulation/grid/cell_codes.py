@@ -0,0 +1,96 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.logger import logger
+from src.settings import settings
+from src.simulation.grid.structure.structure_type import StructureType
+
+
+class CellCodes:
+    """
+    Maps the one-character cell symbols used in the settings to the compact uint8 codes
+    that the Grid stores. The code is the index of the character in _chars.
+    """
+
+    EMPTY: int = 0
+    TREE: int = 1
+    HOME: int = 2
+    CONSTRUCTION_HOME: int = 3
+    BARN: int = 4
+    CONSTRUCTION_BARN: int = 5
+    FARM: int = 6
+    CONSTRUCTION_FARM: int = 7
+    MINE: int = 8
+    CONSTRUCTION_MINE: int = 9
+
+    _chars: List[str] = [
+        settings.get("empty_char", " "),
+        settings.get("tree_char", "*"),
+        settings.get("home_char", "H"),
+        settings.get("home_construction_char", "h"),
+        settings.get("barn_char", "B"),
+        settings.get("barn_construction_char", "b"),
+        settings.get("farm_char", "F"),
+        settings.get("farm_construction_char", "f"),
+        settings.get("mine_char", "M"),
+        settings.get("mine_construction_char", "m"),
+    ]
+
+    _codes: Dict[str, int] = {char: code for code, char in enumerate(_chars)}
+
+    # lookup table used to turn a whole code array back into characters in one step
+    _char_table: np.ndarray = np.array(_chars, dtype=object)
+
+    BUILDING_CODES: np.ndarray = np.array(
+        [HOME, CONSTRUCTION_HOME, BARN, CONSTRUCTION_BARN, FARM, CONSTRUCTION_FARM, MINE, CONSTRUCTION_MINE],
+        dtype=np.uint8,
+    )
+
+    # the kind of structure standing on a cell, indexed by code
+    _structure_types: List[Optional[StructureType]] = [
+        None,
+        StructureType.TREE,
+        StructureType.HOME,
+        StructureType.CONSTRUCTION_HOME,
+        StructureType.BARN,
+        StructureType.CONSTRUCTION_BARN,
+        StructureType.FARM,
+        StructureType.CONSTRUCTION_FARM,
+        StructureType.MINE,
+        StructureType.CONSTRUCTION_MINE,
+    ]
+
+    # buildings that can't be seen through
+    SIGHT_BLOCKING_CODES: np.ndarray = np.array([HOME, BARN, MINE], dtype=np.uint8)
+
+    @classmethod
+    def to_code(cls, char: str) -> int:
+        if char not in cls._codes:
+            logger.error("Unknown cell character '{}'.", char)
+            raise ValueError(f"Unknown cell character '{char}'")
+        return cls._codes[char]
+
+    @classmethod
+    def to_char(cls, code: int) -> str:
+        return cls._chars[code]
+
+    @classmethod
+    def to_structure_type(cls, code: int) -> Optional[StructureType]:
+        """The kind of structure a cell with this code belongs to, None for an empty cell."""
+        return cls._structure_types[code]
+
+    @classmethod
+    def get_chars(cls) -> List[str]:
+        return list(cls._chars)
+
+    @classmethod
+    def encode(cls, grid: List[List[str]]) -> np.ndarray:
+        """Convert a list-of-lists character grid into a (height, width) uint8 code array."""
+        logger.debug("Encoding {}x{} character grid into cell codes.", len(grid), len(grid[0]) if grid else 0)
+        return np.array([[cls.to_code(char) for char in row] for row in grid], dtype=np.uint8)
+
+    @classmethod
+    def decode(cls, cells: np.ndarray) -> List[List[str]]:
+        """Convert a (height, width) uint8 code array back into a list-of-lists character grid."""
+        return cls._char_table[cells].tolist()
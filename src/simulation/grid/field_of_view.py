@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from math import ceil, floor
+from typing import TYPE_CHECKING, List, Tuple
+
+import numpy as np
+
+from src.logger import logger
+from src.simulation.grid.cell_codes import CellCodes
+from src.simulation.grid.location import Location
+
+if TYPE_CHECKING:
+    from src.simulation.grid.grid import Grid
+
+
+class FieldOfView:
+    """
+    Symmetric shadowcasting over the grid. Barns, homes and mines block sight: they are seen themselves
+    but hide whatever is behind them. Everything else is see-through. The view is a square reaching
+    radius cells out from the viewer, who does not see their own cell.
+    """
+
+    # per quadrant: (dx, dy) of one row further out, then (dx, dy) of one column over
+    _quadrants: List[Tuple[int, int, int, int]] = [
+        (0, -1, 1, 0),  # north
+        (1, 0, 0, 1),  # east
+        (0, 1, 1, 0),  # south
+        (-1, 0, 0, 1),  # west
+    ]
+
+    def __init__(self, grid: Grid) -> None:
+        self._grid = grid
+        self._width: int = grid.get_width()
+        self._height: int = grid.get_height()
+
+        # cells on the border of two quadrants are reached twice, the stamp keeps them from being reported twice
+        self._seen: List[int] = [0] * (self._width * self._height)
+        self._look: int = 0
+
+        self._opaque: List[bool] = []  # flat, refreshed only when the grid version moves
+        self._version: int = -1
+
+    def look(self, origin: Location, radius: int) -> List[Tuple[Location, int]]:
+        """Every cell visible from origin, paired with its cell code."""
+        self._refresh_opaque()
+        self._look += 1
+        cells = self._grid.get_cells()
+        visible: List[int] = []
+        for quadrant in self._quadrants:
+            self._scan_quadrant(origin, radius, quadrant, visible)
+
+        logger.debug("{} cells visible from {} with radius {}.", len(visible), origin, radius)
+        codes = cells.ravel()[visible].tolist() if visible else []
+        width = self._width
+        return [(Location(index % width, index // width), code) for index, code in zip(visible, codes)]
+
+    def _scan_quadrant(
+        self, origin: Location, radius: int, quadrant: Tuple[int, int, int, int], visible: List[int]
+    ) -> None:
+        depth_dx, depth_dy, column_dx, column_dy = quadrant
+        width = self._width
+        height = self._height
+        opaque = self._opaque
+        seen = self._seen
+        look = self._look
+
+        # rows still to scan, as (depth, start slope, end slope)
+        rows: List[Tuple[int, float, float]] = [(1, -1.0, 1.0)]
+        while rows:
+            depth, start_slope, end_slope = rows.pop()
+            if depth > radius:
+                continue
+
+            previous_opaque = None
+            min_column = floor(depth * start_slope + 0.5)
+            max_column = ceil(depth * end_slope - 0.5)
+            for column in range(min_column, max_column + 1):
+                x = origin.x + depth * depth_dx + column * column_dx
+                y = origin.y + depth * depth_dy + column * column_dy
+                in_bounds = 0 <= x < width and 0 <= y < height
+                index = y * width + x
+                # the edge of the map hides what would be behind it, like a wall that can't be seen
+                is_opaque = opaque[index] if in_bounds else True
+
+                if in_bounds and (is_opaque or depth * start_slope <= column <= depth * end_slope):
+                    if seen[index] != look:
+                        seen[index] = look
+                        visible.append(index)
+
+                if previous_opaque and not is_opaque:
+                    start_slope = (2 * column - 1) / (2 * depth)
+                if previous_opaque is False and is_opaque:
+                    rows.append((depth + 1, start_slope, (2 * column - 1) / (2 * depth)))
+                previous_opaque = is_opaque
+
+            if previous_opaque is False:
+                rows.append((depth + 1, start_slope, end_slope))
+
+    def _refresh_opaque(self) -> None:
+        version = self._grid.get_version()
+        if version == self._version:
+            return
+        logger.debug("Grid changed to version {}. Refreshing the cells that block sight.", version)
+        self._opaque = np.isin(self._grid.get_cells(), CellCodes.SIGHT_BLOCKING_CODES).ravel().tolist()
+        self._version = version
@@ -0,0 +1,38 @@
+from typing import Optional
+
+import numpy as np
+
+from src.simulation.grid.location import Location
+
+
+class FlowField:
+    """
+    The cheapest next step from every cell of the grid towards one destination, built by a single
+    Dijkstra search that starts from all of the destination's cells at once. Impassable cells next to the
+    searched area get a step too, so someone standing on a building that went up under them can step off it.
+    The grid keeps a field until a cell turns passable or impassable, so its steps may lag behind later cost changes.
+    """
+
+    def __init__(self, width: int, distances: np.ndarray, next_steps: np.ndarray, version: int) -> None:
+        self._width = width
+        self._distances = distances  # float32 cost to reach the destination, -1 when it can't be reached
+        self._next_steps = next_steps  # int32 flat index of the next cell, -1 at the destination or when unreachable
+        self._version = version
+
+    def next_step(self, location: Location) -> Optional[Location]:
+        """The cell to step onto from location, or None when already there or the destination can't be reached."""
+        next_index: int = self._next_steps.item(location.y * self._width + location.x)
+        if next_index < 0:
+            return None
+        y, x = divmod(next_index, self._width)
+        return Location(x, y)
+
+    def can_reach(self, location: Location) -> bool:
+        return self.get_distance(location) >= 0
+
+    def get_distance(self, location: Location) -> float:
+        distance: float = self._distances.item(location.y * self._width + location.x)
+        return distance
+
+    def get_version(self) -> int:
+        return self._version
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import random
-from copy import deepcopy
-from typing import TYPE_CHECKING, Dict, List, Type
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Type
+
+import numpy as np
 
 from src.logger import logger
 from src.settings import settings
+from src.simulation.grid.cell_codes import CellCodes
 from src.simulation.grid.grid_disaster_generator import GridDisasterGenerator
 from src.simulation.grid.grid_generator import GridGenerator
+from src.simulation.grid.field_of_view import FieldOfView
+from src.simulation.grid.flow_field import FlowField
+from src.simulation.grid.labeling import label_components
 from src.simulation.grid.location import Location
+from src.simulation.grid.neighborhood import any_neighbor
+from src.simulation.grid.path_finder import PathFinder
 from src.simulation.grid.structure.structure import Structure
 from src.simulation.grid.structure.structure_factory import StructureFactory
 from src.simulation.grid.structure.structure_type import StructureType
@@ -22,6 +29,7 @@ from src.simulation.grid.structure.work.mine import Mine
 from src.simulation.grid.structure.work.tree import Tree
 
 if TYPE_CHECKING:
+    from src.simulation.grid.structure.work.construction.construction import Construction
     from src.simulation.simulation import Simulation
 
 
@@ -39,21 +47,20 @@ class Grid:
         settings.get("tree_char", "*"): settings.get("tree_obstacle_rating", 10),
     }
 
-    _building_types = "".join(
-        [
-            settings.get("home_construction_char", "h"),
-            settings.get("home_char", "H"),
-            settings.get("barn_construction_char", "b"),
-            settings.get("barn_char", "B"),
-            settings.get("farm_construction_char", "f"),
-            settings.get("farm_char", "F"),
-            settings.get("mine_construction_char", "m"),
-            settings.get("mine_char", "M"),
-        ]
-    )
+    # the building each kind of construction site turns into once it is finished
+    _construction_buildings: Dict[StructureType, StructureType] = {
+        StructureType.CONSTRUCTION_BARN: StructureType.BARN,
+        StructureType.CONSTRUCTION_FARM: StructureType.FARM,
+        StructureType.CONSTRUCTION_HOME: StructureType.HOME,
+        StructureType.CONSTRUCTION_MINE: StructureType.MINE,
+    }
+
+    # row and column offsets of the eight neighbors, shaped to broadcast against a column of cells
+    _neighbor_dys: np.ndarray = np.array([[-1, -1, -1, 0, 0, 1, 1, 1]])
+    _neighbor_dxs: np.ndarray = np.array([[-1, 0, 1, -1, 1, -1, 0, 1]])
 
     def __init__(self, simulation: Simulation, size: int) -> None:
-        logger.debug(f"Initializing simulation with grid size {size}.")
+        logger.debug("Initializing simulation with grid size {}.", size)
 
         self._simulation: Simulation = simulation
         self._width: int = size
@@ -61,7 +68,35 @@ class Grid:
 
         grid_generator: GridGenerator = GridGenerator(size)
         logger.debug("Generating grid using GridGenerator.")
-        self._grid: List[List[str]] = grid_generator.generate()
+        self._cells: np.ndarray = CellCodes.encode(grid_generator.generate())  # uint8 codes indexed [y, x]
+
+        # one obstacle-rating matrix shared by every mover, patched in place whenever cells change
+        self._cost_table: np.ndarray = np.array(
+            [self._char_to_num[char] for char in CellCodes.get_chars()], dtype=np.int32
+        )
+        self._path_costs: np.ndarray = self._cost_table[self._cells]
+
+        # empty spots near town, kept up to date around every changed cell
+        self._empty_spots: np.ndarray = self._find_empty_spots_near_town(self._cells)
+        self._empty_spot_list: List[int] = np.flatnonzero(self._empty_spots).tolist()  # flat indices, for sampling
+        self._empty_spot_positions: Dict[int, int] = {index: i for i, index in enumerate(self._empty_spot_list)}
+
+        # flat index (y * width + x) of the top left corner of the structure covering each cell, -1 if none
+        self._owners: np.ndarray = np.full((size, size), -1, dtype=np.int32)
+        self._version: int = 0
+        self._passable_version: int = 0  # only goes up when a cell turns passable or impassable
+        self._path_finder: PathFinder = PathFinder(self)
+        self._field_of_view: FieldOfView = FieldOfView(self)
+        self._flow_fields: Dict[Location, FlowField] = {}  # only holds fields built for the current passable version
+        self._flow_fields_version: int = 0
+
+        # connected areas of passable cells, relabelled lazily after a cell turns passable or impassable
+        self._components: np.ndarray = np.zeros((size, size), dtype=np.int32)
+        self._component_cells: np.ndarray = np.zeros(0, dtype=np.intp)  # flat cell indices grouped by component
+        self._component_offsets: np.ndarray = np.zeros(1, dtype=np.intp)  # where each component starts in _component_cells
+        self._components_version: int = -1
+        self._town_components: Set[int] = set()
+        self._town_components_version: int = -1
 
         self._disaster_generator: GridDisasterGenerator = GridDisasterGenerator(self)
         logger.debug("Initialized disaster generator.")
@@ -69,361 +104,634 @@ class Grid:
         self._structure_factory: StructureFactory = StructureFactory(self)
         logger.debug("Initialized structure factory.")
 
+        # work sites with two or more workers, the only ones where workers have someone to talk to
+        self._shared_work_sites: Dict[Location, Work] = {}
+
+        # construction sites that reached their finished level, turned into buildings at the end of the day
+        self._completed_constructions: List[Construction] = []
+
         structure_generator: StructureGenerator = StructureGenerator(self, self._structure_factory)
         logger.debug("Generating structures using StructureGenerator.")
-        self._structures: Dict[Location, Structure] = (
-            structure_generator.find_structures()
-        )  # stores the top left corner of every structure
+        self._structures: Dict[Location, Structure] = {}  # stores the top left corner of every structure
+        self._structures_by_type: Dict[StructureType, Dict[Location, Structure]] = {
+            structure_type: {} for structure_type in StructureType
+        }
+        for location, structure in structure_generator.find_structures().items():
+            self._add_structure(location, structure)
 
         self._day: int = 0
         self._temp: float = 0
-        logger.debug(f"Simulation initialized with {len(self._structures)} structures.")
+        logger.debug("Simulation initialized with {} structures.", len(self._structures))
 
     def get_time(self) -> int:
         logger.debug("Retrieving simulation time.")
         time = self._simulation.get_time()
-        logger.debug(f"Simulation time: {time}")
+        logger.debug("Simulation time: {}", time)
         return time
 
     def get_temperature_for_day(self) -> float:
-        logger.debug(f"Retrieving temperature for day {self._day}.")
+        logger.debug("Retrieving temperature for day {}.", self._day)
         other_day = self._simulation.get_day()
         if other_day != self._day:
-            logger.debug(f"Day has changed from {self._day} to {other_day}. Updating temperature.")
+            logger.debug("Day has changed from {} to {}. Updating temperature.", self._day, other_day)
             self._day = other_day
             self._temp = get_temperature_for_day(self._day)
         else:
-            logger.debug(f"Temperature for day {self._day} already calculated: {self._temp}.")
+            logger.debug("Temperature for day {} already calculated: {}.", self._day, self._temp)
         return self._temp
 
     def generate_disasters(self, chance: float = settings.get("disaster_chance", 0.50)) -> None:
-        logger.debug(f"Generating disasters with a chance of {chance}.")
+        logger.debug("Generating disasters with a chance of {}.", chance)
         self._disaster_generator.generate(chance)
-        logger.info(f"Disasters generated with a chance of {chance}.")
+        logger.info("Disasters generated with a chance of {}.", chance)
 
     def get_grid(self) -> List[List[str]]:
+        """
+        Character view of the grid, kept for callers that want the old list-of-lists layout.
+        It is a copy: changes must go through set_char or fill_region.
+        """
         logger.debug("Retrieving the grid.")
-        return self._grid
+        return CellCodes.decode(self._cells)
+
+    def get_cells(self) -> np.ndarray:
+        """The (height, width) uint8 cell code array backing the grid. Treat it as read-only."""
+        return self._cells
+
+    def get_char(self, location: Location) -> str:
+        return CellCodes.to_char(self._cells.item(location.y, location.x))
+
+    def set_char(self, location: Location, char: str) -> None:
+        code: int = CellCodes.to_code(char)
+        self._note_passable_change(self._path_costs[location.y, location.x], code)
+        self._cells[location.y, location.x] = code
+        self._path_costs[location.y, location.x] = self._cost_table[code]
+        self._path_finder.patch_costs([location.y * self._width + location.x], self._cost_table.item(code))
+        self._version += 1
+        self._update_empty_spots(location.y, location.x, 1, 1)
+
+    def is_region_in_bounds(self, location: Location, width: int, height: int) -> bool:
+        return (
+            0 <= location.x
+            and 0 <= location.y
+            and location.x + width <= self._width
+            and location.y + height <= self._height
+        )
+
+    def region_matches(self, location: Location, width: int, height: int, chars: List[str]) -> bool:
+        """Check if every cell in the width x height region anchored at location holds one of chars."""
+        if not self.is_region_in_bounds(location, width, height):
+            return False
+        region = self._cells[location.y : location.y + height, location.x : location.x + width]
+        codes = [CellCodes.to_code(char) for char in chars]
+        return bool(np.isin(region, codes).all())
+
+    def fill_region(self, location: Location, width: int, height: int, char: str) -> None:
+        logger.debug("Filling {}x{} region at {} with '{}'.", width, height, location, char)
+        code: int = CellCodes.to_code(char)
+        self._note_passable_change(
+            self._path_costs[location.y : location.y + height, location.x : location.x + width], code
+        )
+        self._cells[location.y : location.y + height, location.x : location.x + width] = code
+        self._path_costs[location.y : location.y + height, location.x : location.x + width] = self._cost_table[code]
+        self._path_finder.patch_costs(
+            [
+                y * self._width + x
+                for y in range(location.y, location.y + height)
+                for x in range(location.x, location.x + width)
+            ],
+            self._cost_table.item(code),
+        )
+        self._version += 1
+        self._update_empty_spots(location.y, location.x, width, height)
+
+    def _fill_cells(self, ys: np.ndarray, xs: np.ndarray, code: int) -> None:
+        """Set many scattered cells to the same code in one grid change."""
+        self._note_passable_change(self._path_costs[ys, xs], code)
+        self._cells[ys, xs] = code
+        self._path_costs[ys, xs] = self._cost_table[code]
+        self._path_finder.patch_costs((ys * self._width + xs).tolist(), self._cost_table.item(code))
+        self._version += 1
+        self._update_empty_spots_around(ys, xs)
+
+    def _note_passable_change(self, old_costs: np.ndarray, code: int) -> None:
+        """Bump the passable version when writing code over cells with old_costs turns any of them (im)passable."""
+        passable = self._cost_table.item(code) > 0
+        if np.any((np.asarray(old_costs) > 0) != passable):
+            self._passable_version += 1
 
     def get_buildings(self) -> Dict[Location, Structure]:
         logger.debug("Retrieving buildings (excluding trees).")
-        buildings = {
-            location: structure for location, structure in self._structures.items() if not isinstance(structure, Tree)
-        }
-        logger.debug(f"Found {len(buildings)} buildings.")
+        buildings: Dict[Location, Structure] = {}
+        for structure_type, structures in self._structures_by_type.items():
+            if structure_type != StructureType.TREE:
+                buildings.update(structures)
+        logger.debug("Found {} buildings.", len(buildings))
         return buildings
 
     def get_structure(self, location: Location) -> Structure:
-        logger.debug(f"Retrieving structure at location {location}.")
-        structure = self._structures.get(location)
+        """The structure covering location, which may be any of its cells."""
+        logger.debug("Retrieving structure at location {}.", location)
+        structure = self._structures.get(self._get_owner(location) or location)
         if structure:
-            logger.debug(f"Structure at {location} found: {structure}.")
+            logger.debug("Structure at {} found: {}.", location, structure)
         else:
-            logger.warning(f"Structure at {location} not found.")
+            logger.warning("Structure at {} not found.", location)
         return structure
 
+    def get_structure_type(self, location: Location) -> Optional[StructureType]:
+        """The kind of structure covering location, read straight from the cell code. None for an empty cell."""
+        return CellCodes.to_structure_type(self._cells.item(location.y, location.x))
+
     def get_structure_locations(self, structure_type: Type[Structure]) -> List[Location]:
-        logger.debug(f"Retrieving locations of structures of type {structure_type}.")
+        logger.debug("Retrieving locations of structures of type {}.", structure_type)
         locations = [
-            location for location, building in self._structures.items() if isinstance(building, structure_type)
+            location
+            for registered_type in StructureFactory.get_structure_types(structure_type)
+            for location in self._structures_by_type[registered_type]
         ]
-        logger.debug(f"Found {len(locations)} locations for {structure_type}.")
+        logger.debug("Found {} locations for {}.", len(locations), structure_type)
         return locations
 
     def get_structures(self, structure_type: Type[Structure]) -> List[Structure]:
-        logger.debug(f"Retrieving structures of type {structure_type}.")
-        locations = self.get_structure_locations(structure_type)
-        structures = [self.get_structure(location) for location in locations]
-        logger.debug(f"Found {len(structures)} structures of type {structure_type}.")
+        logger.debug("Retrieving structures of type {}.", structure_type)
+        structures = [
+            structure
+            for registered_type in StructureFactory.get_structure_types(structure_type)
+            for structure in self._structures_by_type[registered_type].values()
+        ]
+        logger.debug("Found {} structures of type {}.", len(structures), structure_type)
         return structures
 
     def get_structure_count(self, structure_type: Type[Structure]) -> int:
-        logger.debug(f"Counting structures of type {structure_type}.")
-        count = sum(1 for structure in self._structures.values() if isinstance(structure, structure_type))
-        logger.debug(f"Found {count} structures of type {structure_type}.")
+        logger.debug("Counting structures of type {}.", structure_type)
+        count = sum(
+            len(self._structures_by_type[registered_type])
+            for registered_type in StructureFactory.get_structure_types(structure_type)
+        )
+        logger.debug("Found {} structures of type {}.", count, structure_type)
         return count
 
-    def find_top_left_corner(self, where: Location) -> None:
-        logger.debug(f"Finding top-left corner starting from {where}.")
+    def _add_structure(self, location: Location, structure: Structure) -> None:
+        """Register structure at location, replacing whatever was registered there."""
+        self._remove_structure(location)
+        self._structures[location] = structure
+        self._structures_by_type[StructureFactory.get_structure_type(structure)][location] = structure
+
+    def _remove_structure(self, location: Location) -> None:
+        structure = self._structures.pop(location, None)
+        if structure is not None:
+            del self._structures_by_type[StructureFactory.get_structure_type(structure)][location]
 
-        while not self.is_empty(where) and self.is_in_bounds(Location(where.x - 1, where.y)):
-            where.x -= 1
-            logger.debug(f"Moved left to {where}.")
+    def find_top_left_corner(self, where: Location) -> Location:
+        logger.debug("Finding top-left corner starting from {}.", where)
+
+        owner = self._get_owner(where)
+        if owner:
+            return owner
+
+        # cells that no structure has claimed yet (the first pass over a generated grid) are walked instead
+        while not self.is_empty(where) and self.is_in_bounds(where.offset(-1, 0)):
+            where = where.offset(-1, 0)
+            logger.debug("Moved left to {}.", where)
         if self.is_empty(where):
-            where.x += 1
-        logger.debug(f"Adjusted x-coordinate to {where.x}.")
+            where = where.offset(1, 0)
+        logger.debug("Adjusted x-coordinate to {}.", where.x)
 
-        while not self.is_empty(where) and self.is_in_bounds(Location(where.x, where.y - 1)):
-            where.y -= 1
-            logger.debug(f"Moved up to {where}.")
+        while not self.is_empty(where) and self.is_in_bounds(where.offset(0, -1)):
+            where = where.offset(0, -1)
+            logger.debug("Moved up to {}.", where)
         if self.is_empty(where):
-            where.y += 1
-        logger.debug(f"Adjusted y-coordinate to {where.y}. Top-left corner found at {where}.")
+            where = where.offset(0, 1)
+        logger.debug("Adjusted y-coordinate to {}. Top-left corner found at {}.", where.y, where)
+        return where
+
+    def claim_region(self, location: Location, width: int, height: int) -> None:
+        """
+        Record location as the top left corner of the structure covering the width x height region.
+        Whatever was registered on those cells before, say the trees a construction went up over, is dropped.
+        """
+        anchor = location.y * self._width + location.x
+        region = self._owners[location.y : location.y + height, location.x : location.x + width]
+        for owner in np.unique(region[(region >= 0) & (region != anchor)]).tolist():
+            y, x = divmod(owner, self._width)
+            logger.debug("Structure at {} was built over. Dropping it.", Location(x, y))
+            self._remove_structure(Location(x, y))
+        region[...] = anchor
+
+    def release_region(self, location: Location, width: int, height: int) -> None:
+        region = self._owners[location.y : location.y + height, location.x : location.x + width]
+        region[region == location.y * self._width + location.x] = -1
+
+    def _get_owner(self, location: Location) -> Optional[Location]:
+        if not self.is_in_bounds(location):
+            return None
+        owner = self._owners.item(location.y, location.x)
+        if owner < 0:
+            return None
+        y, x = divmod(owner, self._width)
+        return Location(x, y)
 
     def remove(self, structure: Structure, deconstruct: bool = False) -> None:
-        logger.debug(f"Removing structure at {structure.get_location()}. Deconstruct: {deconstruct}")
+        logger.debug("Removing structure at {}. Deconstruct: {}", structure.get_location(), deconstruct)
 
         location = structure.get_location()
 
         if location in self._structures:
-            logger.debug(f"Structure at {location} found. Removing.")
-            del self._structures[location]
+            logger.debug("Structure at {} found. Removing.", location)
+            self._remove_structure(location)
         else:
-            logger.warning(f"Structure at {location} not found in structures.")
+            logger.warning("Structure at {} not found in structures.", location)
 
         if isinstance(structure, Home):
-            logger.debug(f"Removing owner from home at {location}.")
+            logger.debug("Removing owner from home at {}.", location)
             structure.remove_owner()
 
-        logger.debug(f"Calling remove method on structure at {location}.")
+        logger.debug("Calling remove method on structure at {}.", location)
         structure.remove()
 
         # Ensure the structure is removed once more, just in case
         if location in self._structures:
-            logger.debug(f"Structure at {location} found again. Removing.")
-            del self._structures[location]
+            logger.debug("Structure at {} found again. Removing.", location)
+            self._remove_structure(location)
 
         if deconstruct:
-            logger.debug(f"Deconstructing structure at {location}.")
+            logger.debug("Deconstructing structure at {}.", location)
             self._deconstruct_building(structure)
 
+    def remove_trees(self, ys: np.ndarray, xs: np.ndarray) -> None:
+        """Remove the trees on the given cells in one grid change. Cells without a tree are left alone."""
+        is_tree = self._cells[ys, xs] == CellCodes.TREE
+        ys, xs = ys[is_tree], xs[is_tree]
+        if not len(ys):
+            return
+        logger.debug("Removing {} trees.", len(ys))
+
+        self._fill_cells(ys, xs, CellCodes.EMPTY)
+        self._owners[ys, xs] = -1
+        for y, x in zip(ys.tolist(), xs.tolist()):
+            self._remove_structure(Location(x, y))
+
     def _deconstruct_building(self, building: Structure) -> None:
-        logger.debug(f"Deconstructing building at {building.get_location()}.")
+        logger.debug("Deconstructing building at {}.", building.get_location())
 
         if isinstance(building, Home):
             structure_type = StructureType.HOME
-            logger.debug(f"Building is a Home. Setting structure type to {structure_type}.")
+            logger.debug("Building is a Home. Setting structure type to {}.", structure_type)
         elif isinstance(building, Mine):
             structure_type = StructureType.MINE
-            logger.debug(f"Building is a Mine. Setting structure type to {structure_type}.")
+            logger.debug("Building is a Mine. Setting structure type to {}.", structure_type)
         elif isinstance(building, Farm):
             structure_type = StructureType.FARM
-            logger.debug(f"Building is a Farm. Setting structure type to {structure_type}.")
+            logger.debug("Building is a Farm. Setting structure type to {}.", structure_type)
         elif isinstance(building, Barn):
             structure_type = StructureType.BARN
-            logger.debug(f"Building is a Barn. Setting structure type to {structure_type}.")
+            logger.debug("Building is a Barn. Setting structure type to {}.", structure_type)
         else:
-            logger.warning(f"Unknown building type {building} for deconstruction. Aborting.")
+            logger.warning("Unknown building type {} for deconstruction. Aborting.", building)
             return
 
         structure: Structure = self._structure_factory.create_instance(structure_type, building.get_location())
-        logger.debug(f"New {structure_type} structure created at {building.get_location()}.")
-        self._structures[structure.get_location()] = structure
+        logger.debug("New {} structure created at {}.", structure_type, building.get_location())
+        self._add_structure(structure.get_location(), structure)
 
     def get_empty_spots_near_town(self) -> List[Location]:
-        logger.debug("Starting search for empty spots near towns.")
-
-        rows = len(self._grid)
-        cols = len(self._grid[0])
-        empty_spots = []
-
-        logger.debug(f"Building types to check for: {self._building_types}")
-
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
-
-        for i in range(rows):
-            for j in range(cols):
-                if self._grid[i][j] not in self._building_types:
-                    continue
-
-                location: Location = Location(j, i)
-                logger.debug(f"Building or construction found at {location}. Checking surrounding spots.")
-
-                for dx, dy in directions:
-                    ni, nj = i + dx, j + dy
-                    neighbor_location = Location(nj, ni)
-
-                    if not self.is_in_bounds(neighbor_location):
-                        continue
-                    if not self.is_empty(neighbor_location):
-                        continue
-
-                    logger.debug(f"Empty spot found at {neighbor_location}. Checking adjacency to trees.")
+        logger.debug("Retrieving empty spots near towns.")
+        width = self._width
+        empty_spots = [Location(index % width, index // width) for index in self._empty_spot_list]
+        logger.debug("Found {} empty spots near towns.", len(empty_spots))
+        return empty_spots
 
-                    # Now check if this empty spot is adjacent to a tree
-                    is_adjacent_to_tree = False
-                    for ddx, ddy in directions:
-                        nn_i, nn_j = ni + ddx, nj + ddy
-                        tree_neighbor: Location = Location(nn_j, nn_i)
-                        if 0 <= nn_i < rows and 0 <= nn_j < cols and self.is_tree(tree_neighbor):
-                            is_adjacent_to_tree = True
-                            logger.debug(f"Spot {neighbor_location} is adjacent to tree at {tree_neighbor}.")
-                            break
+    def get_random_empty_spot_near_town(self) -> Optional[Location]:
+        if not self._empty_spot_list:
+            logger.warning("There are no empty spots near town.")
+            return None
+        y, x = divmod(random.choice(self._empty_spot_list), self._width)
+        return Location(x, y)
+
+    @staticmethod
+    def _find_empty_spots_near_town(cells: np.ndarray) -> np.ndarray:
+        # an empty spot touching a building or construction site, but not touching a tree
+        buildings: np.ndarray = np.isin(cells, CellCodes.BUILDING_CODES)
+        trees: np.ndarray = cells == CellCodes.TREE
+        return (cells == CellCodes.EMPTY) & any_neighbor(buildings) & ~any_neighbor(trees)
+
+    def _update_empty_spots(self, top: int, left: int, width: int, height: int) -> None:
+        """Re-check the spots around a changed region: the region itself and a one cell ring around it."""
+        y0, y1 = max(top - 1, 0), min(top + height + 1, self._height)
+        x0, x1 = max(left - 1, 0), min(left + width + 1, self._width)
+        # those spots look at their own neighbors too, so the window reaches one cell further
+        wy0, wy1 = max(y0 - 1, 0), min(y1 + 1, self._height)
+        wx0, wx1 = max(x0 - 1, 0), min(x1 + 1, self._width)
+
+        window = self._find_empty_spots_near_town(self._cells[wy0:wy1, wx0:wx1])
+        self._apply_empty_spots(y0, x0, window[y0 - wy0 : y1 - wy0, x0 - wx0 : x1 - wx0])
+
+    def _update_empty_spots_around(self, ys: np.ndarray, xs: np.ndarray) -> None:
+        """Re-check the spots on and next to scattered changed cells, reading only their neighbors."""
+        height, width = self._height, self._width
+        # the changed cells and their eight neighbors are the only spots that can change
+        spot_ys = np.concatenate((ys[:, np.newaxis], ys[:, np.newaxis] + self._neighbor_dys), axis=1).ravel()
+        spot_xs = np.concatenate((xs[:, np.newaxis], xs[:, np.newaxis] + self._neighbor_dxs), axis=1).ravel()
+        inside = (spot_ys >= 0) & (spot_ys < height) & (spot_xs >= 0) & (spot_xs < width)
+        spot_ys, spot_xs = np.divmod(np.unique(spot_ys[inside] * width + spot_xs[inside]), width)
+
+        # same rule as _find_empty_spots_near_town, applied to each spot's neighbors
+        neighbor_ys = spot_ys[:, np.newaxis] + self._neighbor_dys
+        neighbor_xs = spot_xs[:, np.newaxis] + self._neighbor_dxs
+        inside = (neighbor_ys >= 0) & (neighbor_ys < height) & (neighbor_xs >= 0) & (neighbor_xs < width)
+        codes = self._cells[np.clip(neighbor_ys, 0, height - 1), np.clip(neighbor_xs, 0, width - 1)]
+        near_building = (np.isin(codes, CellCodes.BUILDING_CODES) & inside).any(axis=1)
+        near_tree = ((codes == CellCodes.TREE) & inside).any(axis=1)
+        spots = (self._cells[spot_ys, spot_xs] == CellCodes.EMPTY) & near_building & ~near_tree
+        self._set_empty_spots(spot_ys, spot_xs, spots)
+
+    def _apply_empty_spots(self, y0: int, x0: int, spots: np.ndarray) -> None:
+        """Store a fresh empty spot mask for the block whose top left cell is (x0, y0)."""
+        height, width = spots.shape
+        ys, xs = np.mgrid[y0 : y0 + height, x0 : x0 + width]
+        self._set_empty_spots(ys.ravel(), xs.ravel(), spots.ravel())
+
+    def _set_empty_spots(self, ys: np.ndarray, xs: np.ndarray, spots: np.ndarray) -> None:
+        """Store fresh empty spot values for the given cells, keeping the sampling list in step."""
+        changed = self._empty_spots[ys, xs] != spots
+        for y, x, spot in zip(ys[changed].tolist(), xs[changed].tolist(), spots[changed].tolist()):
+            index = y * self._width + x
+            if spot:
+                self._empty_spot_positions[index] = len(self._empty_spot_list)
+                self._empty_spot_list.append(index)
+            else:
+                # swap the last spot into the removed one's slot so removal stays O(1)
+                position = self._empty_spot_positions.pop(index)
+                last = self._empty_spot_list.pop()
+                if last != index:
+                    self._empty_spot_list[position] = last
+                    self._empty_spot_positions[last] = position
+        self._empty_spots[ys, xs] = spots
+
+    def can_reach(self, start: Location, end: Location) -> bool:
+        """Whether a path exists between two cells, answered from the component labels."""
+        if not self.is_in_bounds(start) or not self.is_in_bounds(end):
+            return False
+        component = self._get_components().item(end.y, end.x)
+        return component != 0 and component in self._get_start_components(start)
 
-                    if not is_adjacent_to_tree:
-                        logger.debug(f"Spot {neighbor_location} is valid and added to empty spots.")
-                        empty_spots.append(neighbor_location)
+    def can_reach_town(self, location: Location) -> bool:
+        """Whether location shares a component with at least one of the empty spots near town."""
+        if not self.is_in_bounds(location):
+            return False
+        return not self._get_start_components(location).isdisjoint(self._get_town_components())
 
-        logger.debug(f"Found {len(empty_spots)} empty spots near towns.")
-        return empty_spots
+    def get_random_reachable_location(self, location: Location) -> Optional[Location]:
+        """A cell picked uniformly from the ones reachable from location, location itself included if passable."""
+        if not self.is_in_bounds(location):
+            return None
+        components = sorted(self._get_start_components(location))
+        if not components:
+            return None
+        sizes = [self._component_offsets.item(c + 1) - self._component_offsets.item(c) for c in components]
+        pick = random.randrange(sum(sizes))
+        for component, size in zip(components, sizes):
+            if pick < size:
+                break
+            pick -= size
+        y, x = divmod(self._component_cells.item(self._component_offsets.item(component) + pick), self._width)
+        return Location(x, y)
+
+    def _get_start_components(self, location: Location) -> Set[int]:
+        """
+        The components a walk from location can reach. Someone standing on an impassable cell, say a construction
+        that just turned into a building, can still step off it onto any passable neighbor.
+        """
+        components = self._get_components()
+        component = components.item(location.y, location.x)
+        if component:
+            return {component}
+        y0, y1 = max(location.y - 1, 0), min(location.y + 2, self._height)
+        x0, x1 = max(location.x - 1, 0), min(location.x + 2, self._width)
+        return set(np.unique(components[y0:y1, x0:x1]).tolist()) - {0}
+
+    def _get_components(self) -> np.ndarray:
+        if self._components_version == self._passable_version:
+            return self._components
+
+        logger.debug("Passability changed to version {}. Relabelling connected components.", self._passable_version)
+        components, count = label_components(self._path_costs > 0)
+        flat = components.ravel()
+        self._components = components
+        self._component_cells = np.argsort(flat, kind="stable")
+        self._component_offsets = np.concatenate(([0], np.cumsum(np.bincount(flat, minlength=count + 1))))
+        self._components_version = self._passable_version
+        return self._components
+
+    def _get_town_components(self) -> Set[int]:
+        """The components holding an empty spot near town, which can change without any cell's passability."""
+        if self._town_components_version == self._version:
+            return self._town_components
+
+        components = self._get_components().ravel()
+        self._town_components = set(components[self._empty_spot_list].tolist()) - {0}
+        self._town_components_version = self._version
+        return self._town_components
 
     def grow_trees(self) -> None:
+        """
+        Every tree tries each empty neighbor with the growth chance and seeds at most one of them, picked at random
+        among the successes. When several trees seed the same cell a random one of them wins. The new trees are
+        drawn in one grid change and inherit the yield function of the tree that seeded them.
+        """
         chance: int = settings.get("tree_growth_chance", 0.01)
-        logger.debug(f"Starting tree growth process with a chance of {chance}.")
-
-        for i in range(len(self._grid)):
-            for j in range(len(self._grid[i])):
-                location: Location = Location(j, i)
-                tree: Structure = self._structures.get(location)
-
-                if not isinstance(tree, Tree):
-                    continue
-
-                logger.debug(f"Tree found at {location}. Checking its neighbors for growth.")
-
-                neighbors: List[Location] = location.get_neighbors()
-                random.shuffle(neighbors)
-
-                for neighbor in neighbors:
-                    if not self.is_in_bounds(neighbor):
-                        logger.debug(f"Neighbor {neighbor} is out of bounds. Skipping.")
-                        continue
-                    if not self.is_empty(neighbor):
-                        logger.debug(f"Neighbor {neighbor} is not empty. Skipping.")
-                        continue
-                    if random.random() < chance:
-                        logger.info(f"Growing tree at {neighbor}.")
-                        self._grid[neighbor.y][neighbor.x] = settings.get("tree_char", "*")  # Place a tree here
-                        neighbor_tree: Structure = self._structure_factory.create_instance(StructureType.TREE, neighbor)
-                        if isinstance(neighbor_tree, Tree):
-                            neighbor_tree.set_yield_func(tree.get_yield_func())
-                            self._structures[neighbor] = neighbor_tree
-                            logger.debug(f"Tree successfully grown at {neighbor}.")
-                            break
-                        else:
-                            logger.debug(f"Failed to create a valid tree structure at {neighbor}.")
-
-        logger.debug("Tree growth process completed.")
+        logger.debug("Starting tree growth process with a chance of {}.", chance)
 
-    def work_structures_exchange_memories(self):
-        logger.debug("Starting memory exchange for work structures.")
+        tree_ys, tree_xs = np.nonzero(self._cells == CellCodes.TREE)
+        if not len(tree_ys):
+            return
 
-        work_structures: List[Work] = list(filter(lambda s: isinstance(s, Work), self._structures.values()))
+        # (tree, direction) candidates
+        ys = tree_ys[:, np.newaxis] + self._neighbor_dys
+        xs = tree_xs[:, np.newaxis] + self._neighbor_dxs
+        in_bounds = (ys >= 0) & (ys < self._height) & (xs >= 0) & (xs < self._width)
+        is_empty = np.zeros(ys.shape, dtype=bool)
+        is_empty[in_bounds] = self._cells[ys[in_bounds], xs[in_bounds]] == CellCodes.EMPTY
+        succeeded = is_empty & (np.random.random(ys.shape) < chance)
+
+        # one random success per tree
+        parents = np.nonzero(succeeded.any(axis=1))[0]
+        if not len(parents):
+            logger.debug("No trees grew this time.")
+            return
+        directions = np.where(succeeded[parents], np.random.random((len(parents), 8)), -1.0).argmax(axis=1)
+        seeded = ys[parents, directions] * self._width + xs[parents, directions]
+
+        # one random parent per seeded cell
+        order = np.random.permutation(len(parents))
+        seeded, first = np.unique(seeded[order], return_index=True)
+        parents = parents[order[first]]
+
+        new_ys, new_xs = np.divmod(seeded, self._width)
+        self._fill_cells(new_ys, new_xs, CellCodes.TREE)
+
+        trees: Dict[Location, Structure] = self._structures_by_type[StructureType.TREE]
+        for parent_y, parent_x, y, x in zip(
+            tree_ys[parents].tolist(), tree_xs[parents].tolist(), new_ys.tolist(), new_xs.tolist()
+        ):
+            location = Location(x, y)
+            tree: Structure = self._structure_factory.create_instance(StructureType.TREE, location)
+            parent = trees.get(Location(parent_x, parent_y))
+            if isinstance(tree, Tree) and isinstance(parent, Tree):
+                tree.set_yield_func(parent.get_yield_func())
+            self._add_structure(location, tree)
+
+        logger.debug("Tree growth process completed: {} new trees.", len(seeded))
+
+    def add_shared_work_site(self, work: Work) -> None:
+        """Called by a work site once a second worker joins it."""
+        self._shared_work_sites[work.get_location()] = work
+
+    def remove_shared_work_site(self, work: Work) -> None:
+        """Called by a work site once it is down to a single worker."""
+        if self._shared_work_sites.get(work.get_location()) is work:
+            del self._shared_work_sites[work.get_location()]
 
-        for work_structure in work_structures:
-            logger.debug(f"Exchanging memories for work structure {work_structure}.")
+    def work_structures_exchange_memories(self):
+        logger.debug("Starting memory exchange for {} shared work sites.", len(self._shared_work_sites))
+
+        for location, work_structure in list(self._shared_work_sites.items()):
+            if self._structures.get(location) is not work_structure or not work_structure.has_shared_workers():
+                logger.debug("Work structure at {} is gone or no longer shared. Dropping it.", location)
+                del self._shared_work_sites[location]
+                continue
+            logger.debug("Exchanging memories for work structure {}.", work_structure)
             work_structure.exchange_worker_memories()
 
         logger.debug("Memory exchange for work structures completed.")
 
     def start_building_construction(self, building_type: StructureType, location: Location) -> None:
         try:
-            logger.debug(f"Attempting to start construction of {building_type} at {location}.")
+            logger.debug("Attempting to start construction of {} at {}.", building_type, location)
             building: Structure = self._structure_factory.create_instance(building_type, location)
-            logger.info(f"Construction started for {building_type} at {location}.")
+            logger.info("Construction started for {} at {}.", building_type, location)
         except Exception as e:
-            logger.error(f"Could not start structure construction at {location}. Error: {e}")
+            logger.error("Could not start structure construction at {}. Error: {}", location, e)
             return
-        self._structures[location] = building
-        logger.debug(f"Structure at {location} added to the list of structures.")
+        self._add_structure(location, building)
+        logger.debug("Structure at {} added to the list of structures.", location)
+
+    def add_completed_construction(self, construction: Construction) -> None:
+        """Called by a construction site once it is finished, so it becomes a building at the end of the day."""
+        logger.debug("Construction at {} is finished.", construction.get_location())
+        self._completed_constructions.append(construction)
 
     def turn_completed_constructions_to_buildings(self):
-        logger.debug("Turning completed constructions into buildings.")
-
-        locations: List[Location] = list(self._structures.keys())
-        for location in locations:
-            logger.debug(f"Checking structure at {location}.")
-
-            if self.is_construction_barn(location):
-                building_type = StructureType.BARN
-                logger.debug(f"Construction at {location} is a barn.")
-            elif self.is_construction_farm(location):
-                building_type = StructureType.FARM
-                logger.debug(f"Construction at {location} is a farm.")
-            elif self.is_construction_home(location):
-                building_type = StructureType.HOME
-                logger.debug(f"Construction at {location} is a home.")
-            elif self.is_construction_mine(location):
-                building_type = StructureType.MINE
-                logger.debug(f"Construction at {location} is a mine.")
-            else:
-                logger.debug(f"Construction at {location} is not recognized. Skipping.")
-                continue
+        logger.debug("Turning {} completed constructions into buildings.", len(self._completed_constructions))
 
-            if self._structures[location].has_capacity():
-                logger.debug(f"Structure at {location} still has capacity. Skipping.")
+        completed, self._completed_constructions = self._completed_constructions, []
+        for construction in completed:
+            location = construction.get_location()
+            if self._structures.get(location) is not construction:
+                logger.debug("Construction at {} is no longer on the grid. Skipping.", location)
                 continue
 
-            logger.info(f"Turning construction at {location} into a building.")
-            self._structures[location] = self._structure_factory.create_instance(building_type, location)
-            logger.debug(f"Building at {location} updated to {building_type}.")
+            building_type = self._construction_buildings[StructureFactory.get_structure_type(construction)]
+            logger.info("Turning construction at {} into a building.", location)
+            # the site has to make room first, a building can't be placed over it
+            self.remove(construction)
+            self._add_structure(location, self._structure_factory.create_instance(building_type, location))
+            logger.debug("Building at {} updated to {}.", location, building_type)
 
     def is_in_bounds(self, location: Location) -> bool:
-        logger.debug(f"Checking if location {location} is within bounds.")
+        logger.debug("Checking if location {} is within bounds.", location)
         in_bounds = 0 <= location.x < self._width and 0 <= location.y < self._height
-        logger.debug(f"Location {location} is {'within' if in_bounds else 'out of'} bounds.")
+        logger.debug("Location {} is {} bounds.", location, "within" if in_bounds else "out of")
         return in_bounds
 
-    def get_path_finding_matrix(self) -> List[List[int]]:
-        logger.debug("Generating path finding matrix.")
-
-        logger.debug(f"Character to obstacle rating map: {self._char_to_num}")
-
-        path_finding_matrix: List[List[int | str]] = deepcopy(self._grid)
-
-        logger.debug(
-            f"Starting to fill the path finding matrix based on grid size {len(self._grid)}x{len(self._grid[0])}."
-        )
-
-        for i in range(len(self._grid)):
-            row = self._grid[i]
-            for j in range(len(row)):
-                cell = row[j]
-                # invert coordinates for the pathfinding library
-                path_finding_matrix[j][i] = self._char_to_num[cell]  
-                logger.debug(f"Setting path_finding_matrix[{j}][{i}] = {self._char_to_num[cell]} (cell: {cell})")
+    def get_path_costs(self) -> np.ndarray:
+        """
+        The shared obstacle-rating matrix, indexed [y, x].
+        It is kept up to date as cells change, so check get_version() to know when it moved.
+        """
+        return self._path_costs
+
+    def find_path(self, start: Location, end: Location) -> List[Location]:
+        """Cheapest path from start to end, both included, or an empty list if end can't be reached."""
+        return self._path_finder.find_path(start, end)
+
+    def look_from(self, location: Location, radius: int) -> List[Tuple[Location, int]]:
+        """Every cell that can be seen from location within radius, paired with its cell code."""
+        return self._field_of_view.look(location, radius)
+
+    def get_flow_field(self, location: Location) -> FlowField:
+        """
+        Field of next steps towards location, shared by everyone heading there.
+        Someone arrives by standing on location, or next to it when location can't be walked on.
+        Fields are only rebuilt once a cell turns passable or impassable. Cost changes in between, such as a tree
+        growing, can make a field's route a little longer than the cheapest one, but every step stays walkable.
+        """
+        if self._flow_fields_version != self._passable_version:
+            logger.debug(
+                "Passable cells changed (version {}). Dropping {} flow fields.",
+                self._passable_version,
+                len(self._flow_fields),
+            )
+            self._flow_fields.clear()
+            self._flow_fields_version = self._passable_version
+
+        flow_field = self._flow_fields.get(location)
+        if flow_field is None:
+            if self.is_in_bounds(location) and self._path_costs.item(location.y, location.x):
+                goals = [location]
+            else:
+                goals = location.get_neighbors()
+            flow_field = self._path_finder.build_flow_field(goals)
+            self._flow_fields[location] = flow_field
+        return flow_field
 
-        logger.debug("Path finding matrix generation complete.")
+    def get_min_path_cost(self) -> int:
+        """The cheapest step any passable cell can cost, whether or not such a cell is on the grid right now."""
+        return int(self._cost_table[self._cost_table > 0].min())
 
-        return path_finding_matrix
+    def get_version(self) -> int:
+        """Counter that goes up every time a cell on the grid changes."""
+        return self._version
 
     def is_tree(self, location: Location) -> bool:
-        logger.debug(f"Checking if location {location} is a tree.")
-        return self.is_char(location, settings.get("tree_char", "*"))
+        return self._is_code(location, CellCodes.TREE)
 
     def is_barn(self, location: Location) -> bool:
-        logger.debug(f"Checking if location {location} is a barn.")
-        return self.is_char(location, settings.get("barn_char", "B"))
+        return self._is_code(location, CellCodes.BARN)
 
     def is_construction_barn(self, location: Location) -> bool:
-        logger.debug(f"Checking if location {location} is a construction barn.")
-        return self.is_char(location, settings.get("barn_construction_char", "b"))
+        return self._is_code(location, CellCodes.CONSTRUCTION_BARN)
 
     def is_home(self, location: Location) -> bool:
-        logger.debug(f"Checking if location {location} is a home.")
-        return self.is_char(location, settings.get("home_char", "H"))
+        return self._is_code(location, CellCodes.HOME)
 
     def is_construction_home(self, location: Location) -> bool:
-        logger.debug(f"Checking if location {location} is a construction home.")
-        return self.is_char(location, settings.get("home_construction_char", "h"))
+        return self._is_code(location, CellCodes.CONSTRUCTION_HOME)
 
     def is_farm(self, location: Location) -> bool:
-        logger.debug(f"Checking if location {location} is a farm.")
-        return self.is_char(location, settings.get("farm_char", "F"))
+        return self._is_code(location, CellCodes.FARM)
 
     def is_construction_farm(self, location: Location) -> bool:
-        logger.debug(f"Checking if location {location} is a construction farm.")
-        return self.is_char(location, settings.get("farm_construction_char", "f"))
+        return self._is_code(location, CellCodes.CONSTRUCTION_FARM)
 
     def is_mine(self, location: Location) -> bool:
-        logger.debug(f"Checking if location {location} is a mine.")
-        return self.is_char(location, settings.get("mine_char", "M"))
+        return self._is_code(location, CellCodes.MINE)
 
     def is_construction_mine(self, location: Location) -> bool:
-        logger.debug(f"Checking if location {location} is a construction mine.")
-        return self.is_char(location, settings.get("mine_construction_char", "m"))
+        return self._is_code(location, CellCodes.CONSTRUCTION_MINE)
 
     def is_empty(self, location: Location) -> bool:
-        logger.debug(f"Checking if location {location} is empty.")
-        return self.is_char(location, settings.get("empty_char", " "))
+        return self._is_code(location, CellCodes.EMPTY)
 
     def is_char(self, location: Location, char: str) -> bool:
-        logger.debug(f"Checking if location {location} contains character '{char}'.")
-        if not self.is_in_bounds(location):
-            logger.warning(f"You called is_char with a location that is out of bounds {location}")
+        return self._is_code(location, CellCodes.to_code(char))
+
+    def _is_code(self, location: Location, code: int) -> bool:
+        if not (0 <= location.x < self._width and 0 <= location.y < self._height):
+            logger.warning("You called is_char with a location that is out of bounds {}", location)
             return False
-            
-        return self._grid[location.y][location.x] == char
+
+        return self._cells.item(location.y, location.x) == code
 
     def get_width(self) -> int:
         logger.debug("Getting grid width.")
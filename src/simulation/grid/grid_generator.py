@@ -1,8 +1,11 @@
 import random
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+import numpy as np
 
 from src.logger import logger
 from src.settings import settings
+from src.simulation.grid.neighborhood import count_neighbors
 
 
 class GridGenerator:
@@ -15,6 +18,7 @@ class GridGenerator:
         building_buffer: int = settings.get("building_buffer", 1),
     ) -> None:
         self._grid: List[List[str]] = []
+        self._occupied: np.ndarray = np.zeros((size, size), dtype=bool)  # non-empty cells, kept for town layout
         self._width: int = size
         self._height: int = size
         self._tree_density: float = tree_density
@@ -36,18 +40,18 @@ class GridGenerator:
         self._town_clearance_radius: int = town_clearance_radius
         self._building_buffer: int = building_buffer
 
-        # Log the initialization parameters using f-string formatting
+        # Log the initialization parameters
         logger.debug("GridGenerator initialized with the following parameters:")
-        logger.debug(f"Grid size: {self._width}x{self._height}")
-        logger.debug(f"Tree density: {self._tree_density}")
-        logger.debug(f"CA iterations: {self._ca_iterations}")
-        logger.debug(f"Town clearance radius: {self._town_clearance_radius}")
-        logger.debug(f"Building buffer: {self._building_buffer}")
-        logger.debug(f"Building sizes: {self._building_sizes}")
-        logger.debug(f"Number of houses: {self._num_houses}")
-        logger.debug(f"Number of farms: {self._num_farms}")
-        logger.debug(f"Number of barns: {self._num_barns}")
-        logger.debug(f"Number of mines: {self._num_mines}")
+        logger.debug("Grid size: {}x{}", self._width, self._height)
+        logger.debug("Tree density: {}", self._tree_density)
+        logger.debug("CA iterations: {}", self._ca_iterations)
+        logger.debug("Town clearance radius: {}", self._town_clearance_radius)
+        logger.debug("Building buffer: {}", self._building_buffer)
+        logger.debug("Building sizes: {}", self._building_sizes)
+        logger.debug("Number of houses: {}", self._num_houses)
+        logger.debug("Number of farms: {}", self._num_farms)
+        logger.debug("Number of barns: {}", self._num_barns)
+        logger.debug("Number of mines: {}", self._num_mines)
 
     def generate(self) -> List[List[str]]:
         logger.debug("Starting grid generation process...")
@@ -57,7 +61,7 @@ class GridGenerator:
         self._initialize_grid()
 
         # Add clustered trees based on tree density
-        logger.debug(f"Adding clustered trees with density {self._tree_density}...")
+        logger.debug("Adding clustered trees with density {}...", self._tree_density)
         self._add_clustered_trees()
 
         # Generate the town layout, placing buildings
@@ -68,7 +72,7 @@ class GridGenerator:
         return self._grid
 
     def _initialize_grid(self) -> None:
-        logger.debug(f"Initializing grid with size {self._width} x {self._height}...")
+        logger.debug("Initializing grid with size {} x {}...", self._width, self._height)
 
         # Initialize grid with empty spaces
         self._grid = [[" " for _ in range(self._width)] for _ in range(self._height)]
@@ -80,6 +84,7 @@ class GridGenerator:
 
         center_x, center_y = self._width // 2, self._height // 2
         self._clear_town_area(center_x, center_y)
+        self._occupied = np.array(self._grid) != " "
 
         buildings = [
             (settings.get("home_char", "H"), self._num_houses, settings.get("home_completion_prob", 0.8)),
@@ -90,20 +95,31 @@ class GridGenerator:
 
         for building_type, count, completion_prob in buildings:
             logger.debug(
-                f"Placing {count} buildings of type '{building_type}' with a completion probability of {completion_prob:.2f}..."
+                "Placing {} buildings of type '{}' with a completion probability of {:.2f}...",
+                count,
+                building_type,
+                completion_prob,
             )
             self._place_building_random(building_type, True)  # Place the first building (always completed)
             for i in range(count - 1):
                 is_completed = random.random() < completion_prob
-                logger.debug(f"Building {i + 1}/{count - 1} of type '{building_type}' - Completed: {is_completed}")
+                logger.debug(
+                    "Building {}/{} of type '{}' - Completed: {}", i + 1, count - 1, building_type, is_completed
+                )
                 self._place_building_random(building_type, is_completed)
 
         logger.debug(
-            f"Town generation completed with {self._num_houses} homes, {self._num_farms} farms, {self._num_barns} barns, and {self._num_mines} mines placed."
+            "Town generation completed with {} homes, {} farms, {} barns, and {} mines placed.",
+            self._num_houses,
+            self._num_farms,
+            self._num_barns,
+            self._num_mines,
         )
 
     def _clear_town_area(self, center_x: int, center_y: int) -> None:
-        logger.debug(f"Clearing town area with radius {self._town_clearance_radius} around ({center_x}, {center_y})...")
+        logger.debug(
+            "Clearing town area with radius {} around ({}, {})...", self._town_clearance_radius, center_x, center_y
+        )
         radius = self._town_clearance_radius
         for dy in range(-radius, radius + 1):
             for dx in range(-radius, radius + 1):
@@ -113,69 +129,114 @@ class GridGenerator:
         logger.debug("Town area cleared.")
 
     def _place_building_random(self, building_type: str, is_completed: bool) -> None:
-        logger.debug(f"Placing building of type '{building_type}' (Completed: {is_completed})...")
-        center_x, center_y = self._width // 2, self._height // 2
+        logger.debug("Placing building of type '{}' (Completed: {})...", building_type, is_completed)
         width, height = self._building_sizes[building_type]
 
-        # Search for a random location to place the building, expanding outward
-        for distance in range(1, max(self._width, self._height)):
-            for dy in range(-distance, distance + 1):
-                for dx in range(-distance, distance + 1):
-                    x, y = center_x + dx, center_y + dy
-                    if 0 <= x < self._width and 0 <= y < self._height:
-                        if self._can_place_building(x, y, width, height):
-                            building_char = building_type if is_completed else building_type.lower()
-                            logger.debug(f"Placing building at ({x}, {y})")
-                            self._clear_area(x, y, width, height)
-                            self._place_on_grid(x, y, width, height, building_char)
-                            logger.debug("Building placed.")
-                            return
-        logger.warning(f"Failed to place building of type '{building_type}' after searching the grid.")
-
-    def _can_place_building(self, x: int, y: int, width: int, height: int) -> bool:
-        logger.debug(f"Checking if building can be placed at ({x}, {y}) with size ({width}, {height})...")
-
-        if x + width > self._width or y + height > self._height:
-            logger.debug("Building exceeds grid boundaries.")
-            return False
+        spot = self._find_building_spot(width, height)
+        if spot is None:
+            logger.warning("Failed to place building of type '{}' after searching the grid.", building_type)
+            return
+
+        x, y = spot
+        building_char = building_type if is_completed else building_type.lower()
+        logger.debug("Placing building at ({}, {})", x, y)
+        self._clear_area(x, y, width, height)
+        self._place_on_grid(x, y, width, height, building_char)
+        logger.debug("Building placed.")
+
+    def _find_building_spot(self, width: int, height: int) -> Optional[Tuple[int, int]]:
+        """
+        The first spot, searching outward from the center in square rings and row by row within a ring,
+        where the building and the buffer around it only cover empty cells.
+        Looks at a square around the center first and only doubles it while nothing fits.
+        """
+        max_x = self._width - width
+        max_y = self._height - height
+        if max_x < 0 or max_y < 0:
+            return None
 
-        for dy in range(-self._building_buffer, height + self._building_buffer):
-            for dx in range(-self._building_buffer, width + self._building_buffer):
-                new_x, new_y = x + dx, y + dy
-                if 0 <= new_x < self._width and 0 <= new_y < self._height:
-                    if self._grid[new_y][new_x] != " ":
-                        logger.debug(f"Blocked by non-empty cell at ({new_x}, {new_y}). Cannot place building here.")
-                        return False
-        logger.debug(f"Building can be placed at ({x}, {y}).")
-        return True
+        center_x, center_y = self._width // 2, self._height // 2
+        radius = 16
+        while True:
+            spot = self._find_building_spot_within(width, height, center_x, center_y, radius)
+            if spot is not None:
+                return spot
+            covers_x = center_x - radius <= 0 and center_x + radius >= max_x
+            covers_y = center_y - radius <= 0 and center_y + radius >= max_y
+            if covers_x and covers_y:
+                return None
+            radius *= 2
+
+    def _find_building_spot_within(
+        self, width: int, height: int, center_x: int, center_y: int, radius: int
+    ) -> Optional[Tuple[int, int]]:
+        buffer = self._building_buffer
+        x0, x1 = max(center_x - radius, 0), min(center_x + radius, self._width - width) + 1
+        y0, y1 = max(center_y - radius, 0), min(center_y + radius, self._height - height) + 1
+        if x0 >= x1 or y0 >= y1:
+            return None
+
+        # summed-area table of the occupied cells the candidates and their buffers can reach
+        top, left = max(y0 - buffer, 0), max(x0 - buffer, 0)
+        bottom, right = min(y1 + height + buffer, self._height), min(x1 + width + buffer, self._width)
+        table = np.zeros((bottom - top + 1, right - left + 1), dtype=np.int32)
+        table[1:, 1:] = self._occupied[top:bottom, left:right].cumsum(axis=0, dtype=np.int32).cumsum(axis=1)
+
+        # every candidate window is four lookups, in table coordinates
+        ys = np.arange(y0, y1)[:, np.newaxis]
+        xs = np.arange(x0, x1)[np.newaxis, :]
+        window_top = np.maximum(ys - buffer, 0) - top
+        window_bottom = np.minimum(ys + height + buffer, self._height) - top
+        window_left = np.maximum(xs - buffer, 0) - left
+        window_right = np.minimum(xs + width + buffer, self._width) - left
+        occupied = (
+            table[window_bottom, window_right]
+            - table[window_top, window_right]
+            - table[window_bottom, window_left]
+            + table[window_top, window_left]
+        )
+
+        # the first ring also holds the center itself, and rings stop short of the grid size
+        ring = np.maximum(np.maximum(np.abs(xs - center_x), np.abs(ys - center_y)), 1)
+        candidates = (occupied == 0) & (ring < max(self._width, self._height))
+        if not candidates.any():
+            return None
+
+        first_ring = ring[candidates].min()
+        y, x = np.argwhere(candidates & (ring == first_ring))[0]
+        return x0 + int(x), y0 + int(y)
 
     def _clear_area(self, x: int, y: int, width: int, height: int) -> None:
-        logger.debug(f"Clearing area around ({x}, {y}) with size ({width}, {height})...")
+        logger.debug("Clearing area around ({}, {}) with size ({}, {})...", x, y, width, height)
 
         for dy in range(-self._building_buffer, height + self._building_buffer):
             for dx in range(-self._building_buffer, width + self._building_buffer):
                 new_x, new_y = x + dx, y + dy
                 if 0 <= new_x < self._width and 0 <= new_y < self._height:
                     if self._grid[new_y][new_x] == self._tree_char:
-                        logger.debug(f"Clearing tree at ({new_x}, {new_y}).")
+                        logger.debug("Clearing tree at ({}, {}).", new_x, new_y)
                         self._grid[new_y][new_x] = " "
+                        self._occupied[new_y, new_x] = False
                     elif self._grid[new_y][new_x] == " ":
-                        logger.debug(f"Cell at ({new_x}, {new_y}) is already empty.")
+                        logger.debug("Cell at ({}, {}) is already empty.", new_x, new_y)
                         self._grid[new_y][new_x] = " "
         logger.debug("Area cleared.")
 
     def _place_on_grid(self, x: int, y: int, width: int, height: int, building_char: str) -> None:
-        logger.debug(f"Placing building of type '{building_char}' at ({x}, {y}) with size ({width}, {height})...")
+        logger.debug(
+            "Placing building of type '{}' at ({}, {}) with size ({}, {})...", building_char, x, y, width, height
+        )
 
         for dy in range(height):
             for dx in range(width):
                 self._grid[y + dy][x + dx] = building_char
-                logger.debug(f"Placed '{building_char}' at position ({x + dx}, {y + dy}).")
+                logger.debug("Placed '{}' at position ({}, {}).", building_char, x + dx, y + dy)
+        self._occupied[y : y + height, x : x + width] = True
 
-        logger.debug(f"Building placed at ({x}, {y}).")
+        logger.debug("Building placed at ({}, {}).", x, y)
 
     def _add_clustered_trees(self) -> None:
-        logger.debug(f"Starting tree clustering with density {self._tree_density}.")
+        logger.debug("Starting tree clustering with density {}.", self._tree_density)
         self._generate_inner_trees()
         self._do_cellular_automata()
         logger.debug("Tree clustering completed.")
@@ -186,52 +247,37 @@ class GridGenerator:
             for j in range(2, len(self._grid[i]) - 2):
                 if random.random() < self._tree_density:
                     self._grid[i][j] = self._tree_char
-                    logger.debug(f"Planted tree at ({j}, {i}).")
+                    logger.debug("Planted tree at ({}, {}).", j, i)
         logger.debug("Tree generation complete.")
 
     def _do_cellular_automata(self) -> None:
-        logger.debug(f"Starting cellular automata with {self._ca_iterations} iterations.")
-
-        for iteration in range(self._ca_iterations):
-            logger.debug(f"Iteration {iteration + 1} of {self._ca_iterations}...")
-
-            grid_copy = [row[:] for row in self._grid]
-            for i in range(2, len(self._grid) - 2):
-                for j in range(2, len(self._grid[i]) - 2):
-                    count = self._count_number_of_neighbors(i, j)
-                    logger.debug(f"Cell ({i}, {j}) has {count} neighbors.")
-
-                    if self._grid[i][j] == self._tree_char and count < 3:
-                        grid_copy[i][j] = " "
-                        logger.debug(f"Cell ({i}, {j}) has fewer than 3 neighbors, removing tree.")
-                    elif self._grid[i][j] == " " and count > 4:
-                        grid_copy[i][j] = self._tree_char
-                        logger.debug(f"Cell ({i}, {j}) has more than 4 neighbors, adding tree.")
+        logger.debug("Starting cellular automata with {} iterations.", self._ca_iterations)
 
-            self._grid = grid_copy
-            logger.debug(f"Iteration {iteration + 1} complete.")
+        cells = np.array(self._grid)
+        trees: np.ndarray = cells == self._tree_char
+        empty: np.ndarray = cells == " "
+        # the outer two rows and columns are never changed, they only count as neighbors
+        inner = (slice(2, self._height - 2), slice(2, self._width - 2))
 
+        for iteration in range(self._ca_iterations):
+            logger.debug("Iteration {} of {}...", iteration + 1, self._ca_iterations)
+
+            counts = count_neighbors(trees)[inner]
+            inner_trees = trees[inner]
+            dying = inner_trees & (counts < 3)
+            growing = empty[inner] & (counts > 4)
+            inner_trees[dying] = False
+            inner_trees[growing] = True
+            empty[inner][dying] = True
+            empty[inner][growing] = False
+
+            logger.debug("Iteration {} complete: {} trees died, {} grew.", iteration + 1, dying.sum(), growing.sum())
+
+        cells[trees] = self._tree_char
+        cells[empty] = " "
+        self._grid = cells.tolist()
         logger.debug("Cellular automata process completed.")
 
-    def _count_number_of_neighbors(self, row: int, col: int) -> int:
-        count = 0
-        logger.debug(f"Counting neighbors for cell ({row}, {col})...")
-
-        for i in range(-1, 2):
-            for j in range(-1, 2):
-                if (
-                    (i == 0 and j == 0)  # Skip the cell itself
-                    or not (0 <= row + i < len(self._grid))  # Out of bounds check
-                    or not (0 <= col + j < len(self._grid[row]))  # Out of bounds check
-                ):
-                    continue
-                if self._grid[row + i][col + j] == self._tree_char:
-                    count += 1
-                    logger.debug(f"Neighbor at ({row + i}, {col + j}) is a tree.")
-
-        logger.debug(f"Cell ({row}, {col}) has {count} tree neighbors.")
-        return count
-
 
 def print_grid(grid: List[List[str]]) -> None:
     # Top border: Adjusted to account for spaces between characters
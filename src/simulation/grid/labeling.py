@@ -0,0 +1,67 @@
+from typing import List, Tuple
+
+import numpy as np
+
+
+def label_components(mask: np.ndarray) -> Tuple[np.ndarray, int]:
+    """
+    Label the 8-connected components of a boolean mask.
+    Returns an int32 array where every set cell holds its component number (1, 2, ...) and unset cells hold 0,
+    along with the number of components.
+
+    Works on horizontal runs of set cells instead of single cells: the runs of each row are joined to the
+    runs they touch in the row above, then every run is painted with its component number.
+    """
+    height, width = mask.shape
+    labels = np.zeros(mask.shape, dtype=np.int32)
+
+    padded = np.zeros((height, width + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    edges = np.diff(padded, axis=1)
+    run_rows, run_starts = np.nonzero(edges == 1)
+    run_ends = np.nonzero(edges == -1)[1]  # exclusive
+    run_count = len(run_rows)
+    if not run_count:
+        return labels, 0
+
+    row_offsets: List[int] = np.searchsorted(run_rows, np.arange(height + 1)).tolist()
+    starts: List[int] = run_starts.tolist()
+    ends: List[int] = run_ends.tolist()
+    parent: List[int] = list(range(run_count))
+
+    def find(run: int) -> int:
+        while parent[run] != run:
+            parent[run] = parent[parent[run]]
+            run = parent[run]
+        return run
+
+    for y in range(1, height):
+        above = row_offsets[y - 1]
+        above_end = row_offsets[y]
+        current = row_offsets[y]
+        current_end = row_offsets[y + 1]
+        while above < above_end and current < current_end:
+            # runs touch, diagonally included, when each one starts no later than the other one ends
+            if starts[above] <= ends[current] and starts[current] <= ends[above]:
+                root_above = find(above)
+                root_current = find(current)
+                if root_above != root_current:
+                    parent[max(root_above, root_current)] = min(root_above, root_current)
+            if ends[above] < ends[current]:
+                above += 1
+            else:
+                current += 1
+
+    run_labels: List[int] = [0] * run_count
+    count = 0
+    for run in range(run_count):
+        root = find(run)
+        if root == run:
+            count += 1
+            run_labels[run] = count
+        else:
+            run_labels[run] = run_labels[root]
+
+    for row, start, end, label in zip(run_rows.tolist(), starts, ends, run_labels):
+        labels[row, start:end] = label
+    return labels, count
@@ -0,0 +1,30 @@
+import numpy as np
+
+
+def count_neighbors(mask: np.ndarray) -> np.ndarray:
+    """
+    Count, for every cell, how many of its eight neighbors are set in the boolean mask.
+    Cells outside the grid count as unset.
+    """
+    padded = np.pad(mask, 1).astype(np.uint8)
+    height, width = mask.shape
+    counts = np.zeros(mask.shape, dtype=np.uint8)
+    for dy in range(3):
+        for dx in range(3):
+            if dy == 1 and dx == 1:
+                continue
+            counts += padded[dy : dy + height, dx : dx + width]
+    return counts
+
+
+def any_neighbor(mask: np.ndarray) -> np.ndarray:
+    """Return a mask of the cells that have at least one of their eight neighbors set."""
+    padded = np.pad(mask, 1)
+    height, width = mask.shape
+    result = np.zeros(mask.shape, dtype=bool)
+    for dy in range(3):
+        for dx in range(3):
+            if dy == 1 and dx == 1:
+                continue
+            result |= padded[dy : dy + height, dx : dx + width]
+    return result
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from heapq import heapify, heappop, heappush
+from math import sqrt
+from typing import TYPE_CHECKING, List, Tuple
+
+import numpy as np
+
+from src.logger import logger
+from src.simulation.grid.flow_field import FlowField
+from src.simulation.grid.location import Location
+
+if TYPE_CHECKING:
+    from src.simulation.grid.grid import Grid
+
+
+SQRT2: float = sqrt(2)
+
+
+class PathFinder:
+    """
+    A* and flow field searches over the grid's obstacle ratings. A rating of 0 is impassable, anything else is the
+    cost of stepping onto that cell (times sqrt(2) for a diagonal step). Searches reuse the same
+    scratch buffers and tell their entries apart with a per-search stamp, so nothing is cleared between runs.
+    """
+
+    # (dx, dy, step length) for the eight directions
+    _directions: List[Tuple[int, int, float]] = [
+        (-1, -1, SQRT2),
+        (0, -1, 1.0),
+        (1, -1, SQRT2),
+        (-1, 0, 1.0),
+        (1, 0, 1.0),
+        (-1, 1, SQRT2),
+        (0, 1, 1.0),
+        (1, 1, SQRT2),
+    ]
+
+    def __init__(self, grid: Grid) -> None:
+        logger.debug("Initializing PathFinder for a {}x{} grid.", grid.get_width(), grid.get_height())
+        self._grid = grid
+        self._width: int = grid.get_width()
+        self._height: int = grid.get_height()
+
+        size = self._width * self._height
+        self._g: List[float] = [0.0] * size
+        self._parent: List[int] = [0] * size
+        self._opened: List[int] = [0] * size  # stamp of the last search that reached the cell
+        self._closed: List[int] = [0] * size  # stamp of the last search that expanded the cell
+        self._search: int = 0
+
+        # flat copy of the cost matrix, patched by the grid wherever cells change
+        self._costs: List[int] = grid.get_path_costs().ravel().tolist()
+        self._min_cost: int = grid.get_min_path_cost()
+
+    def find_path(self, start: Location, end: Location) -> List[Location]:
+        """Return the cheapest path from start to end, both included, or an empty list if there is none."""
+        width = self._width
+        height = self._height
+        costs = self._costs
+
+        if not (0 <= end.x < width and 0 <= end.y < height):
+            logger.debug("Path end {} is out of bounds.", end)
+            return []
+
+        start_index = start.y * width + start.x
+        end_index = end.y * width + end.x
+        if start_index == end_index:
+            return [Location(start.x, start.y)]
+        if not costs[end_index]:
+            logger.debug("No path from {} to {}: the end is impassable.", start, end)
+            return []
+        # an impassable start is fine, every step is priced by the cell it lands on, so the search steps off it
+
+        self._search += 1
+        stamp = self._search
+        g = self._g
+        parent = self._parent
+        opened = self._opened
+        closed = self._closed
+        min_cost = self._min_cost
+        end_x = end.x
+        end_y = end.y
+        diagonal_bonus = SQRT2 - 2
+
+        g[start_index] = 0.0
+        opened[start_index] = stamp
+        open_list: List[Tuple[float, float, int]] = [(0.0, 0.0, start_index)]
+
+        while open_list:
+            _, node_g, node = heappop(open_list)
+            if closed[node] == stamp:
+                continue  # stale entry, the cell was already expanded through a cheaper route
+            closed[node] = stamp
+            if node == end_index:
+                return self._backtrace(start_index, end_index)
+
+            y, x = divmod(node, width)
+            for dx, dy, length in self._directions:
+                nx = x + dx
+                ny = y + dy
+                if nx < 0 or ny < 0 or nx >= width or ny >= height:
+                    continue
+                neighbor = ny * width + nx
+                cost = costs[neighbor]
+                if not cost or closed[neighbor] == stamp:
+                    continue
+                neighbor_g = node_g + length * cost
+                if opened[neighbor] != stamp or neighbor_g < g[neighbor]:
+                    opened[neighbor] = stamp
+                    g[neighbor] = neighbor_g
+                    parent[neighbor] = node
+                    hx = nx - end_x if nx > end_x else end_x - nx
+                    hy = ny - end_y if ny > end_y else end_y - ny
+                    h = (hx + hy + diagonal_bonus * (hx if hx < hy else hy)) * min_cost
+                    heappush(open_list, (neighbor_g + h, neighbor_g, neighbor))
+
+        logger.debug("No path found from {} to {}.", start, end)
+        return []
+
+    def build_flow_field(self, goals: List[Location]) -> FlowField:
+        """
+        Run one Dijkstra search outwards from every passable goal cell and record, for each cell,
+        the cost to reach the nearest goal and the step that leads there.
+        """
+        width = self._width
+        height = self._height
+        costs = self._costs
+        size = width * height
+
+        distances: List[float] = [-1.0] * size
+        next_steps: List[int] = [-1] * size
+        open_list: List[Tuple[float, int]] = []
+        for goal in goals:
+            if not (0 <= goal.x < width and 0 <= goal.y < height):
+                continue
+            index = goal.y * width + goal.x
+            if costs[index] and distances[index] != 0.0:
+                distances[index] = 0.0
+                open_list.append((0.0, index))
+        heapify(open_list)
+
+        self._search += 1
+        stamp = self._search
+        closed = self._closed
+
+        while open_list:
+            distance, node = heappop(open_list)
+            if closed[node] == stamp:
+                continue
+            closed[node] = stamp
+
+            # every neighbor pays the cost of stepping onto this node
+            cost = costs[node]
+            y, x = divmod(node, width)
+            for dx, dy, length in self._directions:
+                nx = x + dx
+                ny = y + dy
+                if nx < 0 or ny < 0 or nx >= width or ny >= height:
+                    continue
+                neighbor = ny * width + nx
+                if closed[neighbor] == stamp:
+                    continue
+                neighbor_distance = distance + length * cost
+                if distances[neighbor] < 0 or neighbor_distance < distances[neighbor]:
+                    distances[neighbor] = neighbor_distance
+                    next_steps[neighbor] = node
+                    # an impassable cell only gets a way off it, for someone a building went up under
+                    if costs[neighbor]:
+                        heappush(open_list, (neighbor_distance, neighbor))
+
+        logger.debug("Built flow field towards {} goal cells.", len(goals))
+        return FlowField(
+            width, np.array(distances, dtype=np.float32), np.array(next_steps, dtype=np.int32), self._grid.get_version()
+        )
+
+    def _backtrace(self, start_index: int, end_index: int) -> List[Location]:
+        width = self._width
+        parent = self._parent
+        path: List[Location] = []
+        node = end_index
+        while node != start_index:
+            y, x = divmod(node, width)
+            path.append(Location(x, y))
+            node = parent[node]
+        y, x = divmod(start_index, width)
+        path.append(Location(x, y))
+        path.reverse()
+        return path
+
+    def patch_costs(self, indices: List[int], cost: int) -> None:
+        """Called by the grid after the cells at the given flat indices changed to cost."""
+        costs = self._costs
+        for index in indices:
+            costs[index] = cost
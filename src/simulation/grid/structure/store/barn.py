@@ -13,7 +13,7 @@ if TYPE_CHECKING:
 
 class Barn(Store):
     def __init__(self, grid: Grid, location: Location) -> None:
-        logger.debug(f"Initializing Barn at location {location}")
+        logger.debug("Initializing Barn at location {}", location)
 
         allowed_resources = {
             "food": settings.get("barn_food_store", 500),
@@ -21,7 +21,7 @@ class Barn(Store):
             "wood": settings.get("barn_wood_store", 200),
         }
 
-        logger.debug(f"Allowed resources for the Barn: {allowed_resources}")
+        logger.debug("Allowed resources for the Barn: {}", allowed_resources)
 
         super().__init__(
             grid,
@@ -32,4 +32,4 @@ class Barn(Store):
             allowed_resources,
         )
 
-        logger.info(f"Barn initialized at location {location} with allowed resources.")
+        logger.info("Barn initialized at location {} with allowed resources.", location)
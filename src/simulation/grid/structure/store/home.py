@@ -14,11 +14,11 @@ if TYPE_CHECKING:
 
 class Home(Store):
     def __init__(self, grid: Grid, location: Location) -> None:
-        logger.debug(f"Initializing Home at location {location}")
+        logger.debug("Initializing Home at location {}", location)
 
         allowed_resources = {"food": settings.get("home_food_store", 36)}  # Only food can be stored
 
-        logger.debug(f"Allowed resources for the Home: {allowed_resources}")
+        logger.debug("Allowed resources for the Home: {}", allowed_resources)
 
         super().__init__(
             grid,
@@ -30,18 +30,18 @@ class Home(Store):
         )
 
         self._owner: Optional[Person] = None
-        logger.info(f"Home initialized at location {location}.")
+        logger.info("Home initialized at location {}.", location)
 
     def has_owner(self) -> bool:
-        logger.debug(f"Checking if Home has an owner.")
+        logger.debug("Checking if Home has an owner.")
         return self._owner is not None
 
     def assign_owner(self, person: Optional[Person]) -> None:
-        logger.info(f"Assigning owner {person} to the Home.")
+        logger.info("Assigning owner {} to the Home.", person)
         self._owner = person
 
     def remove_owner(self) -> None:
-        logger.info(f"Removing owner from the Home.")
+        logger.info("Removing owner from the Home.")
         if self._owner:
             self._owner.remove_home()
         self._owner = None
@@ -21,7 +21,7 @@ class Store(Structure, ABC):
         char: str,
         allowed_resources: Dict[str, int],  # Resources and their max capacities
     ):
-        logger.debug(f"Initializing Store at location {location}, size ({width}, {height}), character {char}")
+        logger.debug("Initializing Store at location {}, size ({}, {}), character {}", location, width, height, char)
 
         super().__init__(grid, location, width, height, char)
 
@@ -31,7 +31,7 @@ class Store(Structure, ABC):
         # Store the max capacity for all resources combined (this is the overall capacity of the store)
         self._capacity = sum(allowed_resources.values())
 
-        logger.debug(f"Store capacity initialized: {self._capacity} (Total of allowed resources' capacities)")
+        logger.debug("Store capacity initialized: {} (Total of allowed resources' capacities)", self._capacity)
 
     @override
     def has_capacity(self) -> bool:
@@ -40,7 +40,7 @@ class Store(Structure, ABC):
         This method ensures that the sum of all stored resources does not exceed the store's capacity.
         """
         total_stored = sum(self._resources.values())
-        logger.debug(f"Checking capacity: Total stored = {total_stored}, Total capacity = {self._capacity}")
+        logger.debug("Checking capacity: Total stored = {}, Total capacity = {}", total_stored, self._capacity)
         return total_stored < self._capacity
 
     @staticmethod
@@ -60,14 +60,14 @@ class Store(Structure, ABC):
         Adds a resource to the store, respecting the collective capacity limit.
         """
         if resource not in self._resources:
-            logger.error(f"Attempted to add unsupported resource: {resource}")
+            logger.error("Attempted to add unsupported resource: {}", resource)
             raise ValueError(f"Resource {resource} is not supported by this store.")
 
-        logger.debug(f"Attempting to add {amount} of {resource} to the store.")
+        logger.debug("Attempting to add {} of {} to the store.", amount, resource)
 
         if self.has_capacity():
             self._resources[resource] += amount
-            logger.info(f"Added {amount} of {resource} to the store. Current amount: {self._resources[resource]}")
+            logger.info("Added {} of {} to the store. Current amount: {}", amount, resource, self._resources[resource])
         else:
             logger.error("Not enough capacity to add more resources.")
             raise ValueError("Not enough capacity to add more resources to the store.")
@@ -77,14 +77,14 @@ class Store(Structure, ABC):
         Removes a resource from the store, returns the amount removed.
         """
         if resource not in self._resources:
-            logger.error(f"Attempted to remove unsupported resource: {resource}")
+            logger.error("Attempted to remove unsupported resource: {}", resource)
             raise ValueError(f"Resource {resource} is not supported by this store.")
 
         available = self._resources[resource]
         removed = min(available, amount)
         self._resources[resource] -= removed
 
-        logger.info(f"Removed {removed} of {resource} from the store. Remaining: {self._resources[resource]}")
+        logger.info("Removed {} of {} from the store. Remaining: {}", removed, resource, self._resources[resource])
         return removed
 
     def get_resource(self, resource: str) -> int:
@@ -92,7 +92,7 @@ class Store(Structure, ABC):
         Returns the current amount of a resource stored.
         """
         amount = self._resources.get(resource, 0)
-        logger.debug(f"Retrieved {amount} of {resource} from the store.")
+        logger.debug("Retrieved {} of {} from the store.", amount, resource)
         return amount
 
     def get_remaining_capacity(self) -> int:
@@ -102,12 +102,12 @@ class Store(Structure, ABC):
         """
         total_stored = sum(self._resources.values())
         remaining_capacity = self._capacity - total_stored
-        logger.debug(f"Remaining capacity: {remaining_capacity}")
+        logger.debug("Remaining capacity: {}", remaining_capacity)
         return remaining_capacity
 
     def get_capacity(self) -> int:
         """
         Returns the total capacity of the store (sum of all allowed resources' capacities).
         """
-        logger.debug(f"Store total capacity: {self._capacity}")
+        logger.debug("Store total capacity: {}", self._capacity)
         return self._capacity
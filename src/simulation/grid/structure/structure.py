@@ -20,7 +20,7 @@ class Structure(ABC):
         height: int,
         char: str,
     ):
-        logger.debug(f"Initializing structure at {location}, size: {width}x{height}, char: {char}")
+        logger.debug("Initializing structure at {}, size: {}x{}, char: {}", location, width, height, char)
 
         self._grid: Grid = grid
         self._location = location
@@ -29,6 +29,9 @@ class Structure(ABC):
         self._char: str = char
         if not self._grid.is_char(location, char):  # this is important for the first pass on the grid
             self._add_structure_on_grid()
+        else:
+            # already drawn on the grid, only record which cells belong to it
+            self._grid.claim_region(self._location, self._width, self._height)
 
     def _validate_structure_area(self, is_adding: bool) -> None:
         """
@@ -39,27 +42,27 @@ class Structure(ABC):
         :param is_adding: True if adding a structure, False if removing a structure.
         """
         logger.debug(
-            f"Validating structure area at {self._location}, size: {self._width}x{self._height}, adding: {is_adding}"
+            "Validating structure area at {}, size: {}x{}, adding: {}",
+            self._location,
+            self._width,
+            self._height,
+            is_adding,
         )
 
-        for dy in range(self._height):
-            for dx in range(self._width):
-                location = Location(self._location.x + dx, self._location.y + dy)
+        # Check if the whole area is within bounds
+        if not self._grid.is_region_in_bounds(self._location, self._width, self._height):
+            raise ValueError(f"Area at {self._location} of size {self._width}x{self._height} is out of bounds")
 
-                # Check if the location is within bounds
-                if not self._grid.is_in_bounds(location):
-                    raise ValueError(f"Location {location} is out of bounds")
+        # Check if adding: every location must be empty or contain a tree
+        if is_adding:
+            allowed = [settings.get("empty_char", " "), settings.get("tree_char", "*")]
+            if not self._grid.region_matches(self._location, self._width, self._height, allowed):
+                raise ValueError(f"Area at {self._location} is already occupied by another building")
+        # Check if removing: every location must be occupied by the structure
+        elif not self._grid.region_matches(self._location, self._width, self._height, [self._char]):
+            raise ValueError(f"No structure found at {self._location} to remove")
 
-                # Check if adding: location must be empty or contain a tree
-                if is_adding:
-                    if not self._grid.is_empty(location) and not self._grid.is_tree(location):
-                        raise ValueError(f"Location {location} is already occupied by another building or tree")
-                # Check if removing: location must be occupied by the structure
-                else:
-                    if self._grid.get_grid()[location.y][location.x] != self._char:
-                        raise ValueError(f"No structure found at {location} to remove")
-
-        logger.debug(f"Validation passed for area at {self._location}")
+        logger.debug("Validation passed for area at {}", self._location)
 
     def _add_structure_on_grid(self) -> None:
         """
@@ -67,7 +70,7 @@ class Structure(ABC):
         and ensuring no overlap with existing structures or trees.
         Construction can only start once all required resources are delivered.
         """
-        logger.debug(f"Adding structure at {self._location}, char: {self._char}")
+        logger.debug("Adding structure at {}, char: {}", self._location, self._char)
 
         if self._char == settings.get("tree_char", "*"):
             return
@@ -76,15 +79,13 @@ class Structure(ABC):
         self._validate_structure_area(is_adding=True)
 
         # If all checks pass, place the structure on the grid
-        for dy in range(self._height):
-            for dx in range(self._width):
-                location = Location(self._location.x + dx, self._location.y + dy)
-                self._grid.get_grid()[location.y][location.x] = self._char
+        self._grid.fill_region(self._location, self._width, self._height, self._char)
+        self._grid.claim_region(self._location, self._width, self._height)
 
-        logger.info(f"Structure added at {self._location}, char: {self._char}")
+        logger.info("Structure added at {}, char: {}", self._location, self._char)
 
     def remove(self) -> None:
-        logger.debug(f"Removing structure at {self._location}, char: {self._char}")
+        logger.debug("Removing structure at {}, char: {}", self._location, self._char)
         self._remove_structure_on_grid()
 
     def _remove_structure_on_grid(self) -> None:
@@ -93,19 +94,16 @@ class Structure(ABC):
         occupied by the structure. It checks if the structure is present at the
         specified location and only removes it if no other structures are in the way.
         """
-        logger.debug(f"Removing structure at {self._location}, char: {self._char}")
+        logger.debug("Removing structure at {}, char: {}", self._location, self._char)
 
         # Validate the area before removing the structure
         self._validate_structure_area(is_adding=False)
 
         # If all checks pass, proceed to remove the structure
-        for dy in range(self._height):
-            for dx in range(self._width):
-                location = Location(self._location.x + dx, self._location.y + dy)
-                # Clear the cell (remove the structure)
-                self._grid.get_grid()[location.y][location.x] = settings.get("empty_char", " ")
+        self._grid.fill_region(self._location, self._width, self._height, settings.get("empty_char", " "))
+        self._grid.release_region(self._location, self._width, self._height)
 
-        logger.info(f"Structure removed at {self._location}, char: {self._char}")
+        logger.info("Structure removed at {}, char: {}", self._location, self._char)
 
     def get_location(self):
         return self._location
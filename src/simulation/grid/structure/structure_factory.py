@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import logging
-from typing import TYPE_CHECKING, Dict, Type
+from typing import TYPE_CHECKING, Dict, List, Type
 
+from src.logger import logger
 from src.simulation.grid.structure.store.barn import Barn
 from src.simulation.grid.structure.store.home import Home
 from src.simulation.grid.structure.structure import Structure
@@ -23,10 +23,6 @@ if TYPE_CHECKING:
     from src.simulation.grid.grid import Grid
     from src.simulation.grid.location import Location
 
-# Set up logging
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-
 
 class StructureFactory:
     _constructors: Dict[StructureType, Type[Structure]] = {
@@ -41,20 +37,37 @@ class StructureFactory:
         StructureType.CONSTRUCTION_MINE: ConstructionMine,
     }
 
+    _structure_types: Dict[Type[Structure], StructureType] = {
+        constructor: structure_type for structure_type, constructor in _constructors.items()
+    }
+
     def __init__(self, grid: Grid) -> None:
         self._grid = grid
-        logger.debug(f"StructureFactory initialized with grid: {self._grid}")
+        logger.debug("StructureFactory initialized with grid: {}", self._grid)
 
     def create_instance(self, building_type: StructureType, location: Location) -> Structure:
-        logger.debug(f"Creating structure of type {building_type} at location {location}")
+        logger.debug("Creating structure of type {} at location {}", building_type, location)
 
         # Check if building_type is valid
         if building_type not in self._constructors:
-            logger.error(f"Invalid structure type: {building_type}")
+            logger.error("Invalid structure type: {}", building_type)
             raise ValueError(f"Invalid structure type: {building_type}")
 
         building_class: Type[Structure] = self._constructors[building_type]
         structure = building_class(self._grid, location)
 
-        logger.info(f"Structure of type {building_type} created at location {location}")
+        logger.info("Structure of type {} created at location {}", building_type, location)
         return structure
+
+    @classmethod
+    def get_structure_type(cls, structure: Structure) -> StructureType:
+        return cls._structure_types[type(structure)]
+
+    @classmethod
+    def get_structure_types(cls, structure_class: Type[Structure]) -> List[StructureType]:
+        """Every structure type whose class is structure_class or inherits from it."""
+        return [
+            structure_type
+            for constructor, structure_type in cls._structure_types.items()
+            if issubclass(constructor, structure_class)
+        ]
@@ -40,29 +40,36 @@ class Construction(Work, ABC):
         self._max_worker_count: int = max_worker_count
         self._max_work_count: int = max_work_count
         logger.debug(
-            f"Construction initialized with required wood: {required_wood}, required stone: {required_stone}, max work count: {max_work_count}"
+            "Construction initialized with required wood: {}, required stone: {}, max work count: {}",
+            required_wood,
+            required_stone,
+            max_work_count,
         )
+        if not self.has_capacity():
+            self._grid.add_completed_construction(self)
 
     def deliver_wood(self, amount: int) -> None:
         self._delivered_wood += amount
         if self._delivered_wood > self._required_wood:
             self._delivered_wood = self._required_wood
-        logger.info(f"Delivered {amount} wood. Total wood delivered: {self._delivered_wood}/{self._required_wood}")
+        logger.info("Delivered {} wood. Total wood delivered: {}/{}", amount, self._delivered_wood, self._required_wood)
 
     def deliver_stone(self, amount: int) -> None:
         self._delivered_stone += amount
         if self._delivered_stone > self._required_stone:
             self._delivered_stone = self._required_stone
-        logger.info(f"Delivered {amount} stone. Total stone delivered: {self._delivered_stone}/{self._required_stone}")
+        logger.info(
+            "Delivered {} stone. Total stone delivered: {}/{}", amount, self._delivered_stone, self._required_stone
+        )
 
     def needs_stone(self) -> bool:
         needs = self._delivered_stone < self._required_stone
-        logger.debug(f"Needs stone: {needs}")
+        logger.debug("Needs stone: {}", needs)
         return needs
 
     def needs_wood(self) -> bool:
         needs = self._delivered_wood < self._required_wood
-        logger.debug(f"Needs wood: {needs}")
+        logger.debug("Needs wood: {}", needs)
         return needs
     
     def needs_build(self) -> bool:
@@ -70,12 +77,12 @@ class Construction(Work, ABC):
 
     def how_much_stone(self) -> int:
         remaining_stone = self._required_stone - self._delivered_stone
-        logger.debug(f"How much stone needed: {remaining_stone}")
+        logger.debug("How much stone needed: {}", remaining_stone)
         return remaining_stone
 
     def how_much_wood(self) -> int:
         remaining_wood = self._required_wood - self._delivered_wood
-        logger.debug(f"How much wood needed: {remaining_wood}")
+        logger.debug("How much wood needed: {}", remaining_wood)
         return remaining_wood
 
     @override
@@ -83,29 +90,37 @@ class Construction(Work, ABC):
         if person in self._workers:
             self._workers[person] += 1
         elif len(self._workers) < self._max_worker_count:
-            self._workers[person] = 1
+            self._add_worker(person)
 
         if self._workers[person] > self._max_work_count:
             self.remove_worker(person)
             self._current_completion_level += 1
             logger.info(
-                f"Worker {person.get_name()} finished work. Current completion level: {self._current_completion_level}/{self._finished_completion_level}"
+                "Worker {} finished work. Current completion level: {}/{}",
+                person.get_name(),
+                self._current_completion_level,
+                self._finished_completion_level,
             )
+            if self._current_completion_level == self._finished_completion_level:
+                self._grid.add_completed_construction(self)
             return int(self._get_yield())
 
         logger.debug(
-            f"Worker {person.get_name()} assigned. Current completion level: {self._current_completion_level}/{self._finished_completion_level}"
+            "Worker {} assigned. Current completion level: {}/{}",
+            person.get_name(),
+            self._current_completion_level,
+            self._finished_completion_level,
         )
         return None
 
     @override
     def work_time_estimate(self) -> int:
         time_left = (self._finished_completion_level - self._current_completion_level) * self._max_work_count
-        logger.debug(f"Work time estimate: {time_left}")
+        logger.debug("Work time estimate: {}", time_left)
         return time_left
 
     @override
     def has_capacity(self) -> bool:
         capacity = self._current_completion_level < self._finished_completion_level
-        logger.debug(f"Has capacity: {capacity}")
+        logger.debug("Has capacity: {}", capacity)
         return capacity
@@ -14,7 +14,7 @@ if TYPE_CHECKING:
 
 class ConstructionBarn(Construction):
     def __init__(self, grid: Grid, location: Location):
-        logger.debug(f"Initializing ConstructionBarn at location {location}")
+        logger.debug("Initializing ConstructionBarn at location {}", location)
 
         super().__init__(
             grid,
@@ -30,9 +30,10 @@ class ConstructionBarn(Construction):
         )
 
         logger.info(
-            f"ConstructionBarn initialized with required wood: {settings.get('barn_req_wood', 60)}, "
-            f"required stone: {settings.get('barn_req_stone', 30)}, "
-            f"max workers: {settings.get('barn_max_construction_worker_count', 3)}, "
-            f"max work count: {settings.get('barn_max_construction_work_count', 3)}, "
-            f"finished completion level: {settings.get('barn_finished_completion_level', 5)}"
+            "ConstructionBarn initialized with required wood: {}, required stone: {}, max workers: {}, max work count: {}, finished completion level: {}",
+            settings.get('barn_req_wood', 60),
+            settings.get('barn_req_stone', 30),
+            settings.get('barn_max_construction_worker_count', 3),
+            settings.get('barn_max_construction_work_count', 3),
+            settings.get('barn_finished_completion_level', 5),
         )
@@ -14,7 +14,7 @@ if TYPE_CHECKING:
 
 class ConstructionFarm(Construction):
     def __init__(self, grid: Grid, location: Location):
-        logger.debug(f"Initializing ConstructionFarm at location {location}")
+        logger.debug("Initializing ConstructionFarm at location {}", location)
 
         super().__init__(
             grid,
@@ -30,9 +30,10 @@ class ConstructionFarm(Construction):
         )
 
         logger.info(
-            f"ConstructionFarm initialized with required wood: {settings.get('farm_req_wood', 30)}, "
-            f"required stone: {settings.get('farm_req_stone', 0)}, "
-            f"max workers: {settings.get('farm_max_construction_worker_count', 3)}, "
-            f"max work count: {settings.get('farm_max_construction_work_count', 2)}, "
-            f"finished completion level: {settings.get('farm_finished_completion_level', 3)}"
+            "ConstructionFarm initialized with required wood: {}, required stone: {}, max workers: {}, max work count: {}, finished completion level: {}",
+            settings.get('farm_req_wood', 30),
+            settings.get('farm_req_stone', 0),
+            settings.get('farm_max_construction_worker_count', 3),
+            settings.get('farm_max_construction_work_count', 2),
+            settings.get('farm_finished_completion_level', 3),
         )
@@ -14,7 +14,7 @@ if TYPE_CHECKING:
 
 class ConstructionHome(Construction):
     def __init__(self, grid: Grid, location: Location):
-        logger.debug(f"Initializing ConstructionHome at location {location}")
+        logger.debug("Initializing ConstructionHome at location {}", location)
 
         super().__init__(
             grid,
@@ -30,9 +30,10 @@ class ConstructionHome(Construction):
         )
 
         logger.info(
-            f"ConstructionHome initialized with required wood: {settings.get('home_req_wood', 20)}, "
-            f"required stone: {settings.get('home_req_stone', 10)}, "
-            f"max workers: {settings.get('home_max_construction_worker_count', 2)}, "
-            f"max work count: {settings.get('home_max_construction_work_count', 2)}, "
-            f"finished completion level: {settings.get('home_finished_completion_level', 3)}"
+            "ConstructionHome initialized with required wood: {}, required stone: {}, max workers: {}, max work count: {}, finished completion level: {}",
+            settings.get('home_req_wood', 20),
+            settings.get('home_req_stone', 10),
+            settings.get('home_max_construction_worker_count', 2),
+            settings.get('home_max_construction_work_count', 2),
+            settings.get('home_finished_completion_level', 3),
         )
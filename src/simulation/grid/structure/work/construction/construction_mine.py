@@ -14,7 +14,7 @@ if TYPE_CHECKING:
 
 class ConstructionMine(Construction):
     def __init__(self, grid: Grid, location: Location):
-        logger.debug(f"Initializing ConstructionMine at location {location}")
+        logger.debug("Initializing ConstructionMine at location {}", location)
 
         super().__init__(
             grid,
@@ -30,9 +30,10 @@ class ConstructionMine(Construction):
         )
 
         logger.info(
-            f"ConstructionMine initialized with required wood: {settings.get('mine_req_wood', 40)}, "
-            f"required stone: {settings.get('mine_req_stone', 40)}, "
-            f"max workers: {settings.get('mine_max_construction_worker_count', 3)}, "
-            f"max work count: {settings.get('mine_max_construction_work_count', 5)}, "
-            f"finished completion level: {settings.get('mine_finished_completion_level', 5)}"
+            "ConstructionMine initialized with required wood: {}, required stone: {}, max workers: {}, max work count: {}, finished completion level: {}",
+            settings.get('mine_req_wood', 40),
+            settings.get('mine_req_stone', 40),
+            settings.get('mine_max_construction_worker_count', 3),
+            settings.get('mine_max_construction_work_count', 5),
+            settings.get('mine_finished_completion_level', 5),
         )
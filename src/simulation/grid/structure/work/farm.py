@@ -15,7 +15,7 @@ if TYPE_CHECKING:
 
 class Farm(Work):
     def __init__(self, grid: Grid, location: Location) -> None:
-        logger.debug(f"Initializing Farm at location {location}")
+        logger.debug("Initializing Farm at location {}", location)
 
         max_worker_count: int = settings.get("farm_max_worker_count", 3)
         max_work_count: int = settings.get("farm_max_work_count", 3)
@@ -35,10 +35,11 @@ class Farm(Work):
         )
 
         logger.info(
-            f"Farm initialized with max workers: {max_worker_count}, "
-            f"max work count: {max_work_count}, "
-            f"yield variance: {yield_variance:.2f}, "
-            f"size: {settings.get('farm_size', 5)}"
+            "Farm initialized with max workers: {}, max work count: {}, yield variance: {:.2f}, size: {}",
+            max_worker_count,
+            max_work_count,
+            yield_variance,
+            settings.get('farm_size', 5),
         )
 
     def _get_yield(self) -> float:
@@ -65,6 +66,6 @@ class Farm(Work):
         # Linearly scale the yield factor to range between min_yield and max_yield
         adjusted_yield: float = min_yield + (max_yield - min_yield) * yield_factor
 
-        logger.debug(f"Calculated farm yield: {adjusted_yield:.2f} (Temperature: {temp}°F)")
+        logger.debug("Calculated farm yield: {:.2f} (Temperature: {}°F)", adjusted_yield, temp)
 
         return adjusted_yield
@@ -15,7 +15,7 @@ if TYPE_CHECKING:
 
 class Mine(Work):
     def __init__(self, grid: Grid, location: Location) -> None:
-        logger.debug(f"Initializing Mine at location {location}")
+        logger.debug("Initializing Mine at location {}", location)
 
         max_worker_count: int = settings.get("mine_max_worker_count", 6)
         max_work_count: int = settings.get("mine_max_work_count", 4)
@@ -38,8 +38,9 @@ class Mine(Work):
         )
 
         logger.info(
-            f"Mine initialized with max workers: {max_worker_count}, "
-            f"max work count: {max_work_count}, "
-            f"yield variance: {yield_variance:.2f}, "
-            f"size: {settings.get('mine_size', 3)}"
+            "Mine initialized with max workers: {}, max work count: {}, yield variance: {:.2f}, size: {}",
+            max_worker_count,
+            max_work_count,
+            yield_variance,
+            settings.get('mine_size', 3),
         )
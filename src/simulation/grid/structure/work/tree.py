@@ -15,7 +15,7 @@ if TYPE_CHECKING:
 
 class Tree(Work):
     def __init__(self, grid: Grid, location: Location) -> None:
-        logger.debug(f"Initializing Tree at location {location}")
+        logger.debug("Initializing Tree at location {}", location)
 
         max_worker_count: int = settings.get("tree_max_worker_count", 1)
         max_work_count: int = settings.get("tree_max_work_count", 2)
@@ -38,8 +38,9 @@ class Tree(Work):
         )
 
         logger.debug(
-            f"Tree initialized with max workers: {max_worker_count}, "
-            f"max work count: {max_work_count}, "
-            f"yield variance: {yield_variance:.2f}, "
-            f"size: {settings.get('tree_size', 1)}"
+            "Tree initialized with max workers: {}, max work count: {}, yield variance: {:.2f}, size: {}",
+            max_worker_count,
+            max_work_count,
+            yield_variance,
+            settings.get('tree_size', 1),
         )
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-import itertools
 from abc import ABC
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 
 from src.logger import logger
 from src.simulation.grid.structure.structure import Structure
@@ -26,7 +25,7 @@ class Work(Structure, ABC):
         yield_func: Callable[[], float],
         yield_variance: float,
     ):
-        logger.debug(f"Initializing Work at location {location}, size: {width}x{height}")
+        logger.debug("Initializing Work at location {}, size: {}x{}", location, width, height)
 
         super().__init__(grid, location, width, height, char)
         self._max_worker_count = max_worker_count
@@ -37,22 +36,23 @@ class Work(Structure, ABC):
         self._decrease_yield_time: int = 0
 
         logger.debug(
-            f"Work initialized with max workers: {max_worker_count}, "
-            f"max work count: {max_work_count}, "
-            f"yield variance: {yield_variance:.2f}"
+            "Work initialized with max workers: {}, max work count: {}, yield variance: {:.2f}",
+            max_worker_count,
+            max_work_count,
+            yield_variance,
         )
 
     def set_yield_func(self, yield_func: Callable[[], float]):
         self._yield_func = yield_func
-        logger.debug(f"Yield function set to: {yield_func}")
+        logger.debug("Yield function set to: {}", yield_func)
 
     def get_yield_func(self) -> Callable[[], float]:
-        logger.debug(f"Getting yield function: {self._yield_func}")
+        logger.debug("Getting yield function: {}", self._yield_func)
         return self._yield_func
 
     def decrease_yield(self) -> None:
         self._decrease_yield_time = self._grid.get_time()
-        logger.debug(f"Yield decreased at time {self._decrease_yield_time}")
+        logger.debug("Yield decreased at time {}", self._decrease_yield_time)
 
     def has_capacity(self) -> bool:
         """
@@ -60,7 +60,10 @@ class Work(Structure, ABC):
         """
         capacity = len(self._workers) < self._max_worker_count
         logger.debug(
-            f"Checking capacity: {capacity} (current workers: {len(self._workers)}, max workers: {self._max_worker_count})"
+            "Checking capacity: {} (current workers: {}, max workers: {})",
+            capacity,
+            len(self._workers),
+            self._max_worker_count,
         )
         return capacity
 
@@ -68,53 +71,63 @@ class Work(Structure, ABC):
         """
         Returns the work time estimate for this type of work.
         """
-        logger.debug(f"Work time estimate: {self._max_work_count}")
+        logger.debug("Work time estimate: {}", self._max_work_count)
         return self._max_work_count
 
     def work(self, person: Person) -> Optional[int]:
         """
         Assign a worker to the work, track work progress, and return the yield if max work count is reached.
         """
-        logger.debug(f"Assigning worker {person.get_name()} to work")
+        logger.debug("Assigning worker {} to work", person.get_name())
 
         if person in self._workers:
             self._workers[person] += 1
-            logger.debug(f"Worker {person.get_name()} already working, increasing count to {self._workers[person]}")
+            logger.debug("Worker {} already working, increasing count to {}", person.get_name(), self._workers[person])
         elif len(self._workers) < self._max_worker_count:
-            self._workers[person] = 1
-            logger.debug(f"Worker {person.get_name()} added to work site")
+            self._add_worker(person)
+            logger.debug("Worker {} added to work site", person.get_name())
 
         if self._workers[person] > self._max_work_count:
             self.remove_worker(person)
             y: int = int(self._get_yield())
             if self._decrease_yield_time != 0 and self._grid.get_time() - self._decrease_yield_time > 50:
                 y = y // 2
-                logger.debug(f"Yield decreased due to time passed since last decrease. Yield halved: {y}")
+                logger.debug("Yield decreased due to time passed since last decrease. Yield halved: {}", y)
             self._decrease_yield_time = 0
-            logger.info(f"Work complete for {person.get_name()}, yield: {y}")
+            logger.info("Work complete for {}, yield: {}", person.get_name(), y)
             return y
 
         return None
 
+    def _add_worker(self, person: Person) -> None:
+        self._workers[person] = 1
+        if len(self._workers) == 2:
+            self._grid.add_shared_work_site(self)
+
     def remove_worker(self, person: Person) -> None:
         """
         Remove a worker from the work site.
         """
         if person in self._workers:
             del self._workers[person]
-            logger.debug(f"Worker {person.get_name()} removed from work site")
+            logger.debug("Worker {} removed from work site", person.get_name())
+            if len(self._workers) == 1:
+                self._grid.remove_shared_work_site(self)
+
+    def has_shared_workers(self) -> bool:
+        return len(self._workers) >= 2
 
     def _get_yield(self) -> float:
         """
         Each subclass should define how to generate the yield, if needed.
         """
         yield_value = self._yield_func() + self._yield_variance
-        logger.debug(f"Calculated yield: {yield_value}")
+        logger.debug("Calculated yield: {}", yield_value)
         return yield_value
 
     def exchange_worker_memories(self):
         workers: List[Person] = list(self._workers.keys())
-        pairs: List[Tuple[Person, Person]] = list(itertools.combinations(workers, 2))
-        logger.debug(f"Exchanging memories between workers: {workers}")
-        for pair in pairs:
-            pair[0].exchange_memories(pair[1])
+        if len(workers) < 2:
+            return
+        logger.debug("Exchanging memories between workers: {}", workers)
+        workers[0].share_memories(workers[1:])
@@ -18,25 +18,25 @@ class HomeManager:
         logger.debug("Start swapping homes")
         # Step 1: Get the people who are far from their work centers
         far_people: Dict[Person, Location] = self._get_peoples_centers()
-        logger.debug(f"Found {len(far_people)} people far from work centers")
+        logger.debug("Found {} people far from work centers", len(far_people))
 
         # Step 2: Remove people whose homes are near their work centers
         far_people = self._filter_people_near_centers(far_people)
-        logger.debug(f"Removed people whose homes are near work centers, now {len(far_people)}far people")
+        logger.debug("Removed people whose homes are near work centers, now {}far people", len(far_people))
 
         # Step 3: Match and swap homes for people within 20 blocks
         matches: List[Tuple[Person, Person]] = self._find_matches(far_people, 20)
         self._swap_home_assignments(matches)
-        logger.debug(f"Swapped homes for those within 20 blocks")
+        logger.debug("Swapped homes for those within 20 blocks")
 
         # Step 4: Remove matched people from the list
         self._remove_matched_people(far_people, matches)
-        logger.debug(f"Removed matched people from list")
+        logger.debug("Removed matched people from list")
 
         # Step 5: Match and swap homes for people within 40 units
         matches = self._find_matches(far_people, 40)
         self._swap_home_assignments(matches)
-        logger.debug(f"Swapped homes for those within 40 blocks")
+        logger.debug("Swapped homes for those within 40 blocks")
 
     @staticmethod
     def _remove_matched_people(far_people: Dict[Person, Location], matches: List[Tuple[Person, Person]]) -> None:
@@ -44,17 +44,17 @@ class HomeManager:
         for person1, person2 in matches:
             far_people.pop(person1, None)
             far_people.pop(person2, None)
-            logger.debug(f"Removed person {person1} and {person2}from far people")
+            logger.debug("Removed person {} and {}from far people", person1, person2)
 
     @staticmethod
     def _swap_home_assignments(matches: List[Tuple[Person, Person]]) -> None:
         """Swap homes between matched people"""
         for person1, person2 in matches:
             home1, home2 = person1.get_home(), person2.get_home()
-            logger.debug(f"{person1} old home {home1} and {person2} old home {home2}")
+            logger.debug("{} old home {} and {} old home {}", person1, home1, person2, home2)
             person1.assign_home(home2)
             person2.assign_home(home1)
-            logger.debug(f"{person1} new home {person1.get_home()} and {person2} new home {person2.get_home()}")
+            logger.debug("{} new home {} and {} new home {}", person1, person1.get_home(), person2, person2.get_home())
 
     @staticmethod
     def _find_matches(far_people: Dict[Person, Location], distance: int) -> List[Tuple[Person, Person]]:
@@ -64,19 +64,19 @@ class HomeManager:
 
         for person1, center1 in far_people.items():
             if person1 in matched_people:
-                logger.debug(f"{person1} is already matched")
+                logger.debug("{} is already matched", person1)
                 continue
 
             for person2, center2 in far_people.items():
                 if person2 in matched_people or person1 == person2:
-                    logger.debug(f"{person2} is already matched")
+                    logger.debug("{} is already matched", person2)
                     continue
 
                 if person1.get_home().get_location().is_near(center2, distance):
                     matches.append((person1, person2))
-                    logger.debug(f"{person1} and {person2} appended to matches")
+                    logger.debug("{} and {} appended to matches", person1, person2)
                     matched_people.update([person1, person2])
-                    logger.debug(f"{person1} and {person2} updated in matched people")
+                    logger.debug("{} and {} updated in matched people", person1, person2)
 
         return matches
 
@@ -86,11 +86,11 @@ class HomeManager:
         to_remove = [
             person for person, center in far_people.items() if person.get_home().get_location().is_near(center, 30)
         ]
-        logger.debug(f"Found {len(to_remove)} people whose homes are near their work centers")
+        logger.debug("Found {} people whose homes are near their work centers", len(to_remove))
         # Remove the filtered people from the far_people dictionary
         for person in to_remove:
             far_people.pop(person, None)
-        logger.debug(f"Removed people whose homes are near their work centers")
+        logger.debug("Removed people whose homes are near their work centers")
         return far_people
 
     def _get_peoples_centers(self) -> Dict[Person, Location]:
@@ -99,13 +99,13 @@ class HomeManager:
 
         for person in self._people:
             if not person.get_spouse():
-                logger.debug(f"{person.get_name()} has no spouse")
+                logger.debug("{} has no spouse", person.get_name())
                 center = self._calculate_center(person.get_work_structures())
                 if center:
                     far_people[person] = center
-                    logger.debug(f"{person.get_name()} has {center} and added to far people")
+                    logger.debug("{} has {} and added to far people", person.get_name(), center)
                 else:
-                    logger.debug(f"{person.get_name()} has no work structures, therefore no center.")
+                    logger.debug("{} has no work structures, therefore no center.", person.get_name())
 
         for person in self._people.get_married_people():
             person_center = self._calculate_center(person.get_work_structures())
@@ -122,7 +122,9 @@ class HomeManager:
                     far_people[person] = combined_center
                 else:
                     continue
-                logger.debug(f"{person.get_name()} has spouse, and combined center {combined_center} and added to far people")
+                logger.debug(
+                    "{} has spouse, and combined center {} and added to far people", person.get_name(), combined_center
+                )
 
         return far_people
 
@@ -134,8 +136,8 @@ class HomeManager:
             return None
 
         total_x, total_y = sum(location.x for location in locations), sum(location.y for location in locations)
-        logger.debug(f'total x: {total_x}, total y: {total_y}, number of structures: {len(locations)}')
+        logger.debug("total x: {}, total y: {}, number of structures: {}", total_x, total_y, len(locations))
         avg_x, avg_y = total_x // len(locations), total_y // len(locations)
-        logger.debug(f'avg x: {avg_x}, avg y: {avg_y}')
+        logger.debug("avg x: {}, avg y: {}", avg_x, avg_y)
 
         return Location(avg_x, avg_y)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from copy import deepcopy
 from typing import TYPE_CHECKING, Dict, Iterator, List
 
 from src.settings import settings
@@ -30,18 +29,21 @@ class People:
     def take_actions_for_day(self) -> None:
         for action in range(self._actions_per_day):
             self._simulation.increment_time()
+            # everyone forgets before anyone talks, so nobody passes on a memory that has just expired
+            for person in self._people:
+                person.get_memories().forget_expired()
             dead: List[Person] = []
             for person in self._people:
                 if person.is_dead():
                     dead.append(person)
                     continue
                 person.take_action()
-                logger.debug(f"{person.get_name()} should have taken action for the {action} time.")
+                logger.debug("{} should have taken action for the {} time.", person.get_name(), action)
                 logger.debug("These people are talking a lot and should have gotten others memories.")
             for person in dead:
                 person.divorce()
                 self._people.remove(person)
-                logger.info(f"{person.get_name()} is dead. Their spouse is widowed. :(")
+                logger.info("{} is dead. Their spouse is widowed. :(", person.get_name())
             if action % 3 == 0:
                 self._grid.work_structures_exchange_memories()  # workers talk while working
 
@@ -53,12 +55,12 @@ class People:
             if person.is_stuck():
                 person.kill()  # they got stuck and died
                 self._people.remove(person)
-                logger.info(f"{person.get_name()} got stuck and died. :(")
+                logger.info("{} got stuck and died. :(", person.get_name())
 
     def spouses_share_memory(self):
         for person in self.get_married_people():
             person.exchange_memories(person.get_spouse())
-            logger.debug(f"{person.get_name()} and {person.get_spouse().get_name()} should have shared memories.")
+            logger.debug("{} and {} should have shared memories.", person.get_name(), person.get_spouse().get_name())
 
     def get_time(self) -> int:
         return self._simulation.get_time()
@@ -73,7 +75,7 @@ class People:
 
     def generate_disasters(self, chance: float = settings.get("disaster_chance", 0.50)) -> None:
         self._disaster_generator.generate(chance)
-        logger.debug(f"Disasters generated at chance of {chance}")
+        logger.debug("Disasters generated at chance of {}", chance)
 
     def print(self) -> None:
         for person in self._people:
@@ -82,7 +84,7 @@ class People:
     def age(self) -> None:
         for person in self._people:
             person.age()
-        logger.info(f"{len(self._people)} people aged by one year")
+        logger.info("{} people aged by one year", len(self._people))
 
     def __len__(self) -> int:
         return len(self._people)
@@ -92,7 +94,7 @@ class People:
         for person in self._people:
             average_health += person.get_health()
         average_health /= len(self._people)
-        logger.debug(f"{len(self._people)} people have average of {average_health:.2f} health")
+        logger.debug("{} people have average of {:.2f} health", len(self._people), average_health)
         return average_health
 
     def get_average_hunger(self) -> float:
@@ -100,7 +102,7 @@ class People:
         for person in self._people:
             average_hunger += person.get_hunger()
         average_hunger /= len(self._people)
-        logger.debug(f"{len(self._people)} people have average of {average_hunger:.2f} hunger")
+        logger.debug("{} people have average of {:.2f} hunger", len(self._people), average_hunger)
         return average_hunger
 
     def make_babies(self) -> None:
@@ -112,8 +114,13 @@ class People:
                 and (person.get_spouse().get_age() <= settings.get("infertile_age", 50))
             ):
                 # create a baby next to the person's house
-                baby = self._people_generator.make_baby(deepcopy(person.get_location()))
-                logger.debug(f"Baby {baby} born at {person.get_location()}. Parents house is at {person.get_home().get_location()}")
+                baby = self._people_generator.make_baby(person.get_location())
+                logger.debug(
+                    "Baby {} born at {}. Parents house is at {}",
+                    baby,
+                    person.get_location(),
+                    person.get_home().get_location(),
+                )
                 self._people.append(baby)
 
     def get_married_people(self) -> List[Person]:
@@ -127,7 +134,7 @@ class People:
                 continue
             visited_people.append(person)
             visited_people.append(person.get_spouse())
-            logger.debug(f"{person.get_name()} is married to {person.get_spouse().get_name()}")
+            logger.debug("{} is married to {}", person.get_name(), person.get_spouse().get_name())
             if not person.has_home():
                 continue
             married_people.append(person)
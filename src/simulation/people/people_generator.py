@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import os
 import random
-from copy import deepcopy
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from src.logger import logger
 from src.settings import settings
 from src.simulation.grid.structure.store.home import Home
+from src.simulation.people.person.memories import Memories
+from src.simulation.people.person.memories_factory import MemoriesFactory
 from src.simulation.people.person.person import Person
 
 if TYPE_CHECKING:
@@ -23,6 +24,8 @@ class PeopleGenerator:
         total_people = sum(random.choice([1, 2]) for _ in range(home_count))
         self._max_pk = total_people
         self._simulation: Simulation = simulation
+        self._town_memories: Optional[Memories] = None
+        self._town_memories_key: Tuple[int, int] = (-1, -1)
 
     @staticmethod
     def _get_names() -> List[str]:
@@ -63,16 +66,18 @@ class PeopleGenerator:
         logger.debug("Generating people...")
         people: List[Person] = []
         names: List[str] = self._get_names()
-        empty_spots_near_town: List[Location] = self._grid.get_empty_spots_near_town()
         for pk in range(self._max_pk):
             name: str = random.choice(names)
-            location: Location = deepcopy(random.choice(empty_spots_near_town))
+            location: Optional[Location] = self._grid.get_random_empty_spot_near_town()
+            if not location:
+                logger.error("There is no empty spot near town to place people on.")
+                raise ValueError("No empty spots near town")
             age: int = random.randint(
                 settings.get("inital_spawn_age_min", 20), settings.get("inital_spawn_age_max", 30)
             )
             person: Person = self._make_person(name, pk, location, age)
             people.append(person)
-        logger.info(f"Generated {len(people)} people")
+        logger.info("Generated {} people", len(people))
         return people
 
     def make_baby(self, location: Location) -> Person:
@@ -80,11 +85,20 @@ class PeopleGenerator:
         age: int = 0
         self._max_pk += 1
         person: Person = self._make_person(name, self._max_pk, location, age)
-        logger.info(f"Baby {name} was born!")
+        logger.info("Baby {} was born!", name)
         return person
 
     def _make_person(self, name, pk, location, age) -> Person:
-        building_locations = list(self._grid.get_buildings().keys())
-        return Person(self._simulation, name, pk, location, age, building_locations)
+        return Person(self._simulation, name, pk, location, age, self._get_town_memories())
+
+    def _get_town_memories(self) -> Memories:
+        """Every building on the grid, remembered now. Shared by everyone born until the grid or the time moves."""
+        key = (self._grid.get_version(), self._simulation.get_time())
+        if self._town_memories is None or key != self._town_memories_key:
+            self._town_memories = MemoriesFactory.create(self._grid)
+            for location in self._grid.get_buildings():
+                self._town_memories.add(self._grid.get_char(location), location)
+            self._town_memories_key = key
+        return self._town_memories
 
 
@@ -18,7 +18,7 @@ class Backpack:
         self._capacity = sum(
             allowed_resources.values()
         )  # The total capacity is the sum of the allowed resources' capacities
-        logger.debug(f"Backpack initialized with resources: {self.resources} and total capacity: {self._capacity}.")
+        logger.debug("Backpack initialized with resources: {} and total capacity: {}.", self.resources, self._capacity)
 
     def has_capacity(self) -> bool:
         """
@@ -28,7 +28,7 @@ class Backpack:
         # Sum the resources stored and check if it is less than the store's total capacity
         total_stored = sum(self.resources.values())
         logger.info("Checking if backpack has capacity.")
-        logger.debug(f"Current total stored: {total_stored}, Total capacity: {self._capacity}.")
+        logger.debug("Current total stored: {}, Total capacity: {}.", total_stored, self._capacity)
         return total_stored < self._capacity
 
     def what_resource(self) -> Optional[str]:
@@ -43,7 +43,7 @@ class Backpack:
 
         # Find the resource with the highest quantity
         max_resource = max(self.resources, key=self.resources.get)
-        logger.debug(f"Resource with highest quantity: {max_resource}.")
+        logger.debug("Resource with highest quantity: {}.", max_resource)
 
         # If all resources have 0, return 'No resources'
         if self.resources[max_resource] == 0:
@@ -54,45 +54,45 @@ class Backpack:
         """
         Adds a resource to the store, respecting the collective capacity limit.
         """
-        logger.info(f"Adding resource {resource} with amount {amount}.")
+        logger.info("Adding resource {} with amount {}.", resource, amount)
 
         if resource not in self.resources:
-            logger.error(f"Attempted to add unsupported resource: {resource}.")
+            logger.error("Attempted to add unsupported resource: {}.", resource)
             raise ValueError(f"Resource {resource} is not supported by this store.")
 
         # Check if adding this resource would exceed the collective capacity
         if self.has_capacity():
-            logger.debug(f"Adding {amount} of {resource} to the backpack.")
+            logger.debug("Adding {} of {} to the backpack.", amount, resource)
             self.resources[resource] += amount
         else:
-            logger.warning(f"Not enough capacity to add {amount} of {resource}.")
+            logger.warning("Not enough capacity to add {} of {}.", amount, resource)
             raise ValueError("Not enough capacity to add more resources to the store.")
 
     def remove_resource(self, resource: str, amount: int) -> int:
         """
         Removes a resource from the store, returns the amount removed.
         """
-        logger.info(f"Removing {amount} of {resource} from the backpack.")
+        logger.info("Removing {} of {} from the backpack.", amount, resource)
 
         if resource not in self.resources:
-            logger.error(f"Attempted to remove unsupported resource: {resource}.")
+            logger.error("Attempted to remove unsupported resource: {}.", resource)
             raise ValueError(f"Resource {resource} is not supported by this store.")
 
         available = self.resources[resource]
         removed = min(available, amount)
         self.resources[resource] -= removed
-        logger.debug(f"Removed {removed} of {resource} from the backpack. Remaining: {self.resources[resource]}.")
+        logger.debug("Removed {} of {} from the backpack. Remaining: {}.", removed, resource, self.resources[resource])
         return removed
 
     def get_resource(self, resource: str) -> int:
         """
         Returns the current amount of a resource stored.
         """
-        logger.info(f"Fetching the quantity of resource: {resource}.")
+        logger.info("Fetching the quantity of resource: {}.", resource)
         if resource not in self.resources:
-            logger.warning(f"Resource {resource} is not stored in the backpack.")
+            logger.warning("Resource {} is not stored in the backpack.", resource)
             return 0
-        logger.debug(f"Current amount of {resource} in the backpack: {self.resources[resource]}.")
+        logger.debug("Current amount of {} in the backpack: {}.", resource, self.resources[resource])
         return self.resources[resource]
 
     def get_remaining_capacity(self) -> int:
@@ -103,7 +103,7 @@ class Backpack:
         logger.info("Calculating remaining capacity of the backpack.")
         total_stored = sum(self.resources.values())
         remaining_capacity = self._capacity - total_stored
-        logger.debug(f"Total stored: {total_stored}, Remaining capacity: {remaining_capacity}.")
+        logger.debug("Total stored: {}, Remaining capacity: {}.", total_stored, remaining_capacity)
         return remaining_capacity
 
     def get_capacity(self) -> int:
@@ -115,5 +115,5 @@ class Backpack:
     def has_items(self) -> bool:
         logger.info("Checking if the backpack contains any items.")
         has_items = self.get_remaining_capacity() != self.get_capacity()
-        logger.debug(f"Backpack has items: {has_items}.")
+        logger.debug("Backpack has items: {}.", has_items)
         return has_items
@@ -0,0 +1,176 @@
+from math import ceil
+from typing import Dict, List, Optional, Sequence, Set
+
+import numpy as np
+
+from src.logger import logger
+from src.settings import settings
+from src.simulation.grid.cell_codes import CellCodes
+from src.simulation.grid.grid import Grid
+from src.simulation.grid.location import Location
+from src.simulation.grid.structure.structure_type import StructureType
+from src.simulation.people.person.memories import Memories, Memory
+
+
+class DenseMemories(Memories):
+    """
+    Memories kept as arrays instead of one object per cell: for every cell, when it was last seen and the code of
+    what was there. The grid is cut into square tiles and only the tiles a person has seen are stored, stacked into
+    one array so every query looks at all of them at once. A memory has expired once its time is before the cutoff.
+    Dense memories don't read shared layers: the town's memories are copied in, MemoriesFactory never makes them a
+    household, and spouses keep exchanging copies instead.
+    """
+
+    _tile_size: int = settings.get("memory_tile_size", 16)
+    _never: int = np.iinfo(np.int32).min  # the time of a cell that was never seen
+
+    def __init__(self, grid: Grid, town: Optional[Memories] = None) -> None:
+        super().__init__(grid)
+        size = self._tile_size
+        self._tiles_across: int = ceil(grid.get_width() / size)
+
+        self._slots: Dict[int, int] = {}  # tile number (row-major) -> its slot in the arrays below
+        self._tiles: List[int] = []  # tile number of every slot in use
+        self._origins: np.ndarray = np.zeros((4, 2), dtype=np.int32)  # (y, x) of the top left cell of every slot
+        self._times: np.ndarray = np.full((4, size, size), self._never, dtype=np.int32)
+        self._codes: np.ndarray = np.zeros((4, size, size), dtype=np.uint8)
+        if town is not None:
+            self.combine(town)
+
+    def get_household(self) -> Optional[Memories]:
+        return None
+
+    def join_household(self, household: Memories) -> None:
+        logger.error("Dense memories can't read a household layer.")
+        raise TypeError("Dense memories can't read a household layer")
+
+    def leave_household(self) -> None:
+        pass  # never in one
+
+    def share_with_household(self) -> None:
+        pass  # never in one
+
+    def forget_expired(self) -> None:
+        pass  # reads already skip cells last seen before the cutoff
+
+    def _get_cutoff(self) -> int:
+        expire: int = settings.get("memory_expire", 50)
+        return self._grid.get_time() - expire
+
+    def _get_slot(self, tile: int) -> int:
+        slot = self._slots.get(tile)
+        if slot is not None:
+            return slot
+
+        slot = len(self._tiles)
+        if slot == len(self._times):
+            # out of room, double every array
+            self._origins = np.concatenate((self._origins, np.zeros_like(self._origins)))
+            self._times = np.concatenate((self._times, np.full_like(self._times, self._never)))
+            self._codes = np.concatenate((self._codes, np.zeros_like(self._codes)))
+        self._slots[tile] = slot
+        self._tiles.append(tile)
+        tile_y, tile_x = divmod(tile, self._tiles_across)
+        self._origins[slot] = (tile_y * self._tile_size, tile_x * self._tile_size)
+        return slot
+
+    def add(self, what: str, where: Location) -> None:
+        logger.debug("Adding a new memory with content '{}' at location {}.", what, where)
+
+        if not self._grid.is_in_bounds(where):
+            logger.warning("Tried to add an out of bounds location to memory {}", where)
+            return
+
+        if self._grid.get_structure_type(where) not in (None, StructureType.TREE):
+            where = self._grid.find_top_left_corner(where)
+
+        size = self._tile_size
+        tile_y, y = divmod(where.y, size)
+        tile_x, x = divmod(where.x, size)
+        slot = self._get_slot(tile_y * self._tiles_across + tile_x)
+        self._times[slot, y, x] = self._grid.get_time()
+        self._codes[slot, y, x] = CellCodes.to_code(what)
+
+    def combine(self, other: Memories) -> None:
+        if not isinstance(other, DenseMemories):
+            self._combine_memories(other.get_memories())
+            return
+
+        cutoff = self._get_cutoff()
+        count = len(other._tiles)
+        other_times = other._times[:count]
+        other_valid = other_times >= cutoff
+        other_slots = np.flatnonzero(other_valid.any(axis=(1, 2)))  # tiles with at least one live memory
+        if not len(other_slots):
+            return
+
+        slots = np.array([self._get_slot(other._tiles[slot]) for slot in other_slots.tolist()])
+        incoming_times = other_times[other_slots]
+        incoming_valid = other_valid[other_slots]
+        times = self._times[slots]
+        codes = self._codes[slots]
+
+        # like Memories.combine: an unknown cell takes the incoming memory as it is, a known one is refreshed
+        # to the current time when the incoming memory is newer
+        known = times >= cutoff
+        learned = incoming_valid & ~known
+        refreshed = incoming_valid & known & (incoming_times > times)
+        times[learned] = incoming_times[learned]
+        times[refreshed] = self._grid.get_time()
+        changed = learned | refreshed
+        codes[changed] = other._codes[other_slots][changed]
+
+        self._times[slots] = times
+        self._codes[slots] = codes
+        logger.debug("Memory combination complete: {} cells learned, {} refreshed.", learned.sum(), refreshed.sum())
+
+    def _combine_memories(self, memories: Set[Memory]) -> None:
+        """Combine with memories kept by another backend, one cell at a time, by the same rules as combine."""
+        cutoff = self._get_cutoff()
+        size = self._tile_size
+        for memory in memories:
+            where = memory.get_where()
+            tile_y, y = divmod(where.y, size)
+            tile_x, x = divmod(where.x, size)
+            slot = self._get_slot(tile_y * self._tiles_across + tile_x)
+            when = self._times.item(slot, y, x)
+            if when < cutoff:
+                self._times[slot, y, x] = memory.get_when()
+            elif memory.get_when() > when:
+                self._times[slot, y, x] = self._grid.get_time()
+            else:
+                continue
+            self._codes[slot, y, x] = CellCodes.to_code(memory.get_what())
+
+    def _get_unshared(self, shared: Sequence[Memories]) -> List[Memory]:
+        """Everything remembered here, since none of it comes from a shared layer."""
+        return list(self.get_memories())
+
+    def _live_cells(self) -> np.ndarray:
+        count = len(self._tiles)
+        return self._times[:count] >= self._get_cutoff()
+
+    def _to_locations(self, mask: np.ndarray) -> List[Location]:
+        slots, ys, xs = np.nonzero(mask)
+        ys = self._origins[slots, 0] + ys
+        xs = self._origins[slots, 1] + xs
+        return [Location(x, y) for x, y in zip(xs.tolist(), ys.tolist())]
+
+    def get_memories(self) -> Set[Memory]:
+        live = self._live_cells()
+        count = len(self._tiles)
+        return {
+            Memory(CellCodes.to_char(code), location, when)
+            for location, code, when in zip(
+                self._to_locations(live), self._codes[:count][live].tolist(), self._times[:count][live].tolist()
+            )
+        }
+
+    def get_memory_count(self) -> int:
+        return int(np.count_nonzero(self._live_cells()))
+
+    def _get_locations(self, char: str) -> Set[Location]:
+        logger.debug("Fetching locations associated with character '{}'.", char)
+        count = len(self._tiles)
+        mask = self._live_cells() & (self._codes[:count] == CellCodes.to_code(char))
+        return set(self._to_locations(mask))
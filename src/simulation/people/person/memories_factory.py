@@ -0,0 +1,41 @@
+from typing import Dict, Optional, Set, Type
+
+from src.logger import logger
+from src.settings import settings
+from src.simulation.grid.grid import Grid
+from src.simulation.people.person.dense_memories import DenseMemories
+from src.simulation.people.person.memories import Memories
+from src.simulation.people.person.sparse_memories import SparseMemories
+
+
+class MemoriesFactory:
+    """Builds the memories backend picked by the memories_backend setting."""
+
+    _backends: Dict[str, Type[Memories]] = {
+        "sparse": SparseMemories,  # one Memory object per remembered cell
+        "dense": DenseMemories,  # time and code arrays over the tiles a person has seen
+    }
+
+    # backends that read a shared household layer; the others keep exchanging copies between spouses
+    _household_backends: Set[str] = {"sparse"}
+
+    @classmethod
+    def create(cls, grid: Grid, town: Optional[Memories] = None) -> Memories:
+        """New memories for one person, starting out with what the town memories hold, if given."""
+        return cls._backends[cls._get_backend()](grid, town)
+
+    @classmethod
+    def create_household(cls, grid: Grid) -> Optional[Memories]:
+        """A new household layer for spouses to share, or None when the backend doesn't read household layers."""
+        backend = cls._get_backend()
+        if backend not in cls._household_backends:
+            return None
+        return cls._backends[backend](grid)
+
+    @staticmethod
+    def _get_backend() -> str:
+        backend: str = settings.get("memories_backend", "sparse")
+        if backend not in MemoriesFactory._backends:
+            logger.error("Unknown memories backend '{}'.", backend)
+            raise ValueError(f"Unknown memories backend '{backend}'")
+        return backend
@@ -1,14 +1,7 @@
 from __future__ import annotations
 
-from copy import deepcopy
-from random import randint
 from typing import TYPE_CHECKING, List, Optional
 
-from pathfinding.core.diagonal_movement import DiagonalMovement
-from pathfinding.core.grid import Grid as PathFindingGrid
-from pathfinding.core.node import GridNode as PathFindingGridNode
-from pathfinding.finder.a_star import AStarFinder
-
 from src.settings import settings
 from src.simulation.grid.location import Location
 from src.simulation.people.person.movement.vision import Vision
@@ -23,67 +16,122 @@ if TYPE_CHECKING:
 
 class Mover:
     def __init__(self, grid: Grid, person: Person, memories: Memories, speed: int) -> None:
-        logger.debug(f"Initializing Mover for person {person.get_name()} with speed {speed}.")
+        logger.debug("Initializing Mover for person {} with speed {}.", person.get_name(), speed)
         self._person = person
         self._grid = grid
         self._speed = speed
         self._memories = memories
         self._vision = Vision(person, grid, settings.get("visibility", 15))
-        self._path_finding_grid = self._get_path_finding_grid()
-        logger.debug("Mover initialized with grid: %s, person: %s, speed: %d.", grid, person, speed)
+
+        # the planned route is walked until the target changes or the grid blocks it
+        self._route: List[Location] = []  # remaining steps, with the next step last
+        self._route_target: Optional[Location] = None
+        self._route_version: int = -1
+        logger.debug("Mover initialized with grid: {}, person: {}, speed: {}.", grid, person, speed)
 
     def explore(self) -> None:
         logger.debug("Explorer is searching for a random location.")
         random_location = self._get_random_location()
-        logger.debug(f"Random location chosen: {random_location}")
+        logger.debug("Random location chosen: {}", random_location)
         self.towards(random_location)
 
     def towards(self, target: Location) -> None:
-        self._path_finding_grid = self._get_path_finding_grid()
-        logger.debug(f"Moving towards target location: {target}.")
+        logger.debug("Moving towards target location: {}.", target)
         if not self._grid.is_in_bounds(target):
-            logger.warning(f"Target location {target} is out of bounds, aborting movement.")
+            logger.warning("Target location {} is out of bounds, aborting movement.", target)
             return
 
-        if self._invalid(target):
-            logger.debug(f"Target location {target} is invalid, adjusting target.")
+        if self._invalid(target) or not self._grid.get_path_costs().item(target.y, target.x):
+            # buildings and impassable sites, like a mine under construction, are worked from next to them
+            logger.debug("Target location {} is invalid, adjusting target.", target)
             target = self._adjust_target(target)
 
         for step in range(self._speed):
-            logger.debug(f"Step {step}: Combining vision with current memories.")
+            logger.debug("Step {}: Combining vision with current memories.", step)
             if step % 4 == 0:
                 self._memories.combine(self._vision.look_around())
-            path = self._get_path(target)
+            new_location = self._next_step(target)
 
-            if path and len(path) >= 2:
-                next_node = path[1]
-                new_location = Location(next_node.y, next_node.x)  # Convert to Location
-                logger.debug(f"Moving to next location: {new_location}.")
+            if new_location:
+                logger.debug("Moving to next location: {}.", new_location)
                 self._place(new_location)
             else:
                 if self._person.get_location() == target:
-                    logger.info(f"{self._person.get_name()} has arrived to their target")
+                    logger.info("{} has arrived to their target", self._person.get_name())
+                else:
+                    logger.warning("No valid path found to target: {}", target)
+                break
+
+    def towards_structure(self, location: Location) -> None:
+        """Walk towards the structure at location using the flow field everyone heading there shares."""
+        logger.debug("Moving towards structure at {}.", location)
+        if not self._grid.is_in_bounds(location):
+            logger.warning("Structure location {} is out of bounds, aborting movement.", location)
+            return
+
+        for step in range(self._speed):
+            if step % 4 == 0:
+                self._memories.combine(self._vision.look_around())
+            flow_field = self._grid.get_flow_field(location)
+            new_location = flow_field.next_step(self._person.get_location())
+
+            if new_location:
+                logger.debug("Moving to next location: {}.", new_location)
+                self._place(new_location)
+            else:
+                if flow_field.get_distance(self._person.get_location()) == 0:
+                    logger.info("{} has arrived to their target", self._person.get_name())
                 else:
-                    logger.warning(f"No valid path found to target: {target}")
+                    logger.warning("No valid path found to structure at: {}", location)
                 break
 
+    def _next_step(self, target: Location) -> Optional[Location]:
+        if self._needs_new_route(target):
+            path = self._get_path(target)
+            self._route = path[:0:-1]
+            self._route_target = target
+            self._route_version = self._grid.get_version()
+            logger.debug("Planned a route of {} steps to {}.", len(self._route), target)
+
+        if not self._route:
+            return None
+        return self._route.pop()
+
+    def _needs_new_route(self, target: Location) -> bool:
+        if not self._route or self._route_target != target:
+            return True
+
+        if not self._person.get_location().is_one_away(self._route[-1]):
+            logger.debug("Person is no longer on their planned route.")
+            return True
+
+        version = self._grid.get_version()
+        if version != self._route_version:
+            path_costs = self._grid.get_path_costs()
+            if any(path_costs[step.y, step.x] == 0 for step in self._route):
+                logger.debug("Grid changed to version {} and blocked the planned route.", version)
+                return True
+            self._route_version = version
+
+        return False
+
     def _invalid(self, location: Location) -> bool:
-        logger.debug(f"Checking if location {location} is invalid (barn, mine, or home).")
+        logger.debug("Checking if location {} is invalid (barn, mine, or home).", location)
         result = not self._grid.is_in_bounds(location) or self._grid.is_barn(location) or self._grid.is_mine(location) or self._grid.is_home(location)
-        logger.debug(f"Location {location} is invalid: {result}")
+        logger.debug("Location {} is invalid: {}", location, result)
         return result
 
     def _adjust_target(self, target):
-        logger.debug(f"Adjusting target location {target} if necessary.")
+        logger.debug("Adjusting target location {} if necessary.", target)
         neighbors: List[Location] = target.get_neighbors()
         found: bool = False
         for neighbor in neighbors:
-            logger.debug(f"Checking if neighbor location {neighbor} is valid.")
+            logger.debug("Checking if neighbor location {} is valid.", neighbor)
 
             if not self._invalid(neighbor) and self.can_get_to(neighbor):
                 target = neighbor
                 found = True
-                logger.debug("New valid target found: {target}")
+                logger.debug("New valid target found: {}", target)
                 break
         if not found:
             logger.error("No valid targets found for movement. Raising exception.")
@@ -91,83 +139,69 @@ class Mover:
         return target
 
     def get_closest(self, locations: List[Location], current_location=None) -> Optional[Location]:
-        logger.debug(f"Getting the closest location from {current_location} to one of the target locations.")
+        logger.debug("Getting the closest location from {} to one of the target locations.", current_location)
         if not current_location:
             current_location = self._person.get_location()
-            logger.debug(f"Current location not provided. Using person's current location: {current_location}")
+            logger.debug("Current location not provided. Using person's current location: {}", current_location)
         if not locations:
             logger.warning("No target locations provided. Returning None.")
             return None
         closest_location = min(locations, key=lambda loc: current_location.distance_to(loc), default=None)
-        logger.debug(f"Closest location found: {closest_location}")
+        logger.debug("Closest location found: {}", closest_location)
         return closest_location
 
     def can_get_to(self, target: Location) -> bool:
-        logger.debug(f"Checking if a path exists to target location {target}")
-        path_exists = bool(self._get_path(target))
-        logger.debug(f"Path to target {target} exists: {path_exists}")
+        logger.debug("Checking if a path exists to target location {}", target)
+        path_exists = self._grid.can_reach(self._person.get_location(), target)
+        logger.debug("Path to target {} exists: {}", target, path_exists)
         return path_exists
 
     def _place(self, location: Location) -> None:
-        logger.debug(f"Placing person at location {location}")
-        current_location = deepcopy(self._person.get_location())
+        logger.debug("Placing person at location {}", location)
+        current_location = self._person.get_location()
 
         if not current_location.is_one_away(location):
-            logger.error(f"Attempted to place person at location {location}, which is not one away from current location {current_location}.")
+            logger.error("Attempted to place person at location {}, which is not one away from current location {}.", location, current_location)
             raise ValueError(f"Location is not one away: {location}")
 
         if not self._grid.is_in_bounds(location) or self._invalid(location):
-            logger.error(f"Attempted to place person at invalid location {location}")
-            raise ValueError(f"Location is not valid: {location} {self._grid.get_grid()[location.y][location.x]}")
+            logger.error("Attempted to place person at invalid location {}", location)
+            raise ValueError(f"Location is not valid: {location} {self._grid.get_char(location)}")
 
         self._person.set_location(location)
-        logger.debug(f"Person successfully placed at location {location}")
+        logger.debug("Person successfully placed at location {}", location)
 
     def _get_random_location(self) -> Location:
         logger.debug("Getting a random valid location.")
 
         while True:
-            x = randint(0, self._grid.get_width() - 1)
-            y = randint(0, self._grid.get_height() - 1)
-            location = Location(x, y)
+            location = self._grid.get_random_reachable_location(self._person.get_location())
+            if not location:
+                logger.error("Person is not on a passable cell, there is nowhere to go. Raising exception.")
+                raise ValueError("Person out of bounds")
 
-            if self._grid.is_in_bounds(location) and not self._invalid(location) and self.can_get_to(location):
-                logger.debug(f"Random location found: {location}")
+            if not self._invalid(location):
+                logger.debug("Random location found: {}", location)
                 return location
 
-            logger.debug(f"Generated invalid location {location}. Trying again...")
+            logger.debug("Generated invalid location {}. Trying again...", location)
 
     def _get_path(
         self,
         target: Location,
-    ) -> List[PathFindingGridNode]:
-        logger.debug(f"Finding path to target location {target}")
-        start: Location = deepcopy(self._person.get_location())
+    ) -> List[Location]:
+        logger.debug("Finding path to target location {}", target)
+        start: Location = self._person.get_location()
 
-        if not self._grid.is_in_bounds(start) or self._invalid(start):
-            logger.error(f"Start location {start} is out of bounds or invalid. Raising exception.")
+        # a start on a home, barn or mine is fine: a construction may have finished under the person
+        if not self._grid.is_in_bounds(start):
+            logger.error("Start location {} is out of bounds. Raising exception.", start)
             raise ValueError("Person out of bounds")
 
-        start_node = self._path_finding_grid.node(start.y, start.x)
-        end_node = self._path_finding_grid.node(target.y, target.x)
-
-        logger.debug(f"Start node: {start_node}, End node: {end_node}")
-
-        finder = AStarFinder(diagonal_movement=DiagonalMovement.always)
-
-        path, _ = finder.find_path(start_node, end_node, self._path_finding_grid)
-        logger.debug(f"Path found: {path}")
+        path = self._grid.find_path(start, target)
+        logger.debug("Path found with {} steps.", len(path))
         return path
 
-    def _get_path_finding_grid(self) -> PathFindingGrid:
-        logger.debug("Generating pathfinding grid.")
-
-        # Get the pathfinding matrix from the grid
-        matrix = self._grid.get_path_finding_matrix()
-        logger.debug(f"Pathfinding matrix retrieved: {matrix}")
-
-        return PathFindingGrid(matrix=matrix)
-
     # For debugging
     def _print_grid(self, target: Location, path) -> None:
         logger.debug("Printing grid.")
@@ -183,12 +217,12 @@ class Mover:
         target_y = target.y  # row
         target_x = target.x  # column
 
-        # Convert path from nodes (e.g., tuples) to Location objects
-        path_locations = [Location(y, x) for y, x in path]
+        # The path is already a list of Location objects
+        path_locations = path
 
         # Log the grid dimensions and target position
-        logger.debug(f"Grid dimensions: {len(grid)} x {len(grid[0])}")
-        logger.debug(f"Target position: ({target_y}, {target_x})")
+        logger.debug("Grid dimensions: {} x {}", len(grid), len(grid[0]))
+        logger.debug("Target position: ({}, {})", target_y, target_x)
 
         # Top border: Adjusted to account for spaces between characters
         border = "+" + "-" * len(grid[0]) + "+"
@@ -206,13 +240,13 @@ class Mover:
                 elif y_idx == target_y and x_idx == target_x:
                     row_display.append("T")
                 # If we're at a location in the path, mark it with 'r'
-                elif Location(y_idx, x_idx) in path_locations:
+                elif Location(x_idx, y_idx) in path_locations:
                     row_display.append("r")
                 else:
                     row_display.append(cell)  # otherwise, display the normal grid cell
 
             # Log each row before printing for debugging purposes
-            logger.debug(f"Row {y_idx}: {' '.join(row_display)}")
+            logger.debug("Row {}: {}", y_idx, ' '.join(row_display))
 
             # Print the row with no spaces between characters (join with an empty string)
             print("|" + " ".join(row_display) + "|")
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import random
 from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple
 
 import numpy as np
@@ -21,8 +20,16 @@ if TYPE_CHECKING:
 
 
 class Navigator:
+    # destinations much of the town keeps walking to, worth a full-grid flow field each; homes, construction
+    # sites and trees only see a handful of visitors, so they are walked to with a cached A* route
+    _shared_destinations: Set[StructureType] = {
+        StructureType.BARN,
+        StructureType.FARM,
+        StructureType.MINE,
+    }
+
     def __init__(self, simulation: Simulation, person: Person) -> None:
-        logger.debug(f"Initializing Navigator for person: {person.get_name()}")
+        logger.debug("Initializing Navigator for person: {}", person.get_name())
 
         self._simulation = simulation
         self._person = person
@@ -36,7 +43,7 @@ class Navigator:
         # when to start looking for new place of work
         actions_per_year = simulation.actions_per_year()
         self._epsilon_reset = int(np.random.uniform(50, actions_per_year))
-        logger.debug(f"Epsilon reset value initialized to: {self._epsilon_reset}")
+        logger.debug("Epsilon reset value initialized to: {}", self._epsilon_reset)
 
         # Using defaultdict to simplify reward and action initialization
         self._epsilon: Dict[StructureType, float] = {}
@@ -48,12 +55,7 @@ class Navigator:
 
     def is_stuck(self) -> bool:
         logger.debug("Checking if navigator is stuck.")
-        locations: List[Location] = self._simulation.get_grid().get_empty_spots_near_town()
-        location: Location = random.choice(locations)
-        while location == self._person.get_location():
-            location: Location = random.choice(locations)
-
-        stuck = not self._mover.can_get_to(location)
+        stuck = not self._simulation.get_grid().can_reach_town(self._person.get_location())
         if stuck:
             logger.warning("Navigator is stuck, no reachable location found.")
         return stuck
@@ -65,12 +67,12 @@ class Navigator:
             logger.debug("No structure set, returning default time estimate of 5.")
             return 5  # Default estimate if no building is set
         time_estimate = self._structure.get_location().distance_to(self._person.get_location()) // settings.get("speed", 10)
-        logger.debug(f"Estimated time to move to the current structure: {time_estimate}")
+        logger.debug("Estimated time to move to the current structure: {}", time_estimate)
         return time_estimate
 
     def move_to_location(self, location: Location):
         """Move directly to the specified location."""
-        logger.debug(f"Navigator moving to location: {location}")
+        logger.debug("Navigator moving to location: {}", location)
         self._reset_moving_state(None)
         self._mover.towards(location)
 
@@ -99,13 +101,13 @@ class Navigator:
         self, structure_type: StructureType, resource_name: Optional[str] = None
     ) -> MoveResult:
         """Move to a building that is workable (e.g., has capacity or resources)."""
-        logger.debug(f"Moving to workable structure of type: {structure_type}")
+        logger.debug("Moving to workable structure of type: {}", structure_type)
         if self._moving_to_structure_type != structure_type:
             logger.debug("Structure type has changed. Resetting moving state.")
             self._reset_moving_state(structure_type)
 
         self._turn_count += 1
-        logger.debug(f"Turn count incremented to: {self._turn_count}")
+        logger.debug("Turn count incremented to: {}", self._turn_count)
 
         if not self._structure:
             logger.debug("No structure set. Attempting to find and move to structure.")
@@ -135,16 +137,16 @@ class Navigator:
         if self._moving_to_structure_type not in [StructureType.FARM, StructureType.TREE, StructureType.MINE]:
             logger.debug("Structure type is not relevant for reward update.")
             return
-        logger.debug(f"Updating reward for structure type: {self._moving_to_structure_type}")
+        logger.debug("Updating reward for structure type: {}", self._moving_to_structure_type)
         rewards = self._rewards[self._moving_to_structure_type]
         actions = self._actions[self._moving_to_structure_type]
         location = self._structure.get_location()
         rewards[location] += (y - (self._turn_count * 2)) / actions[location]
-        logger.debug(f"Reward updated for location {location}: {rewards[location]}")
+        logger.debug("Reward updated for location {}: {}", location, rewards[location])
 
     def _reset_moving_state(self, building_type: Optional[StructureType]) -> None:
         """Reset the state when moving to a different building type."""
-        logger.debug(f"Resetting moving state for new building type: {building_type}")
+        logger.debug("Resetting moving state for new building type: {}", building_type)
         self._moving_to_structure_type = building_type
         self._visited_structures.clear()
         self._searched_structure_count = 0
@@ -152,20 +154,20 @@ class Navigator:
         self._turn_count = 0
 
     def _find_and_move_to_structure(self, structure_type: StructureType) -> Tuple[bool, Optional[Structure]]:
-        logger.debug(f"Finding and moving to structure of type: {structure_type}")
+        logger.debug("Finding and moving to structure of type: {}", structure_type)
         structure_data = self._get_structure_locations()
         if structure_type not in structure_data:
-            logger.error(f"Unknown structure type: {structure_type}")
+            logger.error("Unknown structure type: {}", structure_type)
             raise Exception(f"Unknown structure type: {structure_type}")
 
         locations = list(structure_data[structure_type]())
-        logger.debug(f"Retrieved {len(locations)} known locations for structure type: {structure_type}")
+        logger.debug("Retrieved {} known locations for structure type: {}", len(locations), structure_type)
         
         if locations:
             if structure_type in [StructureType.FARM, StructureType.TREE, StructureType.MINE]:
                 structure = self._move_to_chosen_structure(structure_type, locations)
             else:
-                structure = self._move_to_closest_structure(locations)
+                structure = self._move_to_closest_structure(structure_type, locations)
         else:
             structure = None
             self._person.get_scheduler().add(TaskType.EXPLORE)
@@ -192,7 +194,7 @@ class Navigator:
                 self._person.get_scheduler().add(construction_type)
             return True, None
 
-        logger.debug(f"Successfully moved to structure of type: {structure_type}")
+        logger.debug("Successfully moved to structure of type: {}", structure_type)
         return False, structure
 
     def _get_structure_locations(self) -> Dict[StructureType, Callable[[], Set[Location]]]:
@@ -241,69 +243,79 @@ class Navigator:
     def _is_structure_nearby_and_has_capacity(self, resource_name: Optional[str]) -> bool:
         """Check if the building is nearby and has capacity."""
         from src.simulation.grid.structure.store.store import Store
-        logger.debug(f"Checking if structure {self._structure} is nearby and has capacity.")
+        logger.debug("Checking if structure {} is nearby and has capacity.", self._structure)
         if self._person.get_location().is_one_away(self._structure.get_location()) or self._person.get_location().is_one_away(self._structure.get_location()):
             if resource_name and isinstance(self._structure, Store):
                 resource_quantity = self._structure.get_resource(resource_name)
-                logger.debug(f"Resource {resource_name} in structure: {resource_quantity} available.")
+                logger.debug("Resource {} in structure: {} available.", resource_name, resource_quantity)
                 return resource_quantity > 0
             elif self._structure.has_capacity():
                 logger.debug("Structure has capacity. Resetting moving state.")
                 self._reset_moving_state(None)
                 return True
             else:
-                logger.warning(f"Structure {self._structure} is full. Marking as visited.")
+                logger.warning("Structure {} is full. Marking as visited.", self._structure)
                 self._visited_structures.add(self._structure)
         return False
 
-    def _move_to_closest_structure(self, locations: List[Location]) -> Optional[Structure]:
+    def _move_to_closest_structure(
+        self, structure_type: StructureType, locations: List[Location]
+    ) -> Optional[Structure]:
         """Move to the closest building from the provided locations."""
-        logger.debug(f"Finding the closest structure from {len(locations)} locations.")
+        logger.debug("Finding the closest structure from {} locations.", len(locations))
         visited_buildings_locations = [b.get_location() for b in self._visited_structures]
         filtered = [l for l in locations if l not in visited_buildings_locations]
-        logger.debug(f"Filtered to {len(filtered)} unvisited locations.")
+        logger.debug("Filtered to {} unvisited locations.", len(filtered))
 
         closest = self._mover.get_closest(filtered)
         if closest:
-            logger.debug(f"Closest structure found at location {closest}. Moving to it.")
+            logger.debug("Closest structure found at location {}. Moving to it.", closest)
         else:
             logger.warning("No suitable structure found among the given locations.")
-        return self._move_to(closest)
+        return self._move_to(structure_type, closest)
 
     def _move_to_chosen_structure(
         self, structure_type: StructureType, locations: List[Location]
     ) -> Optional[Structure]:
         """Move to the chosen building that is workable."""
-        logger.debug(f"Choosing structure of type {structure_type} from {len(locations)} locations.")
+        logger.debug("Choosing structure of type {} from {} locations.", structure_type, len(locations))
 
         actions, rewards = self._update_rewards_and_actions(locations, structure_type)
         
         self._calculate_epsilon(structure_type)
 
-        logger.debug(f"Actions: {actions} | Rewards: {rewards} | Epsilon: {self._epsilon[structure_type]:.4f}")
+        logger.debug("Actions: {} | Rewards: {} | Epsilon: {:.4f}", actions, rewards, self._epsilon[structure_type])
 
         if np.random.uniform(0, 1) < self._epsilon[structure_type]:
             chosen = np.random.choice(list(rewards.keys()))  # explore
-            logger.debug(f"Exploring. Randomly chose location {chosen}.")
+            logger.debug("Exploring. Randomly chose location {}.", chosen)
         else:
             chosen = max(rewards, key=rewards.get)  # exploit
-            logger.debug(f"Exploiting. Chose location {chosen} with highest reward {rewards[chosen]:.4f}.")
+            logger.debug("Exploiting. Chose location {} with highest reward {:.4f}.", chosen, rewards[chosen])
 
         actions[chosen] += 1
 
-        return self._move_to(chosen)
+        return self._move_to(structure_type, chosen)
 
     def _calculate_epsilon(self, structure_type: StructureType) -> None:
         actions = self._actions[structure_type]
         action_count = sum(actions.values())
-        logger.debug(f"Total actions taken for {structure_type}: {action_count}.")
+        logger.debug("Total actions taken for {}: {}.", structure_type, action_count)
 
         # Update epsilon value based on action count
         self._epsilon[structure_type] = self._logarithmic_decay(action_count)
-        logger.debug(f"Updated epsilon for structure type {structure_type} to {self._epsilon[structure_type]:.4f} based on action count.")
+        logger.debug(
+            "Updated epsilon for structure type {} to {:.4f} based on action count.",
+            structure_type,
+            self._epsilon[structure_type],
+        )
 
         if self._person.get_time() - action_count > self._epsilon_reset:
-            logger.debug(f"Time since last action exceeds reset threshold ({self._person.get_time() - action_count} > {self._epsilon_reset}). Resetting epsilon and clearing actions.")
+            logger.debug(
+                "Time since last action exceeds reset threshold ({} > {}). Resetting epsilon and clearing actions.",
+                self._person.get_time() - action_count,
+                self._epsilon_reset,
+            )
             self._epsilon[structure_type] = 1
             actions.clear()
 
@@ -318,31 +330,34 @@ class Navigator:
         rewards = self._rewards[structure_type]
         actions = self._actions[structure_type]
 
-        logger.debug(f"Updating rewards and actions for {structure_type} structure type.")
-        logger.debug(f"Initial rewards: {rewards}")
-        logger.debug(f"Initial actions: {actions}")
+        logger.debug("Updating rewards and actions for {} structure type.", structure_type)
+        logger.debug("Initial rewards: {}", rewards)
+        logger.debug("Initial actions: {}", actions)
 
         for location in locations:
             if location in rewards or location in actions:
                 continue
             rewards.setdefault(location, 0)
             actions.setdefault(location, 0)
-            logger.debug(f"Location {location} | Reward: {rewards[location]} | Actions: {actions[location]}")
+            logger.debug("Location {} | Reward: {} | Actions: {}", location, rewards[location], actions[location])
 
-        logger.debug(f"Updated rewards: {rewards}")
-        logger.debug(f"Updated actions: {actions}")
+        logger.debug("Updated rewards: {}", rewards)
+        logger.debug("Updated actions: {}", actions)
 
         return actions, rewards
 
-    def _move_to(self, location: Location) -> Optional[Structure]:
+    def _move_to(self, structure_type: StructureType, location: Location) -> Optional[Structure]:
         """Move towards the specified location and return the structure at that location."""
-        logger.debug(f"Moving towards location: {location}")
-        self._mover.towards(location)
+        logger.debug("Moving towards {} at location: {}", structure_type, location)
+        if structure_type in self._shared_destinations:
+            self._mover.towards_structure(location)
+        else:
+            self._mover.towards(location)
 
         structure = self._simulation.get_grid().get_structure(location)
         if structure:
-            logger.debug(f"Arrived at location {location} and found structure: {structure}")
+            logger.debug("Arrived at location {} and found structure: {}", location, structure)
         else:
-            logger.warning(f"Arrived at location {location}, but no structure found.")
+            logger.warning("Arrived at location {}, but no structure found.", location)
 
         return structure
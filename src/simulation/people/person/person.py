@@ -6,6 +6,7 @@ from src.logger import logger
 from src.settings import settings
 from src.simulation.people.person.backpack import Backpack
 from src.simulation.people.person.memories import Memories
+from src.simulation.people.person.memories_factory import MemoriesFactory
 from src.simulation.people.person.movement.navigator import Navigator
 from src.simulation.people.person.scheduler.scheduler import Scheduler
 from src.simulation.people.person.scheduler.task.task_type import TaskType
@@ -22,7 +23,7 @@ if TYPE_CHECKING:
 
 
 class Person:
-    def __init__(self, simulation: Simulation, name: str, pk: int, location: Location, age: int, starter_memories: List[Location]) -> None:
+    def __init__(self, simulation: Simulation, name: str, pk: int, location: Location, age: int, town_memories: Memories) -> None:
         self._name: str = name
         self._pk: int = pk
         self._age: int = age
@@ -38,9 +39,7 @@ class Person:
         
         self._backpack: Backpack = Backpack()
         self._scheduler: Scheduler = Scheduler(simulation, self)
-        self._memories: Memories = Memories(simulation.get_grid())
-        for memory in starter_memories:
-            self._memories.add(self._simulation.get_grid().get_grid()[memory.y][memory.x], memory)
+        self._memories: Memories = MemoriesFactory.create(simulation.get_grid(), town_memories)
         self._navigator: Navigator = Navigator(simulation, self)
         self._thinker: Thinker = Thinker(simulation, self)
 
@@ -68,9 +67,27 @@ class Person:
     def exchange_memories(self, other: "Person") -> None:
         if not other:
             return
+        household = self._memories.get_household()
+        if household is not None and household is other.get_memories().get_household():
+            # a household keeps what its members learned in one shared layer instead of a copy for each of them
+            self._memories.share_with_household()
+            other.get_memories().share_with_household()
+            logger.info("{} is sharing household memories with {}", self._name, other.get_name())
+            return
         self._memories.combine(other.get_memories())
         other.get_memories().combine(self._memories)
-        logger.info(f"{self._name} is exchanging memories with {other.get_name()}")
+        logger.info("{} is exchanging memories with {}", self._name, other.get_name())
+
+    def share_memories(self, others: List["Person"]) -> None:
+        """
+        Pool memories with a whole group at once: everyone's memories are merged into this person's,
+        then handed back to each of the others. Everybody ends up knowing what each pairwise exchange would teach.
+        """
+        for other in others:
+            self._memories.combine(other.get_memories())
+        for other in others:
+            other.get_memories().combine(self._memories)
+        logger.info("{} is sharing memories with {} others", self._name, len(others))
 
     def get_empties(self) -> List[Location]:
         return list(self._memories.get_empty_locations())
@@ -82,7 +99,7 @@ class Person:
         return self._scheduler
 
     def get_work_structures(self) -> List[Location]:
-        logger.info(f"getting all structures {self._name} is working on.")
+        logger.info("getting all structures {} is working on.", self._name)
         structures: List[Structure] = []
         for task in self._scheduler.get_this_years_tasks():
             structure: Structure = task.get_work_structure()
@@ -122,11 +139,11 @@ class Person:
 
     def set_location(self, other: Location) -> None:
         if not self._simulation.get_grid().is_in_bounds(other):
-            logger.error(f"{self._name} tried to move outside map bounds to {other}")
+            logger.error("{} tried to move outside map bounds to {}", self._name, other)
             return
 
         self._location = other
-        logger.info(f"{self._name} moved to new location: {self._location}")
+        logger.info("{} moved to new location: {}", self._name, self._location)
 
     def is_dead(self) -> bool:
         return self._health <= 0 or self._age >= settings.get("person_age_max", 80)
@@ -135,37 +152,47 @@ class Person:
         return self.get_hunger() >= self.get_hunger_preference()
 
     def eat(self, building: Barn | Home) -> None:
-        logger.info(f"{self._name} is about to eat with hunger {self._hunger}")
+        logger.info("{} is about to eat with hunger {}", self._name, self._hunger)
         if isinstance(building, Home):
             self.set_hunger(settings.get("home_eat_satiate", 15))
             building.remove_resource(settings.get("food", "food"), settings.get("home_eat_satiate", 15))
-            logger.debug(f"{self._name} ate at home and their hunger is now {self._hunger}")
+            logger.debug("{} ate at home and their hunger is now {}", self._name, self._hunger)
         else:
             self.set_hunger(settings.get("barn_eat_satiate", 10))
             building.remove_resource(settings.get("food", "food"), settings.get("barn_eat_satiate", 10))
-            logger.debug(f"{self._name} ate in a barn and their hunger is now {self._hunger}")
+            logger.debug("{} ate in a barn and their hunger is now {}", self._name, self._hunger)
 
     def set_hunger(self, hunger: int) -> None:
         old_hunger = self._hunger
         self._hunger = max(0, min(self._hunger + hunger, settings.get("person_hunger_cap", 100)))
-        logger.info(f"{self._name}'s hunger adjusted from {old_hunger} to {self._hunger}")
+        logger.info("{}'s hunger adjusted from {} to {}", self._name, old_hunger, self._hunger)
 
     def assign_spouse(self, spouse: "Person") -> None:
         self._spouse = spouse
+        # move into the spouse's household memories, or start them if the spouse hasn't yet
+        household: Optional[Memories] = None
+        if spouse.get_spouse() is self:
+            household = spouse.get_memories().get_household()
+        if household is None:
+            household = MemoriesFactory.create_household(self._simulation.get_grid())
+        if household is not None:
+            self._memories.join_household(household)
 
     def divorce(self) -> None:
         if not self._spouse:
-            logger.warning(f"{self._name} has no spouse to divorce")
+            logger.warning("{} has no spouse to divorce", self._name)
             return
         old_spouse: Person = self._spouse
         self.get_spouse().leave_spouse()
         self._spouse = None
-        logger.info(f"{self._name} has divorced their spouse {old_spouse}")
+        self._memories.leave_household()
+        logger.info("{} has divorced their spouse {}", self._name, old_spouse)
 
     def leave_spouse(self) -> None:
         self._home = None
         self._spouse = None
-        logger.info(f"{self._name} has left their spouse and home")
+        self._memories.leave_household()
+        logger.info("{} has left their spouse and home", self._name)
 
     def get_spouse(self) -> Optional["Person"]:
         return self._spouse
@@ -176,37 +203,37 @@ class Person:
         self.remove_home()
         self._home = home
         home.assign_owner(self)
-        logger.info(f"{self._name} assigned to new home: {home}")
+        logger.info("{} assigned to new home: {}", self._name, home)
         if self.has_spouse():
             self.get_spouse().assign_home(home)
-            logger.debug(f"{self._name}'s spouse also assigned to the new home: {home}")
+            logger.debug("{}'s spouse also assigned to the new home: {}", self._name, home)
 
     def remove_home(self):
         if not self._home:
-            logger.warning(f"{self._name} tried to remove home but has no home to remove")
+            logger.warning("{} tried to remove home but has no home to remove", self._name)
             return
         self._home.assign_owner(None)
         self._home = None
-        logger.info(f"{self._name} removed from home")
+        logger.info("{} removed from home", self._name)
         if self.has_spouse():
             self._spouse.remove_home()
-            logger.debug(f"{self._name}'s spouse's home also removed")
+            logger.debug("{}'s spouse's home also removed", self._name)
 
     def set_health(self, health: int) -> None:
         old_health = self._health
         self._health = max(0, min(self._health + health, settings.get("person_health_cap", 100)))
-        logger.info(f"{self._name}'s health adjusted from {old_health} to {self._health}")
+        logger.info("{}'s health adjusted from {} to {}", self._name, old_health, self._health)
 
     def has_home(self) -> bool:
         return self._home is not None
 
     def start_home_construction(self) -> None:
         self._scheduler.add(TaskType.START_HOME_CONSTRUCTION)
-        logger.info(f"{self._name} started home construction task")
+        logger.info("{} started home construction task", self._name)
 
     def work_farm(self) -> None:
         self._scheduler.add(TaskType.WORK_FARM)
-        logger.info(f"{self._name} started work farm task")
+        logger.info("{} started work farm task", self._name)
 
     def has_spouse(self) -> bool:
         return self._spouse is not None
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import heapq
-from typing import TYPE_CHECKING, List, Optional
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional
 
 from src.logger import logger
 from src.simulation.people.person.scheduler.task.task_factory import \
@@ -16,39 +16,72 @@ if TYPE_CHECKING:
 
 class Scheduler:
     _small_float = 2**-100
+    _priority_levels: int = 10  # priorities run from 1, served first, to 10
 
     def __init__(self, simulation: Simulation, person: Person) -> None:
         self._task_factory: TaskFactory = TaskFactory(simulation, person)
         self._this_years_tasks: List[Task] = []
-        self._tasks: List[Task] = []
+        # queued tasks in one bucket per priority, first in first out within a bucket
+        self._buckets: List[Deque[Task]] = [deque() for _ in range(self._priority_levels)]
+        self._queued: Dict[TaskType, int] = {}  # how many tasks of each type are queued
         self._current_task: Optional[Task] = None
 
     def get_this_years_tasks(self):
         return self._this_years_tasks
 
-    def get_tasks(self):
-        return self._tasks
+    def get_tasks(self) -> List[Task]:
+        """The queued tasks, in the order they would be served."""
+        return [task for bucket in self._buckets for task in bucket]
 
     def flush(self):
         self._this_years_tasks = []
 
     def add(self, what: TaskType) -> None:
+        if self._queued.get(what):
+            return
         task: Task = self._task_factory.create_instance(what)
         if not task:
-            logger.warning(f"Tried to add invalid task: {what}")
+            logger.warning("Tried to add invalid task: {}", what)
             return
-        task_types = {type(task) for task in self._tasks}
-        if type(task) not in task_types:
-            self._add(task)
-            self._this_years_tasks.append(task)
-            logger.debug(f"Task {task} should be added to list of tasks")
+        self._add(task)
+        self._this_years_tasks.append(task)
+        logger.debug("Task {} should be added to list of tasks", task)
+
+    def update_priorities(self) -> None:
+        """Move queued tasks whose priority changed into their new bucket. Called whenever priorities are adjusted."""
+        moved: List[Task] = []
+        for index, bucket in enumerate(self._buckets):
+            if any(self._get_bucket(task) != index for task in bucket):
+                moved.extend(task for task in bucket if self._get_bucket(task) != index)
+                self._buckets[index] = deque(task for task in bucket if self._get_bucket(task) == index)
+        for task in moved:
+            self._buckets[self._get_bucket(task)].append(task)
+
+    def _get_bucket(self, task: Task) -> int:
+        return min(max(task.get_priority(), 1), self._priority_levels) - 1
+
+    def _has_tasks(self) -> bool:
+        return any(self._buckets)
 
     def _add(self, task: Optional[Task]) -> None:
         if task:
-            heapq.heappush(self._tasks, task)
+            self._buckets[self._get_bucket(task)].append(task)
+            self._queued[task.get_task_type()] = self._queued.get(task.get_task_type(), 0) + 1
+
+    def _peek(self) -> Optional[Task]:
+        """The task _pop would return, left in its bucket."""
+        for bucket in self._buckets:
+            if bucket:
+                return bucket[0]
+        return None
 
     def _pop(self) -> Optional[Task]:
-        return heapq.heappop(self._tasks) if self._tasks else None
+        for bucket in self._buckets:
+            if bucket:
+                task = bucket.popleft()
+                self._queued[task.get_task_type()] -= 1
+                return task
+        return None
 
     def _calculate_task_reward(self, task: Task) -> float:
         if not task:
@@ -61,37 +94,38 @@ class Scheduler:
         # Reward formula: Higher priority, less time remaining, fewer interruptions lead to higher reward
         #reward = priority_weight * time_remaining_weight / (1 + interruption_penalty)
         reward = priority_weight/(1 + interruption_penalty)
-        logger.debug(f"Task {task} should have reward {reward}")
+        logger.debug("Task {} should have reward {}", task, reward)
         return reward
 
     def execute(self) -> None:
-        if not self._current_task and not self._tasks:
+        if not self._current_task and not self._has_tasks():
             logger.warning("Tried to execute task, no tasks to execute")
             return
 
-        if not self._current_task and self._tasks:
-            logger.debug(f"No current task, popping task from list of tasks")
+        if not self._current_task and self._has_tasks():
+            logger.debug("No current task, popping task from list of tasks")
             self._current_task = self._pop()
 
         # Calculate the reward for continuing the current task
         current_task_reward = self._calculate_task_reward(self._current_task)
 
-        # Evaluate the reward of switching to the next task
-        next_task: Optional[Task] = self._pop()
+        # Evaluate the reward of switching to the next task, which stays at the front of its bucket unless taken
+        next_task: Optional[Task] = self._peek()
         next_task_reward: float = self._calculate_task_reward(next_task)
 
         # Apply the optimal stopping rule: stick to the current task if it has a higher reward
         if current_task_reward < next_task_reward:
-            logger.info(f"Next task {next_task} has higher reward. Switching from {self._current_task} to {next_task}")
+            logger.info(
+                "Next task {} has higher reward. Switching from {} to {}", next_task, self._current_task, next_task
+            )
+            self._pop()
             self._current_task.increment_interruptions()
             self._add(self._current_task)
             self._current_task = next_task
-        else:
-            self._add(next_task)
 
-        logger.info(f"Executing current task {self._current_task}")
+        logger.info("Executing current task {}", self._current_task)
         self._current_task.execute()
 
         if self._current_task.is_finished():
-            logger.debug(f"Current task {self._current_task} is finished")
+            logger.debug("Current task {} is finished", self._current_task)
             self._current_task = None
@@ -29,14 +29,14 @@ class Eat(Task):
     def execute(self) -> None:
         if self._person.is_satiated():
             self._finished()
-            logger.info(f"{self._person} is satiated")
+            logger.info("{} is satiated", self._person)
             return
 
         if self._person.has_home():
-            logger.debug(f"{self._person} is going to eat at home")
+            logger.debug("{} is going to eat at home", self._person)
             self._handle_home_food_logic()
         else:
-            logger.debug(f"{self._person} is going to eat at barn")
+            logger.debug("{} is going to eat at barn", self._person)
             self._handle_barn_food_logic()
 
     def _handle_home_food_logic(self) -> None:
@@ -44,13 +44,13 @@ class Eat(Task):
 
         if self._home:
             if self._food:
-                logger.debug(f"{self._person} is going to deposit food")
+                logger.debug("{} is going to deposit food", self._person)
                 self._deposit_food_at_home()
             elif not self._home.has_capacity():
-                logger.debug(f"{self._person} is going to eat")
+                logger.debug("{} is going to eat", self._person)
                 self._eat_at_home()
             else:
-                logger.debug(f"{self._person} is going to get food from barn")
+                logger.debug("{} is going to get food from barn", self._person)
                 self._acquire_food_from_barn()
 
     def _deposit_food_at_home(self) -> None:
@@ -61,11 +61,11 @@ class Eat(Task):
     def _eat_at_home(self) -> None:
         self._person.eat(self._home)
         self._finished()
-        logger.info(f"{self._person} has eaten at home")
+        logger.info("{} has eaten at home", self._person)
 
     def _acquire_food_from_barn(self) -> None:
         if not self._barn:
-            logger.debug(f"{self._person} is going to a barn")
+            logger.debug("{} is going to a barn", self._person)
             move_result: MoveResult = self._person.move_to_workable_structure(
                 StructureType.BARN, settings.get("food", "food")
             )
@@ -74,19 +74,19 @@ class Eat(Task):
                 logger.warning("Move result failed")
                 return
             self._barn = move_result.get_structure()
-            logger.debug(f"{self._person} is at barn")
+            logger.debug("{} is at barn", self._person)
 
         if self._barn:
             self._food = self._barn.remove_resource(settings.get("food", "food"), self._home.get_capacity())
-            logger.debug(f"{self._person} took {self._food} food from barn")
+            logger.debug("{} took {} food from barn", self._person, self._food)
             # if the barn has no food, start working a farm to get food
             if self._food <= 0:
                 self._person.work_farm()
-                logger.info(f"{self._person.get_name()} could not get food from barn. Needs to work farm")
+                logger.info("{} could not get food from barn. Needs to work farm", self._person.get_name())
 
     def _handle_barn_food_logic(self) -> None:
         if not self._barn:
-            logger.debug(f"{self._person.get_name()} is going to a barn")
+            logger.debug("{} is going to a barn", self._person.get_name())
             move_result: MoveResult = self._person.move_to_workable_structure(
                 StructureType.BARN, settings.get("food", "food")
             )
@@ -95,16 +95,16 @@ class Eat(Task):
                 logger.warning("Move result failed")
                 return
             self._barn = move_result.get_structure()
-            logger.debug(f"{self._person} is at barn")
+            logger.debug("{} is at barn", self._person)
 
         if self._barn:
             # if the barn is out of food, go work the farm to get some food
             if self._barn.get_resource(settings.get("food", "food")) <= 0:
-                logger.info(f"{self._person.get_name()} could not get food from barn. Needs to work farm")
+                logger.info("{} could not get food from barn. Needs to work farm", self._person.get_name())
                 self._person.work_farm()
             else:
                 self._person.eat(self._barn)
-                logger.info(f"{self._person} has eaten at barn")
+                logger.info("{} has eaten at barn", self._person)
                 self._finished()
 
     @override
@@ -23,7 +23,7 @@ class FindSpouse(Task):
                 if not other.has_spouse() and not other == self._person:
                     self._person.assign_spouse(other)
                     other.assign_spouse(self._person)
-                    logger.info(f"{self._person.get_name()} and {other.get_name()} got married!")
+                    logger.info("{} and {} got married!", self._person.get_name(), other.get_name())
 
                     # make sure they have the same house
                     if self._person.has_home():
@@ -31,11 +31,16 @@ class FindSpouse(Task):
                     else:
                         if other.has_home():
                             self._person.assign_home(other.get_home())
-                    logger.debug(f"{self._person.get_name()} and {other.get_name()} should have the same house: {self._person.get_home() == other.get_home()}")
+                    logger.debug(
+                        "{} and {} should have the same house: {}",
+                        self._person.get_name(),
+                        other.get_name(),
+                        self._person.get_home() == other.get_home(),
+                    )
                     break
         # if you have a spouse, or there are no options, finish the task
         self._finished()
-        logger.info(f"{self._person} finished finding a spouse.")
+        logger.info("{} finished finding a spouse.", self._person)
 
     @override
     def _clean_up_task(self) -> None:
@@ -0,0 +1,218 @@
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from src.settings import settings
+from src.simulation.grid.grid import Grid
+from src.simulation.grid.location import Location
+from src.simulation.grid.structure.structure_type import StructureType
+from src.simulation.people.person.memories import Memories, Memory
+from src.logger import logger
+
+
+class SparseMemories(Memories):
+    """
+    A person's memories, one per location. They sit on top of up to two shared layers: what the person's household
+    knows and what the town knew when the person was born. A memory made here shadows theirs for the same location.
+    Nothing new is written to the town layer, and the household layer only gains what its members move into it, but
+    forget_expired prunes expired memories from both in place, which is the same for everyone since expiry only
+    depends on the time. Reads never prune, they rely on forget_expired having run since the time last moved.
+    """
+
+    def __init__(self, grid: Grid, town: Optional[Memories] = None) -> None:
+        super().__init__(grid)
+
+        self._memories: Dict[Location, Memory] = {}
+        self._locations: Dict[str, Set[Location]] = {}  # memory locations grouped by what was seen there
+
+        # memories grouped by the time they were made; a bucket is dropped once that time has expired
+        self._expiry_buckets: Dict[int, List[Memory]] = {}
+        self._expired_before: int = 0  # every memory made before this time has already been forgotten
+
+        self._household: Optional[SparseMemories] = None
+        self._town: Optional[SparseMemories] = None
+        if isinstance(town, SparseMemories):
+            self._town = town
+        elif town is not None:
+            # only sparse memories can be read as a layer, anything else is copied in
+            self.combine(town)
+
+    def _get_layers(self) -> List["SparseMemories"]:
+        """The shared layers underneath this one, nearest first."""
+        return [layer for layer in (self._household, self._town) if layer is not None]
+
+    def _get_visible(self) -> Dict[Location, Memory]:
+        visible: Dict[Location, Memory] = {}
+        for layer in reversed(self._get_layers()):
+            visible.update(layer._memories)
+        visible.update(self._memories)
+        return visible
+
+    def _lookup(self, where: Location) -> Optional[Memory]:
+        memory = self._memories.get(where)
+        if memory is None:
+            for layer in self._get_layers():
+                memory = layer._memories.get(where)
+                if memory is not None:
+                    break
+        return memory
+
+    def forget_expired(self) -> None:
+        self._forget_expired()
+        for layer in self._get_layers():
+            # expiry only depends on the time, so forgetting in a shared layer is the same for everyone reading it
+            layer._forget_expired()
+
+    def get_memories(self) -> Set[Memory]:
+        return set(self._get_visible().values())
+
+    def get_memory_count(self) -> int:
+        layers = self._get_layers()
+        if not layers:
+            return len(self._memories)
+        return len(self._memories.keys() | set().union(*(layer._memories.keys() for layer in layers)))
+
+    def get_household(self) -> Optional["SparseMemories"]:
+        return self._household
+
+    def join_household(self, household: Memories) -> None:
+        """Read what household knows from now on, in place of any household joined before."""
+        if self._household is household:
+            return
+        if not isinstance(household, SparseMemories):
+            logger.error("Sparse memories can only read a sparse household layer.")
+            raise TypeError("Sparse memories can only read a sparse household layer")
+        self.leave_household()
+        self._household = household
+
+    def leave_household(self) -> None:
+        """Stop reading the household layer, keeping a private copy of everything it taught."""
+        if self._household is None:
+            return
+        household, self._household = self._household, None
+        household._forget_expired()
+        for where, memory in household._memories.items():
+            if where not in self._memories:
+                self._remember(memory)
+
+    def share_with_household(self) -> None:
+        """Move this person's own memories into the household layer, where every member reads them."""
+        if self._household is None:
+            return
+        self._forget_expired()
+        household = self._household
+        for where, memory in self._memories.items():
+            existing_memory = household._memories.get(where)
+            if existing_memory is None or memory.get_when() >= existing_memory.get_when():
+                household._remember(memory)
+        self._memories = {}
+        self._locations = {}
+        self._expiry_buckets = {}
+
+    def _forget_expired(self) -> None:
+        cutoff = self._grid.get_time() - settings.get("memory_expire", 50)  # memories made before this are expired
+        if cutoff <= self._expired_before:
+            return
+
+        times: Iterable[int]
+        if cutoff - self._expired_before > len(self._expiry_buckets):
+            times = [when for when in self._expiry_buckets if when < cutoff]
+        else:
+            times = range(self._expired_before, cutoff)
+        self._expired_before = cutoff
+
+        expired_count = 0
+        for when in times:
+            for memory in self._expiry_buckets.pop(when, ()):
+                # the bucket still holds memories that were replaced since, only forget the current one
+                if self._memories.get(memory.get_where()) is memory:
+                    self._forget(memory)
+                    expired_count += 1
+        if expired_count > 0:
+            logger.debug("{} expired memories removed based on the expiration time.", expired_count)
+
+    def _get_locations(self, char: str) -> Set[Location]:
+        logger.debug("Fetching locations associated with character '{}'.", char)
+        locations = set(self._locations.get(char, ()))
+        above: List[Dict[Location, Memory]] = [self._memories]
+        for layer in self._get_layers():
+            locations.update(
+                where
+                for where in layer._locations.get(char, ())
+                if not any(where in memories for memories in above)
+            )
+            above.append(layer._memories)
+        logger.debug("Found {} locations associated with character '{}'.", len(locations), char)
+
+        return locations
+
+    def combine(self, other: Memories) -> None:
+        logger.debug("Combining memories from another instance into the current one.")
+
+        other_memories = other._get_unshared(self._get_layers())
+        logger.debug("The other memory instance contains {} memories.", len(other_memories))
+
+        # Merge the memories from both 'self' and 'other', keeping the newest memory for each location
+        for memory in other_memories:
+            existing_memory = self._lookup(memory.get_where())
+            if existing_memory:
+                # If an existing memory is found for the same location, compare the timestamps
+                logger.debug(
+                    "Memory conflict detected for location {}. Existing memory timestamp: {}, incoming memory timestamp: {}.", memory.get_where(), existing_memory.get_when(), memory.get_when()
+                )
+                if memory.get_when() > existing_memory.get_when():
+                    # Replace the old memory with the newer one
+                    logger.debug("Incoming memory for location {} is newer. Updating memory.", memory.get_where())
+                    self.add(memory.get_what(), memory.get_where())
+                else:
+                    logger.debug("Existing memory for location {} is newer. No update needed.", memory.get_where())
+            else:
+                # If no memory exists for this location, simply add the new memory
+                logger.debug("No existing memory found for location {}. Adding new memory.", memory.get_where())
+                self._remember(memory)
+
+        logger.debug("Memory combination complete. Total memories after combination: {}.", len(self._memories))
+
+    def _get_unshared(self, shared: Sequence[Memories]) -> List[Memory]:
+        """The memories visible here that don't come from one of the shared layers, which the caller already reads."""
+        memories: List[Memory] = []
+        above: List[Dict[Location, Memory]] = []
+        for layer in [self] + self._get_layers():
+            if not any(layer is shared_layer for shared_layer in shared):
+                memories.extend(
+                    memory
+                    for where, memory in layer._memories.items()
+                    if not any(where in layer_above for layer_above in above)
+                )
+            above.append(layer._memories)
+        return memories
+
+    def add(self, what: str, where: Location) -> None:
+        logger.debug("Adding a new memory with content '{}' at location {}.", what, where)
+
+        if not self._grid.is_in_bounds(where):
+            logger.warning("Tried to add an out of bounds location to memory {}", where)
+            return
+
+        # Validate location and adjust if necessary
+        if self._grid.get_structure_type(where) not in (None, StructureType.TREE):
+            logger.debug("Location {} is neither a tree nor empty. Adjusting location to top-left corner.", where)
+            where = self._grid.find_top_left_corner(where)
+
+        # Create a new memory, replacing any existing memory for the same location
+        current_time = self._grid.get_time()
+        self._remember(Memory(what, where, current_time))
+        logger.debug("New memory added: '{}' at location {} with timestamp {}.", what, where, current_time)
+        logger.debug("Memory successfully added. Total memories: {}.", len(self._memories))
+
+    def _remember(self, memory: Memory) -> None:
+        if memory.get_when() < self._expired_before:
+            return  # already expired, and its bucket would never be checked again
+        existing_memory = self._memories.get(memory.get_where())
+        if existing_memory:
+            self._locations[existing_memory.get_what()].discard(existing_memory.get_where())
+        self._memories[memory.get_where()] = memory
+        self._locations.setdefault(memory.get_what(), set()).add(memory.get_where())
+        self._expiry_buckets.setdefault(memory.get_when(), []).append(memory)
+
+    def _forget(self, memory: Memory) -> None:
+        del self._memories[memory.get_where()]
+        self._locations[memory.get_what()].discard(memory.get_where())
@@ -16,49 +16,52 @@ class Simulation:
         logger.debug("self._time initialized to 0.")
 
         actions_per_day = settings.get("actions_per_day", 5)
-        logger.debug(f"actions_per_day set to {actions_per_day}.")
+        logger.debug("actions_per_day set to {}.", actions_per_day)
 
         days_per_year = settings.get("days_per_year", 365)
-        logger.debug(f"days_per_year set to {days_per_year}.")
+        logger.debug("days_per_year set to {}.", days_per_year)
 
         years = settings.get("years", 50)
-        logger.debug(f"years set to {years}.")
+        logger.debug("years set to {}.", years)
 
         grid_size = settings.get("grid_size", 100)
-        logger.debug(f"grid_size set to {grid_size}.")
+        logger.debug("grid_size set to {}.", grid_size)
 
         self._days_per_year: int = days_per_year
-        logger.debug(f"self._days_per_year initialized to {self._days_per_year}.")
+        logger.debug("self._days_per_year initialized to {}.", self._days_per_year)
 
         self._actions_per_day: int = actions_per_day
-        logger.debug(f"self._actions_per_day initialized to {self._actions_per_day}.")
+        logger.debug("self._actions_per_day initialized to {}.", self._actions_per_day)
 
         self._years: int = years
-        logger.debug(f"self._years initialized to {self._years}.")
+        logger.debug("self._years initialized to {}.", self._years)
 
         self._grid: Grid = Grid(self, grid_size)
-        logger.debug(f"Grid initialized with grid_size {grid_size}.")
+        logger.debug("Grid initialized with grid_size {}.", grid_size)
 
         self._people: People = People(self, actions_per_day)
-        logger.debug(f"People initialized with actions_per_day {actions_per_day}.")
+        logger.debug("People initialized with actions_per_day {}.", actions_per_day)
 
         self._max_days: int = self._years * self._days_per_year
-        logger.debug(f"self._max_days calculated as {self._max_days}.")
+        logger.debug("self._max_days calculated as {}.", self._max_days)
 
     def actions_per_year(self) -> int:
         result = self._days_per_year * self._actions_per_day
         logger.debug(
-            f"Calculating actions_per_year: {self._days_per_year} days/year * {self._actions_per_day} actions/day = {result}."
+            "Calculating actions_per_year: {} days/year * {} actions/day = {}.",
+            self._days_per_year,
+            self._actions_per_day,
+            result,
         )
         return result
 
     def increment_time(self) -> None:
-        logger.debug(f"Incrementing time. Current time: {self._time}.")
+        logger.debug("Incrementing time. Current time: {}.", self._time)
         self._time += 1
-        logger.debug(f"Time incremented. New time: {self._time}.")
+        logger.debug("Time incremented. New time: {}.", self._time)
 
     def get_time(self) -> int:
-        logger.debug(f"Retrieving current time: {self._time}.")
+        logger.debug("Retrieving current time: {}.", self._time)
         return self._time
 
     def run(self) -> Visualizer:
@@ -67,7 +70,7 @@ class Simulation:
 
         for day in range(self._max_days):
             self._day = day
-            logger.info(f"Day {day} begins.")
+            logger.info("Day {} begins.", day)
 
             if len(self._people) == 0:  # all the people dead
                 logger.info("Everybody died! Game over!")
@@ -86,7 +89,7 @@ class Simulation:
             self._people.kill_stuck()
 
             if self._has_been_a_year(day):
-                logger.info(f"Year completed on day {day}. Performing yearly actions.")
+                logger.info("Year completed on day {}. Performing yearly actions.", day)
                 self._people.swap_homes()  # people want to live close to work
                 logger.info("People swapped homes.")
                 
@@ -103,7 +106,7 @@ class Simulation:
                 logger.info("Disasters created for the year.")
 
                 year = self._get_year(day)
-                logger.info(f"Year {year} logged into the visualizer.")
+                logger.info("Year {} logged into the visualizer.", year)
                 visualizer.add(year, self._grid, self._people)
                 
                 # for debugging
@@ -123,7 +126,7 @@ class Simulation:
         logger.debug("Grid data flushed.")
 
     def get_day(self) -> int:
-        logger.debug(f"Retrieving current day: {self._day}.")
+        logger.debug("Retrieving current day: {}.", self._day)
         return self._day
 
     def _create_disasters(self) -> None:
@@ -136,15 +139,16 @@ class Simulation:
     def _has_been_a_year(self, day) -> bool:
         is_year = day % self._days_per_year == 0
         logger.debug(
-            f"Checking if day {day} marks the end of a year. Days per year: {self._days_per_year}. Result: {is_year}."
+            "Checking if day {} marks the end of a year. Days per year: {}. Result: {}.",
+            day,
+            self._days_per_year,
+            is_year,
         )
         return is_year
 
     def _get_year(self, day: int) -> int:
         year = day // self._days_per_year
-        logger.debug(
-            f"Calculating year from day {day}. Days per year: {self._days_per_year}. Year: {year}."
-        )
+        logger.debug("Calculating year from day {}. Days per year: {}. Year: {}.", day, self._days_per_year, year)
         return year
 
     def get_grid(self) -> Grid:
@@ -27,7 +27,7 @@ class GridPlotter:
 
         # Set a fixed salt for consistency
         self._salt = 12345
-        logger.debug(f"Initialized fixed salt value: {self._salt}")
+        logger.debug("Initialized fixed salt value: {}", self._salt)
 
     def _get_color_for_char(self, char: str) -> str:
         if char not in self._color_map:
@@ -40,18 +40,18 @@ class GridPlotter:
             hex_color = colors.to_hex(color_tuple)
 
             # Log the color generation process
-            logger.debug(f"Generated new color for '{char}': {hex_color}")
+            logger.debug("Generated new color for '{}': {}", char, hex_color)
 
             # Store the color for future use
             self._color_map[char] = hex_color
         else:
             # Log when the color is being retrieved from the map
-            logger.debug(f"Retrieved existing color for '{char}': {self._color_map[char]}")
+            logger.debug("Retrieved existing color for '{}': {}", char, self._color_map[char])
 
         return self._color_map[char]
 
     def add(self, year: int, grid: List[List[str]]) -> None:
-        logger.info(f"Adding grid snapshot for year {year}...")
+        logger.info("Adding grid snapshot for year {}...", year)
 
         fig, ax = plt.subplots(
             figsize=(settings.get("fig_size", 8), settings.get("fig_size", 8))
@@ -69,7 +69,7 @@ class GridPlotter:
         ax.set_ylim(num_rows, 0)  # Reverse Y-axis to match typical grid coordinates
         ax.axis("off")  # Turn off axes and labels
 
-        logger.debug(f"Grid size: {num_rows} rows, {num_cols} columns.")
+        logger.debug("Grid size: {} rows, {} columns.", num_rows, num_cols)
         logger.info("Starting to plot each grid element...")
 
         # Plot each grid element with square markers
@@ -85,7 +85,7 @@ class GridPlotter:
 
         # Store the figure for this year
         self._years[year] = fig
-        logger.info(f"Grid snapshot for year {year} added successfully.")
+        logger.info("Grid snapshot for year {} added successfully.", year)
 
 
     def _add_color_key(self, ax) -> None:
@@ -118,7 +118,7 @@ class GridPlotter:
 
         for year, fig in tqdm(self._years.items(), desc="Displaying Slideshow", total=len(self._years)):
             plt.show()
-            logger.info(f"Displayed slide for year {year}.")
+            logger.info("Displayed slide for year {}.", year)
             time.sleep(pause_time)
 
         logger.info("Slideshow completed.")
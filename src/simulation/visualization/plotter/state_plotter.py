@@ -38,9 +38,9 @@ class StatePlotter:
             title, data = state.get_data(state)
 
             # Log state data being added
-            logger.debug(f"Adding data for state: {title}, Year: {year}")
+            logger.debug("Adding data for state: {}, Year: {}", title, year)
             for label, value in data.items():
-                logger.debug(f"  Label: {label}, Value: {value}")
+                logger.debug("  Label: {}, Value: {}", label, value)
 
             # Add data to the _states dictionary
             self._add_state_data(title, year, data)
@@ -53,13 +53,13 @@ class StatePlotter:
         if title not in self._states:
             self._states[title] = {}
             # Log when a new state title is initialized
-            logger.debug(f"Initializing new state category: {title}")
+            logger.debug("Initializing new state category: {}", title)
 
         self._states[title][year] = data
         # Log when state data is added for a specific year
-        logger.debug(f"Added data for state: {title}, Year: {year}")
+        logger.debug("Added data for state: {}, Year: {}", title, year)
         for label, value in data.items():
-            logger.debug(f"  Label: {label}, Value: {value}")
+            logger.debug("  Label: {}, Value: {}", label, value)
 
     def plot(self):
         """
@@ -69,7 +69,7 @@ class StatePlotter:
         logger.debug("Generating plots for each state category.")
         for title, data in self._states.items():
             # Log the plotting of each title
-            logger.debug(f"Plotting data for state: {title} with {len(data)} years of data.")
+            logger.debug("Plotting data for state: {} with {} years of data.", title, len(data))
             self._plot(title, data)
 
     @staticmethod
@@ -82,13 +82,13 @@ class StatePlotter:
                       where each dictionary maps labels (str) to numerical values (int/float).
         """
         # Log the start of the plotting process
-        logger.debug(f"Preparing to plot: {title}")
+        logger.debug("Preparing to plot: {}", title)
 
         # Prepare data for plotting
         years = sorted(lines.keys())
 
         # Log the years being considered
-        logger.debug(f"Years to plot: {years}")
+        logger.debug("Years to plot: {}", years)
 
         # We will store data for each label over time
         labels_data = {}
@@ -104,17 +104,17 @@ class StatePlotter:
                 labels_data[label]["values"].append(value)
 
             # Log the data processed for the current year
-            logger.debug(f"Year {year}: Processed {len(year_data)} labels")
+            logger.debug("Year {}: Processed {} labels", year, len(year_data))
 
         # Log the number of labels being plotted
-        logger.debug(f"Labels to plot: {list(labels_data.keys())}")
+        logger.debug("Labels to plot: {}", list(labels_data.keys()))
 
         # Now plot the lines for each label
         plt.figure(figsize=(10, 6))
 
         for label, data in labels_data.items():
             # Log the plotting of each label
-            logger.debug(f"Plotting label: {label}")
+            logger.debug("Plotting label: {}", label)
             sns.lineplot(x=data["years"], y=data["values"], label=label)
 
         # Add titles and labels
@@ -124,5 +124,5 @@ class StatePlotter:
         plt.legend(title="Labels")
 
         # Show the plot
-        logger.debug(f"Displaying the plot: {title}")
+        logger.debug("Displaying the plot: {}", title)
         plt.show()
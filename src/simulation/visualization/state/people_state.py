@@ -13,7 +13,12 @@ class PeopleState(State):
         self._average_health: float = self._get_average_health()
         self._average_hunger: float = self._get_average_hunger()
 
-        logger.debug(f"Initialized with {self._people_count} people, average health: {self._average_health}, average hunger: {self._average_hunger}.")
+        logger.debug(
+            "Initialized with {} people, average health: {}, average hunger: {}.",
+            self._people_count,
+            self._average_health,
+            self._average_hunger,
+        )
 
         del self._people
 
@@ -22,11 +27,11 @@ class PeopleState(State):
         average_health: float = 0.0
         for person in self._people:
             person_health = person.get_health()
-            logger.debug(f"Person {person.get_name()} has health: {person_health}.")
+            logger.debug("Person {} has health: {}.", person.get_name(), person_health)
             average_health += person_health
         if self._people:
             average_health /= len(self._people)
-        logger.debug(f"Calculated average health: {average_health}.")
+        logger.debug("Calculated average health: {}.", average_health)
         return average_health
 
     def _get_average_hunger(self) -> float:
@@ -34,10 +39,10 @@ class PeopleState(State):
         average_hunger: float = 0.0
         for person in self._people:
             person_hunger = person.get_hunger()
-            logger.debug(f"Person {person.get_name()} has hunger: {person_hunger}.")
+            logger.debug("Person {} has hunger: {}.", person.get_name(), person_hunger)
             average_hunger += person_hunger
         if self._people:
             average_hunger /= len(self._people)
-        logger.debug(f"Calculated average hunger: {average_hunger}.")
+        logger.debug("Calculated average hunger: {}.", average_hunger)
         return average_hunger
 
@@ -19,41 +19,41 @@ class ResourceState(State):
         for barn in grid.get_structures(Barn):
             if isinstance(barn, Barn):
                 self._barns.append(barn)
-                logger.debug(f"Added barn: {barn}")
+                logger.debug("Added barn: {}", barn)
 
         self._total_barn_food: int = self._get_total_barn_food()
-        logger.debug(f"Total food: {self._total_barn_food}")
+        logger.debug("Total food: {}", self._total_barn_food)
 
         self._total_barn_stone: int = self._get_total_barn_stone()
-        logger.debug(f"Total stone: {self._total_barn_stone}")
+        logger.debug("Total stone: {}", self._total_barn_stone)
 
         self._total_barn_wood: int = self._get_total_barn_wood()
-        logger.debug(f"Total wood: {self._total_barn_wood}")
+        logger.debug("Total wood: {}", self._total_barn_wood)
 
         self._total_barn_capacity: int = self._get_total_barn_capacity()
-        logger.debug(f"Total barn capacity: {self._total_barn_capacity}")
+        logger.debug("Total barn capacity: {}", self._total_barn_capacity)
 
         self._total_remaining_barn_capacity: int = self._get_total_remaining_barn_capacity()
-        logger.debug(f"Total remaining capacity: {self._total_remaining_barn_capacity}")
+        logger.debug("Total remaining capacity: {}", self._total_remaining_barn_capacity)
 
         # backpack capacities
         for person in people:
             self._backpacks.append(person.get_backpack())
 
         self._total_backpack_food: int = self._get_total_backpack_food()
-        logger.debug(f"Total food: {self._total_backpack_food}")
+        logger.debug("Total food: {}", self._total_backpack_food)
 
         self._total_backpack_stone: int = self._get_total_backpack_stone()
-        logger.debug(f"Total stone: {self._total_backpack_stone}")
+        logger.debug("Total stone: {}", self._total_backpack_stone)
 
         self._total_backpack_wood: int = self._get_total_backpack_wood()
-        logger.debug(f"Total wood: {self._total_backpack_wood}")
+        logger.debug("Total wood: {}", self._total_backpack_wood)
 
         self._total_backpack_capacity: int = self._get_total_backpack_capacity()
-        logger.debug(f"Total backpack capacity: {self._total_backpack_capacity}")
+        logger.debug("Total backpack capacity: {}", self._total_backpack_capacity)
 
         self._total_remaining_backpack_capacity: int = self._get_total_remaining_backpack_capacity()
-        logger.debug(f"Total remaining capacity: {self._total_remaining_backpack_capacity}")
+        logger.debug("Total remaining capacity: {}", self._total_remaining_backpack_capacity)
 
         del self._backpacks
 
@@ -61,16 +61,16 @@ class ResourceState(State):
         for home in grid.get_structures(Home):
             if isinstance(home, Home):
                 self._homes.append(home)
-                logger.debug(f"Added home: {home}")
+                logger.debug("Added home: {}", home)
 
         self._total_home_food: int = self._get_total_home_food()
-        logger.debug(f"Total food: {self._total_home_food}")
+        logger.debug("Total food: {}", self._total_home_food)
 
         self._total_home_capacity: int = self._get_total_home_capacity()
-        logger.debug(f"Total home capacity: {self._total_home_capacity}")
+        logger.debug("Total home capacity: {}", self._total_home_capacity)
 
         self._total_remaining_home_capacity: int = self._get_total_remaining_home_capacity()
-        logger.debug(f"Total remaining capacity: {self._total_remaining_home_capacity}")
+        logger.debug("Total remaining capacity: {}", self._total_remaining_home_capacity)
 
         del self._homes
 
@@ -80,8 +80,8 @@ class ResourceState(State):
         for barn in self._barns:
             food = barn.get_resource(settings.get("food", "food"))
             total_food += food
-            logger.debug(f"Barn {barn} has {food} food.")
-        logger.debug(f"Total food: {total_food}")
+            logger.debug("Barn {} has {} food.", barn, food)
+        logger.debug("Total food: {}", total_food)
         return total_food
 
     def _get_total_barn_stone(self) -> int:
@@ -90,8 +90,8 @@ class ResourceState(State):
         for barn in self._barns:
             stone = barn.get_resource(settings.get("stone", "stone"))
             total_stone += stone
-            logger.debug(f"Barn {barn} has {stone} stone.")
-        logger.debug(f"Total stone: {total_stone}")
+            logger.debug("Barn {} has {} stone.", barn, stone)
+        logger.debug("Total stone: {}", total_stone)
         return total_stone
 
     def _get_total_barn_wood(self) -> int:
@@ -100,8 +100,8 @@ class ResourceState(State):
         for barn in self._barns:
             wood = barn.get_resource(settings.get("wood", "wood"))
             total_wood += wood
-            logger.debug(f"Barn {barn} has {wood} wood.")
-        logger.debug(f"Total wood: {total_wood}")
+            logger.debug("Barn {} has {} wood.", barn, wood)
+        logger.debug("Total wood: {}", total_wood)
         return total_wood
 
     def _get_total_barn_capacity(self) -> int:
@@ -110,8 +110,8 @@ class ResourceState(State):
         for barn in self._barns:
             capacity = barn.get_capacity()
             total_capacity += capacity
-            logger.debug(f"Barn {barn} has capacity {capacity}.")
-        logger.debug(f"Total barn capacity: {total_capacity}")
+            logger.debug("Barn {} has capacity {}.", barn, capacity)
+        logger.debug("Total barn capacity: {}", total_capacity)
         return total_capacity
 
     def _get_total_remaining_barn_capacity(self) -> int:
@@ -121,9 +121,9 @@ class ResourceState(State):
         for barn in self._barns:
             remaining_capacity = barn.get_remaining_capacity()
             total_remaining_capacity += remaining_capacity
-            logger.debug(f"Barn {barn} has remaining capacity: {remaining_capacity}.")
+            logger.debug("Barn {} has remaining capacity: {}.", barn, remaining_capacity)
 
-        logger.debug(f"Total remaining capacity: {total_remaining_capacity}")
+        logger.debug("Total remaining capacity: {}", total_remaining_capacity)
         return total_remaining_capacity
 
     # backpack
@@ -133,8 +133,8 @@ class ResourceState(State):
         for backpack in self._backpacks:
             food = backpack.get_resource(settings.get("food", "food"))
             total_food += food
-            logger.debug(f"Backpack {backpack} has {food} food.")
-        logger.debug(f"Total food: {total_food}")
+            logger.debug("Backpack {} has {} food.", backpack, food)
+        logger.debug("Total food: {}", total_food)
         return total_food
 
     def _get_total_backpack_stone(self) -> int:
@@ -143,8 +143,8 @@ class ResourceState(State):
         for backpack in self._backpacks:
             stone = backpack.get_resource(settings.get("stone", "stone"))
             total_stone += stone
-            logger.debug(f"Backpack {backpack} has {stone} stone.")
-        logger.debug(f"Total stone: {total_stone}")
+            logger.debug("Backpack {} has {} stone.", backpack, stone)
+        logger.debug("Total stone: {}", total_stone)
         return total_stone
 
     def _get_total_backpack_wood(self) -> int:
@@ -153,8 +153,8 @@ class ResourceState(State):
         for backpack in self._backpacks:
             wood = backpack.get_resource(settings.get("wood", "wood"))
             total_wood += wood
-            logger.debug(f"Backpack {backpack} has {wood} wood.")
-        logger.debug(f"Total wood: {total_wood}")
+            logger.debug("Backpack {} has {} wood.", backpack, wood)
+        logger.debug("Total wood: {}", total_wood)
         return total_wood
 
     def _get_total_backpack_capacity(self) -> int:
@@ -163,8 +163,8 @@ class ResourceState(State):
         for backpack in self._backpacks:
             capacity = backpack.get_capacity()
             total_capacity += capacity
-            logger.debug(f"Backpack {backpack} has capacity {capacity}.")
-        logger.debug(f"Total backpack capacity: {total_capacity}")
+            logger.debug("Backpack {} has capacity {}.", backpack, capacity)
+        logger.debug("Total backpack capacity: {}", total_capacity)
         return total_capacity
 
     def _get_total_remaining_backpack_capacity(self) -> int:
@@ -174,9 +174,9 @@ class ResourceState(State):
         for backpack in self._backpacks:
             remaining_capacity = backpack.get_remaining_capacity()
             total_remaining_capacity += remaining_capacity
-            logger.debug(f"Backpack {backpack} has remaining capacity: {remaining_capacity}.")
+            logger.debug("Backpack {} has remaining capacity: {}.", backpack, remaining_capacity)
 
-        logger.debug(f"Total remaining capacity: {total_remaining_capacity}")
+        logger.debug("Total remaining capacity: {}", total_remaining_capacity)
         return total_remaining_capacity
 
     # home
@@ -186,8 +186,8 @@ class ResourceState(State):
         for home in self._homes:
             food = home.get_resource(settings.get("food", "food"))
             total_food += food
-            logger.debug(f"Home {home} has {food} food.")
-        logger.debug(f"Total food: {total_food}")
+            logger.debug("Home {} has {} food.", home, food)
+        logger.debug("Total food: {}", total_food)
         return total_food
 
 
@@ -198,8 +198,8 @@ class ResourceState(State):
         for home in self._homes:
             capacity = home.get_capacity()
             total_capacity += capacity
-            logger.debug(f"Home {home} has capacity {capacity}.")
-        logger.debug(f"Total home capacity: {total_capacity}")
+            logger.debug("Home {} has capacity {}.", home, capacity)
+        logger.debug("Total home capacity: {}", total_capacity)
         return total_capacity
 
     def _get_total_remaining_home_capacity(self) -> int:
@@ -209,8 +209,8 @@ class ResourceState(State):
         for home in self._homes:
             remaining_capacity = home.get_remaining_capacity()
             total_remaining_capacity += remaining_capacity
-            logger.debug(f"Home {home} has remaining capacity: {remaining_capacity}.")
+            logger.debug("Home {} has remaining capacity: {}.", home, remaining_capacity)
 
-        logger.debug(f"Total remaining capacity: {total_remaining_capacity}")
+        logger.debug("Total remaining capacity: {}", total_remaining_capacity)
         return total_remaining_capacity
 
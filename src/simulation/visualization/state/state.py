@@ -12,12 +12,12 @@ class State(ABC):
         Returns the data dictionary with labels formatted and mapped to their corresponding values.
         Subclasses should implement this method to specify the class-specific title and attributes.
         """
-        logger.debug(f"Getting data for state: {self.__class__.__name__}")
+        logger.debug("Getting data for state: {}", self.__class__.__name__)
         title = self.get_title()  # Get the title dynamically using each subclass's title
-        logger.debug(f"Title obtained: {title}")
+        logger.debug("Title obtained: {}", title)
 
         data = self._data_generator(child)  # Use the common data generation logic
-        logger.debug(f"Generated data: {data}")
+        logger.debug("Generated data: {}", data)
 
         return title, data
 
@@ -32,11 +32,11 @@ class State(ABC):
         for attr_name, value in vars(child).items():
             # Generate a human-readable label
             label = self._format_label(attr_name)
-            logger.debug(f"Adding attribute: {label} with value: {value}")
+            logger.debug("Adding attribute: {} with value: {}", label, value)
             # Add to the data dictionary
             data[label] = value
 
-        logger.debug(f"Final generated data dictionary: {data}")
+        logger.debug("Final generated data dictionary: {}", data)
         return data
 
     @staticmethod
@@ -47,9 +47,9 @@ class State(ABC):
         - Capitalize each word
         - Join with spaces
         """
-        logger.debug(f"Formatting label for field name: {field_name}")
+        logger.debug("Formatting label for field name: {}", field_name)
         formatted_label = " ".join(word.capitalize() for word in field_name.split("_"))
-        logger.debug(f"Formatted label: {formatted_label}")
+        logger.debug("Formatted label: {}", formatted_label)
         return formatted_label
 
     def get_title(self) -> str:
@@ -60,13 +60,13 @@ class State(ABC):
         - Join the words with spaces
         """
         class_name = self.__class__.__name__
-        logger.debug(f"Generating title from class name: {class_name}")
+        logger.debug("Generating title from class name: {}", class_name)
 
         # Split class name at uppercase letters to handle camelCase format
         words = re.sub("([a-z])([A-Z])", r"\1 \2", class_name).split()
 
         # Replace 'State' with 'Stats' and join the words with spaces
         title = " ".join(words).replace("State", "Stats")
-        logger.debug(f"Generated title: {title}")
+        logger.debug("Generated title: {}", title)
 
         return title
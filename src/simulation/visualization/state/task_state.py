@@ -36,114 +36,130 @@ class TaskState(State):
         logger.debug("Calculating average task counts.")
 
         self._average_complete_task_count: float = self._get_average_complete_task_count()
-        logger.debug(f"Average complete task count: {self._average_complete_task_count}")
+        logger.debug("Average complete task count: {}", self._average_complete_task_count)
 
         self._average_active_task_count: float = self._get_average_active_task_count()
-        logger.debug(f"Average active task count: {self._average_active_task_count}")
+        logger.debug("Average active task count: {}", self._average_active_task_count)
 
         self._average_active_build_barn_task_count: float = self._get_average_active_build_barn_task_count()
-        logger.debug(f"Average active build barn task count: {self._average_active_build_barn_task_count}")
+        logger.debug("Average active build barn task count: {}", self._average_active_build_barn_task_count)
 
         self._average_complete_build_barn_task_count: float = self._get_average_complete_build_barn_task_count()
-        logger.debug(f"Average complete build barn task count: {self._average_complete_build_barn_task_count}")
+        logger.debug("Average complete build barn task count: {}", self._average_complete_build_barn_task_count)
 
         self._average_active_build_farm_task_count: float = self._get_average_active_build_farm_task_count()
-        logger.debug(f"Average active build farm task count: {self._average_active_build_farm_task_count}")
+        logger.debug("Average active build farm task count: {}", self._average_active_build_farm_task_count)
 
         self._average_complete_build_farm_task_count: float = self._get_average_complete_build_farm_task_count()
-        logger.debug(f"Average complete build farm task count: {self._average_complete_build_farm_task_count}")
+        logger.debug("Average complete build farm task count: {}", self._average_complete_build_farm_task_count)
 
         self._average_active_build_home_task_count: float = self._get_average_active_build_home_task_count()
-        logger.debug(f"Average active build home task count: {self._average_active_build_home_task_count}")
+        logger.debug("Average active build home task count: {}", self._average_active_build_home_task_count)
 
         self._average_complete_build_home_task_count: float = self._get_average_complete_build_home_task_count()
-        logger.debug(f"Average complete build home task count: {self._average_complete_build_home_task_count}")
+        logger.debug("Average complete build home task count: {}", self._average_complete_build_home_task_count)
 
         self._average_active_build_mine_task_count: float = self._get_average_active_build_mine_task_count()
-        logger.debug(f"Average active build mine task count: {self._average_active_build_mine_task_count}")
+        logger.debug("Average active build mine task count: {}", self._average_active_build_mine_task_count)
 
         self._average_complete_build_mine_task_count: float = self._get_average_complete_build_mine_task_count()
-        logger.debug(f"Average complete build mine task count: {self._average_complete_build_mine_task_count}")
+        logger.debug("Average complete build mine task count: {}", self._average_complete_build_mine_task_count)
 
         self._average_active_chop_tree_task_count: float = self._get_average_active_chop_tree_task_count()
-        logger.debug(f"Average active chop tree task count: {self._average_active_chop_tree_task_count}")
+        logger.debug("Average active chop tree task count: {}", self._average_active_chop_tree_task_count)
 
         self._average_complete_chop_tree_task_count: float = self._get_average_complete_chop_tree_task_count()
-        logger.debug(f"Average complete chop tree task count: {self._average_complete_chop_tree_task_count}")
+        logger.debug("Average complete chop tree task count: {}", self._average_complete_chop_tree_task_count)
 
         self._average_active_eat_task_count: float = self._get_average_active_eat_task_count()
-        logger.debug(f"Average active eat task count: {self._average_active_eat_task_count}")
+        logger.debug("Average active eat task count: {}", self._average_active_eat_task_count)
 
         self._average_complete_eat_task_count: float = self._get_average_complete_eat_task_count()
-        logger.debug(f"Average complete eat task count: {self._average_complete_eat_task_count}")
+        logger.debug("Average complete eat task count: {}", self._average_complete_eat_task_count)
 
         self._average_active_explore_task_count: float = self._get_average_active_explore_task_count()
-        logger.debug(f"Average active explore task count: {self._average_active_explore_task_count}")
+        logger.debug("Average active explore task count: {}", self._average_active_explore_task_count)
 
         self._average_complete_explore_task_count: float = self._get_average_complete_explore_task_count()
-        logger.debug(f"Average complete explore task count: {self._average_complete_explore_task_count}")
+        logger.debug("Average complete explore task count: {}", self._average_complete_explore_task_count)
 
         self._average_active_find_home_task_count: float = self._get_average_active_find_home_task_count()
-        logger.debug(f"Average active find home task count: {self._average_active_find_home_task_count}")
+        logger.debug("Average active find home task count: {}", self._average_active_find_home_task_count)
 
         self._average_complete_find_home_task_count: float = self._get_average_complete_find_home_task_count()
-        logger.debug(f"Average complete find home task count: {self._average_complete_find_home_task_count}")
+        logger.debug("Average complete find home task count: {}", self._average_complete_find_home_task_count)
 
         self._average_active_find_spouse_task_count: float = self._get_average_active_find_spouse_task_count()
-        logger.debug(f"Average active find spouse task count: {self._average_active_find_spouse_task_count}")
+        logger.debug("Average active find spouse task count: {}", self._average_active_find_spouse_task_count)
 
         self._average_complete_find_spouse_task_count: float = self._get_average_complete_find_spouse_task_count()
-        logger.debug(f"Average complete find spouse task count: {self._average_complete_find_spouse_task_count}")
+        logger.debug("Average complete find spouse task count: {}", self._average_complete_find_spouse_task_count)
 
         self._average_active_start_barn_construction_task_count: float = self._get_average_active_start_barn_construction_task_count()
         logger.debug(
-            f"Average active start barn construction task count: {self._average_active_start_barn_construction_task_count}")
+            "Average active start barn construction task count: {}",
+            self._average_active_start_barn_construction_task_count,
+        )
 
         self._average_complete_start_barn_construction_task_count: float = self._get_average_complete_start_barn_construction_task_count()
         logger.debug(
-            f"Average complete start barn construction task count: {self._average_complete_start_barn_construction_task_count}")
+            "Average complete start barn construction task count: {}",
+            self._average_complete_start_barn_construction_task_count,
+        )
 
         self._average_active_start_farm_construction_task_count: float = self._get_average_active_start_farm_construction_task_count()
         logger.debug(
-            f"Average active start farm construction task count: {self._average_active_start_farm_construction_task_count}")
+            "Average active start farm construction task count: {}",
+            self._average_active_start_farm_construction_task_count,
+        )
 
         self._average_complete_start_farm_construction_task_count: float = self._get_average_complete_start_farm_construction_task_count()
         logger.debug(
-            f"Average complete start farm construction task count: {self._average_complete_start_farm_construction_task_count}")
+            "Average complete start farm construction task count: {}",
+            self._average_complete_start_farm_construction_task_count,
+        )
 
         self._average_active_start_home_construction_task_count: float = self._get_average_active_start_home_construction_task_count()
         logger.debug(
-            f"Average active start home construction task count: {self._average_active_start_home_construction_task_count}")
+            "Average active start home construction task count: {}",
+            self._average_active_start_home_construction_task_count,
+        )
 
         self._average_complete_start_home_construction_task_count: float = self._get_average_complete_start_home_construction_task_count()
         logger.debug(
-            f"Average complete start home construction task count: {self._average_complete_start_home_construction_task_count}")
+            "Average complete start home construction task count: {}",
+            self._average_complete_start_home_construction_task_count,
+        )
 
         self._average_active_start_mine_construction_task_count: float = self._get_average_active_start_mine_construction_task_count()
         logger.debug(
-            f"Average active start mine construction task count: {self._average_active_start_mine_construction_task_count}")
+            "Average active start mine construction task count: {}",
+            self._average_active_start_mine_construction_task_count,
+        )
 
         self._average_complete_start_mine_construction_task_count: float = self._get_average_complete_start_mine_construction_task_count()
         logger.debug(
-            f"Average complete start mine construction task count: {self._average_complete_start_mine_construction_task_count}")
+            "Average complete start mine construction task count: {}",
+            self._average_complete_start_mine_construction_task_count,
+        )
 
         self._average_active_work_farm_task_count: float = self._get_average_active_work_farm_task_count()
-        logger.debug(f"Average active work farm task count: {self._average_active_work_farm_task_count}")
+        logger.debug("Average active work farm task count: {}", self._average_active_work_farm_task_count)
 
         self._average_complete_work_farm_task_count: float = self._get_average_complete_work_farm_task_count()
-        logger.debug(f"Average complete work farm task count: {self._average_complete_work_farm_task_count}")
+        logger.debug("Average complete work farm task count: {}", self._average_complete_work_farm_task_count)
 
         self._average_active_work_mine_task_count: float = self._get_average_active_work_mine_task_count()
-        logger.debug(f"Average active work mine task count: {self._average_active_work_mine_task_count}")
+        logger.debug("Average active work mine task count: {}", self._average_active_work_mine_task_count)
 
         self._average_complete_work_mine_task_count: float = self._get_average_complete_work_mine_task_count()
-        logger.debug(f"Average complete work mine task count: {self._average_complete_work_mine_task_count}")
+        logger.debug("Average complete work mine task count: {}", self._average_complete_work_mine_task_count)
 
         self._average_active_transport_task_count: float = self._get_average_active_transport_task_count()
-        logger.debug(f"Average active transport task count: {self._average_active_transport_task_count}")
+        logger.debug("Average active transport task count: {}", self._average_active_transport_task_count)
 
         self._average_complete_transport_task_count: float = self._get_average_complete_transport_task_count()
-        logger.debug(f"Average complete transport task count: {self._average_complete_transport_task_count}")
+        logger.debug("Average complete transport task count: {}", self._average_complete_transport_task_count)
 
         # Log cleanup
         logger.debug("Cleaning up by deleting people object.")
@@ -155,24 +171,27 @@ class TaskState(State):
         total_count = 0.0
         for person in self._people:
             count = sum(1 for task in person.get_scheduler().get_this_years_tasks() if task_predicate(task))
-            logger.debug(f"Person {person.get_name()} has {count} tasks matching the predicate.")
+            logger.debug("Person {} has {} tasks matching the predicate.", person.get_name(), count)
             total_count += count
         average = total_count / len(self._people) if self._people else 0.0
         logger.debug(
-            f"Total matching tasks: {total_count}. Number of people: {len(self._people) if self._people else 0}. Average: {average}."
+            "Total matching tasks: {}. Number of people: {}. Average: {}.",
+            total_count,
+            len(self._people) if self._people else 0,
+            average,
         )
         return average
 
     def _get_average_complete_task_count(self) -> float:
         logger.debug("Calculating average complete task count.")
         average = self._get_average_task_count_with_predicate(lambda task: task.is_finished())
-        logger.debug(f"Average complete task count: {average}")
+        logger.debug("Average complete task count: {}", average)
         return average
 
     def _get_average_active_task_count(self) -> float:
         logger.debug("Calculating average active task count.")
         average = self._get_average_task_count_with_predicate(lambda task: not task.is_finished())
-        logger.debug(f"Average active task count: {average}")
+        logger.debug("Average active task count: {}", average)
         return average
 
     def _get_average_active_build_barn_task_count(self) -> float:
@@ -180,7 +199,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, BuildBarn) and not task.is_finished()
         )
-        logger.debug(f"Average active build barn task count: {average}")
+        logger.debug("Average active build barn task count: {}", average)
         return average
 
     def _get_average_complete_build_barn_task_count(self) -> float:
@@ -188,7 +207,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, BuildBarn) and task.is_finished()
         )
-        logger.debug(f"Average complete build barn task count: {average}")
+        logger.debug("Average complete build barn task count: {}", average)
         return average
 
     def _get_average_active_build_farm_task_count(self) -> float:
@@ -196,7 +215,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, BuildFarm) and not task.is_finished()
         )
-        logger.debug(f"Average active build farm task count: {average}")
+        logger.debug("Average active build farm task count: {}", average)
         return average
 
     def _get_average_complete_build_farm_task_count(self) -> float:
@@ -204,7 +223,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, BuildFarm) and task.is_finished()
         )
-        logger.debug(f"Average complete build farm task count: {average}")
+        logger.debug("Average complete build farm task count: {}", average)
         return average
 
     def _get_average_active_build_home_task_count(self) -> float:
@@ -212,7 +231,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, BuildHome) and not task.is_finished()
         )
-        logger.debug(f"Average active build home task count: {average}")
+        logger.debug("Average active build home task count: {}", average)
         return average
 
     def _get_average_complete_build_home_task_count(self) -> float:
@@ -220,7 +239,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, BuildHome) and task.is_finished()
         )
-        logger.debug(f"Average complete build home task count: {average}")
+        logger.debug("Average complete build home task count: {}", average)
         return average
 
     def _get_average_active_build_mine_task_count(self) -> float:
@@ -228,7 +247,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, BuildMine) and not task.is_finished()
         )
-        logger.debug(f"Average active build mine task count: {average}")
+        logger.debug("Average active build mine task count: {}", average)
         return average
 
     def _get_average_complete_build_mine_task_count(self) -> float:
@@ -236,7 +255,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, BuildMine) and task.is_finished()
         )
-        logger.debug(f"Average complete build mine task count: {average}")
+        logger.debug("Average complete build mine task count: {}", average)
         return average
 
     def _get_average_active_chop_tree_task_count(self) -> float:
@@ -244,7 +263,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, ChopTree) and not task.is_finished()
         )
-        logger.debug(f"Average active chop tree task count: {average}")
+        logger.debug("Average active chop tree task count: {}", average)
         return average
 
     def _get_average_complete_chop_tree_task_count(self) -> float:
@@ -252,7 +271,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, ChopTree) and task.is_finished()
         )
-        logger.debug(f"Average complete chop tree task count: {average}")
+        logger.debug("Average complete chop tree task count: {}", average)
         return average
 
     def _get_average_active_eat_task_count(self) -> float:
@@ -260,7 +279,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, Eat) and not task.is_finished()
         )
-        logger.debug(f"Average active eat task count: {average}")
+        logger.debug("Average active eat task count: {}", average)
         return average
 
     def _get_average_complete_eat_task_count(self) -> float:
@@ -268,7 +287,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, Eat) and task.is_finished()
         )
-        logger.debug(f"Average complete eat task count: {average}")
+        logger.debug("Average complete eat task count: {}", average)
         return average
 
     def _get_average_active_explore_task_count(self) -> float:
@@ -276,7 +295,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, Explore) and not task.is_finished()
         )
-        logger.debug(f"Average active explore task count: {average}")
+        logger.debug("Average active explore task count: {}", average)
         return average
 
     def _get_average_complete_explore_task_count(self) -> float:
@@ -284,7 +303,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, Explore) and task.is_finished()
         )
-        logger.debug(f"Average complete explore task count: {average}")
+        logger.debug("Average complete explore task count: {}", average)
         return average
 
     def _get_average_active_find_home_task_count(self) -> float:
@@ -292,7 +311,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, FindHome) and not task.is_finished()
         )
-        logger.debug(f"Average active find home task count: {average}")
+        logger.debug("Average active find home task count: {}", average)
         return average
 
     def _get_average_complete_find_home_task_count(self) -> float:
@@ -300,7 +319,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, FindHome) and task.is_finished()
         )
-        logger.debug(f"Average complete find home task count: {average}")
+        logger.debug("Average complete find home task count: {}", average)
         return average
 
     def _get_average_active_find_spouse_task_count(self) -> float:
@@ -308,7 +327,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, FindSpouse) and not task.is_finished()
         )
-        logger.debug(f"Average active find spouse task count: {average}")
+        logger.debug("Average active find spouse task count: {}", average)
         return average
 
     def _get_average_complete_find_spouse_task_count(self) -> float:
@@ -316,7 +335,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, FindSpouse) and task.is_finished()
         )
-        logger.debug(f"Average complete find spouse task count: {average}")
+        logger.debug("Average complete find spouse task count: {}", average)
         return average
 
     def _get_average_active_start_barn_construction_task_count(self) -> float:
@@ -324,7 +343,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, StartBarnConstruction) and not task.is_finished()
         )
-        logger.debug(f"Average active start barn construction task count: {average}")
+        logger.debug("Average active start barn construction task count: {}", average)
         return average
 
     def _get_average_complete_start_barn_construction_task_count(self) -> float:
@@ -332,7 +351,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, StartBarnConstruction) and task.is_finished()
         )
-        logger.debug(f"Average complete start barn construction task count: {average}")
+        logger.debug("Average complete start barn construction task count: {}", average)
         return average
 
     def _get_average_active_start_farm_construction_task_count(self) -> float:
@@ -340,7 +359,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, StartFarmConstruction) and not task.is_finished()
         )
-        logger.debug(f"Average active start farm construction task count: {average}")
+        logger.debug("Average active start farm construction task count: {}", average)
         return average
 
     def _get_average_complete_start_farm_construction_task_count(self) -> float:
@@ -348,7 +367,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, StartFarmConstruction) and task.is_finished()
         )
-        logger.debug(f"Average complete start farm construction task count: {average}")
+        logger.debug("Average complete start farm construction task count: {}", average)
         return average
 
     def _get_average_active_start_home_construction_task_count(self) -> float:
@@ -356,7 +375,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, StartHomeConstruction) and not task.is_finished()
         )
-        logger.debug(f"Average active start home construction task count: {average}")
+        logger.debug("Average active start home construction task count: {}", average)
         return average
 
     def _get_average_complete_start_home_construction_task_count(self) -> float:
@@ -364,7 +383,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, StartHomeConstruction) and task.is_finished()
         )
-        logger.debug(f"Average complete start home construction task count: {average}")
+        logger.debug("Average complete start home construction task count: {}", average)
         return average
 
     def _get_average_active_start_mine_construction_task_count(self) -> float:
@@ -372,7 +391,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, StartMineConstruction) and not task.is_finished()
         )
-        logger.debug(f"Average active start mine construction task count: {average}")
+        logger.debug("Average active start mine construction task count: {}", average)
         return average
 
     def _get_average_complete_start_mine_construction_task_count(self) -> float:
@@ -380,7 +399,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, StartMineConstruction) and task.is_finished()
         )
-        logger.debug(f"Average complete start mine construction task count: {average}")
+        logger.debug("Average complete start mine construction task count: {}", average)
         return average
 
     def _get_average_active_work_farm_task_count(self) -> float:
@@ -388,7 +407,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, WorkFarm) and not task.is_finished()
         )
-        logger.debug(f"Average active work farm task count: {average}")
+        logger.debug("Average active work farm task count: {}", average)
         return average
 
     def _get_average_complete_work_farm_task_count(self) -> float:
@@ -396,7 +415,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, WorkFarm) and task.is_finished()
         )
-        logger.debug(f"Average complete work farm task count: {average}")
+        logger.debug("Average complete work farm task count: {}", average)
         return average
 
     def _get_average_active_work_mine_task_count(self) -> float:
@@ -404,7 +423,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, WorkMine) and not task.is_finished()
         )
-        logger.debug(f"Average active work mine task count: {average}")
+        logger.debug("Average active work mine task count: {}", average)
         return average
 
     def _get_average_complete_work_mine_task_count(self) -> float:
@@ -412,7 +431,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, WorkMine) and task.is_finished()
         )
-        logger.debug(f"Average complete work mine task count: {average}")
+        logger.debug("Average complete work mine task count: {}", average)
         return average
 
     def _get_average_active_transport_task_count(self) -> float:
@@ -420,7 +439,7 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, Transport) and not task.is_finished()
         )
-        logger.debug(f"Average active transport task count: {average}")
+        logger.debug("Average active transport task count: {}", average)
         return average
 
     def _get_average_complete_transport_task_count(self) -> float:
@@ -428,6 +447,6 @@ class TaskState(State):
         average = self._get_average_task_count_with_predicate(
             lambda task: isinstance(task, Transport) and task.is_finished()
         )
-        logger.debug(f"Average complete transport task count: {average}")
+        logger.debug("Average complete transport task count: {}", average)
         return average
 
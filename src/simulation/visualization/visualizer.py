@@ -22,7 +22,7 @@ class Visualizer:
         self._state_plotter.plot()
 
     def add(self, year: int, grid: Grid, people: People):
-        logger.debug(f"Adding data for year {year} to GridPlotter and StatePlotter.")
+        logger.debug("Adding data for year {} to GridPlotter and StatePlotter.", year)
         logger.debug("Adding grid data to GridPlotter.")
         self._grid_plotter.add(year, grid.get_grid())
         logger.debug("Adding grid and people data to StatePlotter.")
@@ -0,0 +1,14 @@
+import os
+import sys
+from pathlib import Path
+
+# settings load at import time from ../settings/<env>_settings.yaml, relative to the working directory, and
+# the environment comes from the command line, so point both at the checked-in example dev settings
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT / "src")
+sys.argv = [sys.argv[0], "--settings", "example.dev"]
+
+from src.logger import logger  # noqa: E402
+
+logger.set_level("WARNING")
@@ -0,0 +1,75 @@
+from typing import List
+
+from src.simulation.grid.grid import Grid
+from src.simulation.grid.location import Location
+from src.simulation.people.person.dense_memories import DenseMemories
+from src.simulation.people.person.sparse_memories import SparseMemories
+
+
+class _Clock:
+    """Stands in for the simulation, which the grid only asks for the time and day."""
+
+    def __init__(self) -> None:
+        self.time: int = 1
+
+    def get_time(self) -> int:
+        return self.time
+
+    def get_day(self) -> int:
+        return 0
+
+
+def _make_grid() -> Grid:
+    return Grid(_Clock(), 40)
+
+
+def _find(grid: Grid, char: str) -> List[Location]:
+    return [
+        Location(x, y)
+        for y in range(grid.get_height())
+        for x in range(grid.get_width())
+        if grid.get_char(Location(x, y)) == char
+    ]
+
+
+def test_sparse_learns_from_dense() -> None:
+    grid = _make_grid()
+    tree, empty = _find(grid, "*")[0], _find(grid, " ")[0]
+    sparse = SparseMemories(grid)
+    sparse.add(" ", empty)
+    dense = DenseMemories(grid)
+    dense.add("*", tree)
+
+    sparse.combine(dense)
+
+    assert sparse.get_tree_locations() == {tree}
+    assert sparse.get_empty_locations() == {empty}
+
+
+def test_sparse_in_a_household_learns_from_dense() -> None:
+    grid = _make_grid()
+    tree = _find(grid, "*")[0]
+    sparse = SparseMemories(grid)
+    sparse.join_household(SparseMemories(grid))
+    dense = DenseMemories(grid)
+    dense.add("*", tree)
+
+    sparse.combine(dense)
+
+    assert sparse.get_tree_locations() == {tree}
+
+
+def test_dense_learns_from_sparse() -> None:
+    grid = _make_grid()
+    tree, empty = _find(grid, "*")[0], _find(grid, " ")[0]
+    household = SparseMemories(grid)
+    household.add("*", tree)
+    sparse = SparseMemories(grid)
+    sparse.join_household(household)
+    sparse.add(" ", empty)
+    dense = DenseMemories(grid)
+
+    dense.combine(sparse)
+
+    assert dense.get_tree_locations() == {tree}
+    assert dense.get_empty_locations() == {empty}
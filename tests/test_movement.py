@@ -0,0 +1,39 @@
+import pytest
+
+from src.simulation.grid.grid import Grid
+from src.simulation.grid.location import Location
+from src.simulation.grid.structure.structure_type import StructureType
+from src.simulation.people.person.person import Person
+from src.simulation.simulation import Simulation
+
+
+def _find_home_site(grid: Grid) -> Location:
+    """An empty 2x2 region near town with walkable cells above it, so a home there can be stepped off."""
+    for spot in grid.get_empty_spots_near_town():
+        if grid.region_matches(spot, 2, 2, [" "]) and grid.region_matches(spot.offset(-1, -1), 4, 1, [" ", "*"]):
+            return spot
+    pytest.skip("The generated grid has no room for a home.")
+
+
+def test_person_steps_off_a_construction_that_finished_under_them() -> None:
+    simulation = Simulation()
+    grid = simulation.get_grid()
+    person: Person = next(iter(simulation.get_people()))
+
+    site = _find_home_site(grid)
+    person.set_location(site)
+    grid.start_building_construction(StructureType.CONSTRUCTION_HOME, site)
+    grid.add_completed_construction(grid.get_structure(site))
+    grid.turn_completed_constructions_to_buildings()
+    assert grid.is_home(site)
+    assert not person.is_stuck()
+
+    target = next(spot for spot in grid.get_empty_spots_near_town() if site.distance_to(spot) > 3)
+
+    # a shared flow field leads off the home too
+    next_step = grid.get_flow_field(target).next_step(site)
+    assert next_step is not None and site.is_one_away(next_step)
+    assert grid.get_path_costs()[next_step.y, next_step.x] > 0
+
+    person.go_to_location(target)
+    assert not grid.is_home(person.get_location())